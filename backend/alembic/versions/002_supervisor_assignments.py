@@ -0,0 +1,36 @@
+"""Add supervisor_assignments table
+
+Revision ID: 002_supervisor_assignments
+Revises: 001_initial
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_supervisor_assignments'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'supervisor_assignments',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('project_id', sa.Integer(), sa.ForeignKey('projects.id'), nullable=False),
+        sa.Column('team_id', sa.Integer(), sa.ForeignKey('teams.id'), nullable=False, unique=True),
+        sa.Column('supervisor_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('assigned_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_supervisor_assignments_id', 'supervisor_assignments', ['id'])
+    op.create_index('ix_supervisor_assignments_project_id', 'supervisor_assignments', ['project_id'])
+    op.create_index('ix_supervisor_assignments_supervisor_id', 'supervisor_assignments', ['supervisor_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_supervisor_assignments_supervisor_id', table_name='supervisor_assignments')
+    op.drop_index('ix_supervisor_assignments_project_id', table_name='supervisor_assignments')
+    op.drop_index('ix_supervisor_assignments_id', table_name='supervisor_assignments')
+    op.drop_table('supervisor_assignments')
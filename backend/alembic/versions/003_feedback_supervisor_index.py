@@ -0,0 +1,22 @@
+"""Index submission_feedbacks.supervisor_id
+
+Revision ID: 003_feedback_supervisor_index
+Revises: 002_supervisor_assignments
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003_feedback_supervisor_index'
+down_revision = '002_supervisor_assignments'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_submission_feedbacks_supervisor_id', 'submission_feedbacks', ['supervisor_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_submission_feedbacks_supervisor_id', table_name='submission_feedbacks')
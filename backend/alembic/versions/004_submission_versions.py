@@ -0,0 +1,48 @@
+"""Add submission version history and latest-version index
+
+Revision ID: 004_submission_versions
+Revises: 003_feedback_supervisor_index
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_submission_versions'
+down_revision = '003_feedback_supervisor_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('submissions', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('submissions', sa.Column('is_latest', sa.Boolean(), nullable=False, server_default=sa.text('true')))
+    
+    # Number existing rows per (team_id, stage) by submission time and flag the newest
+    op.execute("""
+        UPDATE submissions s
+        SET version = v.version,
+            is_latest = (v.version = v.total)
+        FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (PARTITION BY team_id, stage ORDER BY submitted_at, id) AS version,
+                   COUNT(*) OVER (PARTITION BY team_id, stage) AS total
+            FROM submissions
+        ) v
+        WHERE s.id = v.id
+    """)
+    
+    op.create_unique_constraint('uq_submissions_team_stage_version', 'submissions', ['team_id', 'stage', 'version'])
+    op.create_index(
+        'uq_submissions_team_stage_latest', 'submissions', ['team_id', 'stage'],
+        unique=True,
+        postgresql_where=sa.text('is_latest')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_submissions_team_stage_latest', table_name='submissions')
+    op.drop_constraint('uq_submissions_team_stage_version', 'submissions', type_='unique')
+    op.drop_column('submissions', 'is_latest')
+    op.drop_column('submissions', 'version')
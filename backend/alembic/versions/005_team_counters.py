@@ -0,0 +1,42 @@
+"""Add membership and invitation counters to teams
+
+Revision ID: 005_team_counters
+Revises: 004_submission_versions
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_team_counters'
+down_revision = '004_submission_versions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('teams', sa.Column('member_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('teams', sa.Column('pending_invitation_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('teams', sa.Column('rejected_invitation_count', sa.Integer(), nullable=False, server_default='0'))
+    
+    op.execute("""
+        UPDATE teams t
+        SET member_count = (
+                SELECT COUNT(*) FROM team_members tm WHERE tm.team_id = t.id
+            ),
+            pending_invitation_count = (
+                SELECT COUNT(*) FROM team_invitations ti
+                WHERE ti.team_id = t.id AND ti.status = 'pending'
+            ),
+            rejected_invitation_count = (
+                SELECT COUNT(*) FROM team_invitations ti
+                WHERE ti.team_id = t.id AND ti.status = 'rejected'
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('teams', 'rejected_invitation_count')
+    op.drop_column('teams', 'pending_invitation_count')
+    op.drop_column('teams', 'member_count')
@@ -0,0 +1,32 @@
+"""Make project enrollments unique per (project_id, user_id)
+
+Revision ID: 006_enrollment_unique
+Revises: 005_team_counters
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_enrollment_unique'
+down_revision = '005_team_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the earliest enrollment of any duplicates created by past races
+    op.execute("""
+        DELETE FROM project_enrollments pe
+        USING project_enrollments keep
+        WHERE pe.project_id = keep.project_id
+          AND pe.user_id = keep.user_id
+          AND pe.id > keep.id
+    """)
+    op.create_unique_constraint(
+        'uq_project_enrollments_project_user', 'project_enrollments', ['project_id', 'user_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_project_enrollments_project_user', 'project_enrollments', type_='unique')
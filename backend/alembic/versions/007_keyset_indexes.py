@@ -0,0 +1,30 @@
+"""Add composite indexes for filtered keyset pagination
+
+Revision ID: 007_keyset_indexes
+Revises: 006_enrollment_unique
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_keyset_indexes'
+down_revision = '006_enrollment_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'])
+    op.create_index('ix_projects_branch_batch_created_at', 'projects', ['branch', 'batch', 'created_at', 'id'])
+    op.create_index('ix_projects_is_active_deadline', 'projects', ['is_active', 'deadline'])
+    op.create_index('ix_admin_logs_created_at_id', 'admin_logs', ['created_at', 'id'])
+    op.create_index('ix_chat_sessions_user_created_at_id', 'chat_sessions', ['user_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_sessions_user_created_at_id', table_name='chat_sessions')
+    op.drop_index('ix_admin_logs_created_at_id', table_name='admin_logs')
+    op.drop_index('ix_projects_is_active_deadline', table_name='projects')
+    op.drop_index('ix_projects_branch_batch_created_at', table_name='projects')
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
@@ -0,0 +1,29 @@
+"""Index foreign keys checked when a project is deleted
+
+Revision ID: 008_foreign_key_indexes
+Revises: 007_keyset_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_foreign_key_indexes'
+down_revision = '007_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Deleting a parent row looks up its children by these columns
+    op.create_index('ix_submission_feedbacks_submission_id', 'submission_feedbacks', ['submission_id'])
+    op.create_index('ix_submission_approvals_submission_id', 'submission_approvals', ['submission_id'])
+    op.create_index('ix_team_invitations_team_id', 'team_invitations', ['team_id'])
+    op.create_index('ix_teams_project_id', 'teams', ['project_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_teams_project_id', table_name='teams')
+    op.drop_index('ix_team_invitations_team_id', table_name='team_invitations')
+    op.drop_index('ix_submission_approvals_submission_id', table_name='submission_approvals')
+    op.drop_index('ix_submission_feedbacks_submission_id', table_name='submission_feedbacks')
@@ -0,0 +1 @@
+# CLI module init
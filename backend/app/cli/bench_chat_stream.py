@@ -0,0 +1,141 @@
+"""
+Measure chatbot time-to-first-byte, blocking vs streamed, against a local
+mock of the Groq chat completions API (no network or API key needed).
+
+Usage:
+    python -m app.cli.bench_chat_stream [--tokens 200] [--token-delay-ms 20] [--repeat 5]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+class MockLLMServer:
+    """
+    Minimal OpenAI-compatible completions endpoint that emits `tokens` words,
+    one every `delay` seconds, either as one JSON body or as an SSE stream.
+    """
+
+    def __init__(self, tokens: int, delay: float):
+        self.tokens = tokens
+        self.delay = delay
+        self.sent = []  # tokens written per streamed request
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode("latin-1").split("\r\n")[1:]:
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            request = json.loads(await reader.readexactly(length) or b"{}")
+
+            if request.get("stream"):
+                await self._stream(writer, request.get("model", "mock"))
+            else:
+                await asyncio.sleep(self.tokens * self.delay)
+                body = json.dumps({
+                    "id": "mock", "object": "chat.completion", "created": int(time.time()),
+                    "model": request.get("model", "mock"),
+                    "choices": [{
+                        "index": 0, "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": " ".join(["word"] * self.tokens)}
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": self.tokens, "total_tokens": self.tokens}
+                }).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _stream(self, writer: asyncio.StreamWriter, model: str) -> None:
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nConnection: close\r\n\r\n")
+        index = len(self.sent)
+        self.sent.append(0)
+        for i in range(self.tokens):
+            await asyncio.sleep(self.delay)
+            if writer.is_closing():
+                return
+            chunk = {
+                "id": "mock", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "delta": {"content": ("" if i == 0 else " ") + "word"}, "finish_reason": None}]
+            }
+            writer.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            await writer.drain()
+            self.sent[index] += 1
+        writer.write(b"data: [DONE]\n\n")
+        await writer.drain()
+
+async def run(args) -> None:
+    server = MockLLMServer(args.tokens, args.token_delay_ms / 1000)
+    base_url = await server.start()
+
+    os.environ.setdefault("GROQ_API_KEY", "mock")
+    from app.core.llm import GroqProvider, build_client
+    from app.routes.chatbot import build_system_prompt
+
+    client = build_client(GroqProvider(api_key="mock", model="mock", base_url=base_url))
+    question = "How do I create a team?"
+    system_prompt = build_system_prompt("student", question)
+    blocking, first, total = [], [], []
+
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        await client.complete(system_prompt, question)
+        blocking.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        first_at = None
+        async for _text in client.stream(system_prompt, question):
+            if first_at is None:
+                first_at = time.perf_counter() - started
+        first.append(first_at)
+        total.append(time.perf_counter() - started)
+
+    # Disconnect: stop after the first token and check the mock stops sending
+    tokens = client.stream(system_prompt, question)
+    async for _text in tokens:
+        break
+    await tokens.aclose()
+    await asyncio.sleep(args.token_delay_ms / 1000 * 5)
+    await client.aclose()
+    await server.stop()
+
+    def ms(values):
+        return f"{sorted(values)[len(values) // 2] * 1000:9.1f} ms"
+
+    print(f"mock LLM: {args.tokens} tokens, {args.token_delay_ms} ms/token, median of {args.repeat}")
+    print(f"  blocking  first byte {ms(blocking)}")
+    print(f"  streamed  first byte {ms(first)}   complete {ms(total)}")
+    print(f"  cancelled after 1 token: upstream sent {server.sent[-1]} of {args.tokens} tokens")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark chatbot time-to-first-byte against a mock LLM")
+    parser.add_argument("--tokens", type=int, default=200, help="Tokens per mock answer")
+    parser.add_argument("--token-delay-ms", type=float, default=20, help="Mock generation time per token")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per measurement")
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Seed a project with ~100k dependent rows and time deleting it, comparing
+ProjectService.delete_project (set-based DELETEs) with deleting through
+the ORM, which loads every dependent row and deletes it one by one, as
+cascade="all, delete" relationships would. Each delete runs in its own
+transaction and is rolled back, so both see the same data; the seeded
+rows are removed at the end.
+
+Usage:
+    python -m app.cli.bench_delete_project [--teams 500] [--versions 10] [--skip-orm]
+"""
+import argparse
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
+
+STAGES = ["synopsis", "progress_1", "progress_2", "final_submission"]
+TEAM_SIZE = 4
+
+def seed(db, teams: int, versions: int) -> dict:
+    """
+    Per team: 4 members, 4 invitations, a supervisor assignment and, for
+    each stage, `versions` submissions with 3 approvals and 1 feedback each.
+    """
+    from app.models.models import (
+        Project, ProjectEnrollment, Submission, SubmissionApproval, SubmissionFeedback,
+        SupervisorAssignment, Team, TeamInvitation, User, team_members_table
+    )
+
+    tag = uuid.uuid4().hex[:8]
+    project_id = db.execute(insert(Project).returning(Project.id), {
+        "title": f"Delete bench {tag}",
+        "description": "Created by app.cli.bench_delete_project",
+        "branch": "BENCH",
+        "batch": "BENCH",
+        "deadline": datetime.now(timezone.utc) + timedelta(days=1),
+        "enrollment_token": f"bench-{tag}",
+        "enrollment_link": f"/enroll/bench-{tag}"
+    }).scalar()
+    supervisor_id = db.execute(insert(User).returning(User.id), {
+        "email": f"bench-{tag}-supervisor@example.com", "name": "Bench supervisor", "role": "supervisor"
+    }).scalar()
+    user_ids = db.execute(insert(User).returning(User.id, sort_by_parameter_order=True), [
+        {"email": f"bench-{tag}-{i}@example.com", "name": f"Bench {i}", "role": "student"}
+        for i in range(teams * TEAM_SIZE)
+    ]).scalars().all()
+    members = [user_ids[i:i + TEAM_SIZE] for i in range(0, len(user_ids), TEAM_SIZE)]
+
+    db.execute(insert(ProjectEnrollment), [{"project_id": project_id, "user_id": u} for u in user_ids])
+    team_ids = db.execute(insert(Team).returning(Team.id, sort_by_parameter_order=True), [
+        {"project_id": project_id, "leader_id": m[0], "name": f"Team {i}", "member_count": TEAM_SIZE}
+        for i, m in enumerate(members)
+    ]).scalars().all()
+    db.execute(insert(team_members_table), [
+        {"team_id": team_id, "user_id": u} for team_id, m in zip(team_ids, members) for u in m
+    ])
+    db.execute(insert(TeamInvitation), [
+        {"team_id": team_id, "invitee_email": f"bench-{tag}-{u}@example.com", "status": "approved"}
+        for team_id, m in zip(team_ids, members) for u in m
+    ])
+    db.execute(insert(SupervisorAssignment), [
+        {"project_id": project_id, "team_id": team_id, "supervisor_id": supervisor_id} for team_id in team_ids
+    ])
+
+    submissions = [
+        {
+            "team_id": team_id, "stage": stage, "file_url": f"https://files.example.com/{team_id}/{stage}/{v}",
+            "uploaded_by": m[0], "version": v, "is_latest": v == versions
+        }
+        for team_id, m in zip(team_ids, members) for stage in STAGES for v in range(1, versions + 1)
+    ]
+    submission_ids = db.execute(
+        insert(Submission).returning(Submission.id, sort_by_parameter_order=True), submissions
+    ).scalars().all()
+    uploaders = {team_id: m for team_id, m in zip(team_ids, members)}
+    db.execute(insert(SubmissionApproval), [
+        {"submission_id": sid, "user_id": u, "status": "approved"}
+        for sid, s in zip(submission_ids, submissions) for u in uploaders[s["team_id"]][1:]
+    ])
+    db.execute(insert(SubmissionFeedback), [
+        {"submission_id": sid, "supervisor_id": supervisor_id, "supervisor_score": 7.5, "comments": "Bench"}
+        for sid in submission_ids
+    ])
+    db.commit()
+    return {"project_id": project_id, "user_ids": user_ids + [supervisor_id]}
+
+def orm_delete(project_id: int, db) -> None:
+    """Load every dependent row into the session and delete it one by one"""
+    from app.models.models import Project, ProjectEnrollment, SupervisorAssignment
+
+    project = db.query(Project).filter(Project.id == project_id).one()
+    for team in project.teams:
+        for submission in team.submissions:
+            for row in submission.feedbacks + submission.approvals:
+                db.delete(row)
+            db.delete(submission)
+        for invitation in team.team_invitations:
+            db.delete(invitation)
+        team.members = []
+        if team.supervisor_assignment is not None:
+            db.delete(team.supervisor_assignment)
+        db.flush()
+        db.delete(team)
+    for row in db.query(SupervisorAssignment).filter(SupervisorAssignment.project_id == project_id):
+        db.delete(row)
+    for row in db.query(ProjectEnrollment).filter(ProjectEnrollment.project_id == project_id):
+        db.delete(row)
+    db.flush()
+    db.delete(project)
+    db.flush()
+
+def timed(label: str, delete, project_id: int) -> float:
+    from app.db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        result = delete(project_id, db)
+        elapsed = time.perf_counter() - started
+        rows = f", {result['total_rows']} rows" if result else ""
+        print(f"  {label:<28} {elapsed * 1000:>10.0f} ms{rows}")
+        return elapsed
+    finally:
+        db.rollback()
+        db.close()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark deleting a large project")
+    parser.add_argument("--teams", type=int, default=500, help="Teams in the seeded project")
+    parser.add_argument("--versions", type=int, default=10, help="Submission versions per team and stage")
+    parser.add_argument("--skip-orm", action="store_true", help="Only time the set-based delete")
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.models.models import User
+    from app.services.project_service import ProjectService
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    seeded = seed(db, args.teams, args.versions)
+    project_id = seeded["project_id"]
+    print(f"seeded project {project_id} in {time.perf_counter() - started:.1f}s")
+
+    try:
+        set_based = timed("set-based (ProjectService)", ProjectService.delete_project, project_id)
+        if not args.skip_orm:
+            orm = timed("ORM, row by row", orm_delete, project_id)
+            print(f"  set-based delete is {orm / set_based:.0f}x faster")
+    finally:
+        result = ProjectService.delete_project(project_id, db)
+        db.query(User).filter(User.id.in_(seeded["user_ids"])).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+        print(f"removed {result['total_rows']} seeded rows")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Count queries and time GET /api/teams/{id} and
+GET /api/supervisor/submissions/{id} in-process. Seeds a project with one
+team of --members members, --members pending invitations and a
+submission; the seeded rows are removed at the end. Response caching is
+turned off so every request runs the endpoint's own queries. --rtt-ms
+sleeps before each statement to stand in for a database across a network.
+
+Usage:
+    python -m app.cli.bench_detail_endpoints [--members 4] [--repeat 200] [--rtt-ms 0]
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+def seed(db, members: int) -> dict:
+    from app.models.models import (
+        Project, Submission, Team, TeamInvitation, User, team_members_table
+    )
+
+    tag = uuid.uuid4().hex[:8]
+    now = datetime.now(timezone.utc)
+    project = Project(
+        title=f"Detail bench {tag}",
+        description="Created by app.cli.bench_detail_endpoints",
+        branch="BENCH",
+        batch="BENCH",
+        deadline=now + timedelta(days=1),
+        enrollment_token=f"bench-{tag}",
+        enrollment_link=f"/enroll/bench-{tag}"
+    )
+    users = [
+        User(email=f"bench-{tag}-{i}@example.com", name=f"Bench {i}", role="student", updated_at=now)
+        for i in range(members)
+    ]
+    supervisor = User(email=f"bench-{tag}-supervisor@example.com", name="Bench supervisor", role="supervisor")
+    db.add_all([project, supervisor, *users])
+    db.flush()
+
+    team = Team(project_id=project.id, leader_id=users[0].id, name=f"Team {tag}", member_count=members)
+    db.add(team)
+    db.flush()
+    db.execute(team_members_table.insert(), [{"team_id": team.id, "user_id": user.id} for user in users])
+    db.add_all([
+        TeamInvitation(team_id=team.id, invitee_email=f"bench-{tag}-invitee-{i}@example.com")
+        for i in range(members)
+    ])
+    submission = Submission(
+        team_id=team.id, stage="synopsis", file_url=f"https://files.example.com/{tag}", uploaded_by=users[0].id
+    )
+    db.add(submission)
+    db.commit()
+    return {
+        "project_id": project.id,
+        "team_id": team.id,
+        "submission_id": submission.id,
+        "supervisor_id": supervisor.id,
+        "user_ids": [user.id for user in users] + [supervisor.id]
+    }
+
+def cleanup(db, seeded: dict) -> None:
+    from app.models.models import Project, Submission, Team, TeamInvitation, User, team_members_table
+
+    team_id = seeded["team_id"]
+    db.query(Submission).filter(Submission.team_id == team_id).delete()
+    db.query(TeamInvitation).filter(TeamInvitation.team_id == team_id).delete()
+    db.execute(team_members_table.delete().where(team_members_table.c.team_id == team_id))
+    db.query(Team).filter(Team.id == team_id).delete()
+    db.query(Project).filter(Project.id == seeded["project_id"]).delete()
+    db.query(User).filter(User.id.in_(seeded["user_ids"])).delete(synchronize_session=False)
+    db.commit()
+
+def measure(client, engine, path: str, params: dict, repeat: int, rtt: float) -> tuple:
+    """(statements per request, median ms, p95 ms)"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.get(path, params=params)
+        response.raise_for_status()
+        per_request = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    def round_trip(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(rtt)
+
+    if rtt:
+        event.listen(engine, "before_cursor_execute", round_trip)
+    timings = []
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            client.get(path, params=params)
+            timings.append(time.perf_counter() - started)
+    finally:
+        if rtt:
+            event.remove(engine, "before_cursor_execute", round_trip)
+    timings.sort()
+    return per_request, timings[len(timings) // 2] * 1000, timings[int(len(timings) * 0.95)] * 1000
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark team and submission detail endpoints")
+    parser.add_argument("--members", type=int, default=4, help="Team members (and pending invitations)")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed requests per endpoint")
+    parser.add_argument("--rtt-ms", type=float, default=0, help="Simulated network round trip per statement")
+    args = parser.parse_args(argv)
+
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    from fastapi.testclient import TestClient
+    from app.db.database import SessionLocal, engine
+    from app.main import app
+
+    db = SessionLocal()
+    seeded = seed(db, args.members)
+    try:
+        # Not used as a context manager, so startup background tasks stay off
+        client = TestClient(app)
+        endpoints = [
+            ("GET /api/teams/{id}", f"/api/teams/{seeded['team_id']}", {}),
+            (
+                "GET /api/supervisor/submissions/{id}",
+                f"/api/supervisor/submissions/{seeded['submission_id']}",
+                {"user_id": seeded["supervisor_id"]}
+            ),
+        ]
+        print(f"team of {args.members} members, {args.members} invitations, {args.rtt_ms:g} ms RTT,"
+              f" median of {args.repeat}")
+        for label, path, params in endpoints:
+            queries, median, p95 = measure(client, engine, path, params, args.repeat, args.rtt_ms / 1000)
+            print(f"  {label:<38} {queries} queries  p50 {median:6.2f} ms  p95 {p95:6.2f} ms")
+    finally:
+        cleanup(db, seeded)
+        db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Fire simultaneous enrollments at a running API and check the outcome.
+Seeds a project and --students students in DATABASE_URL (the database the
+server uses), then every student enrolls --attempts times at once, mixing
+the by-token and by-project routes. Fails if any request got a 5xx or the
+project ends up with anything but one enrollment per student. The seeded
+rows are removed afterwards unless --keep is given.
+
+Usage:
+    uvicorn app.main:app --workers 4 &
+    python -m app.cli.bench_enrollment [--url http://localhost:8000] [--students 500] [--attempts 2]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+def seed(db, students: int):
+    from app.models.models import Project, User, RoleEnum
+
+    token = uuid.uuid4().hex
+    project = Project(
+        title=f"Enrollment bench {token[:6]}",
+        description="Created by app.cli.bench_enrollment",
+        branch="BENCH",
+        batch="BENCH",
+        deadline=datetime.now(timezone.utc) + timedelta(days=1),
+        enrollment_token=token,
+        enrollment_link=f"/enroll/{token}"
+    )
+    users = [
+        User(email=f"bench-{token[:8]}-{i}@example.com", name=f"Bench {i}", role=RoleEnum.STUDENT)
+        for i in range(students)
+    ]
+    db.add(project)
+    db.add_all(users)
+    db.commit()
+    return project.id, token, [user.id for user in users]
+
+def cleanup(db, project_id: int, user_ids) -> None:
+    from app.models.models import Project, ProjectEnrollment, User
+
+    db.query(ProjectEnrollment).filter(ProjectEnrollment.project_id == project_id).delete()
+    db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+    db.query(Project).filter(Project.id == project_id).delete()
+    db.commit()
+
+async def fire(url: str, project_id: int, token: str, user_ids, attempts: int):
+    import httpx
+
+    limits = httpx.Limits(max_connections=len(user_ids) * attempts)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=120) as client:
+        async def enroll(user_id: int, attempt: int):
+            started = time.perf_counter()
+            if attempt % 2 == 0:
+                response = await client.post("/api/projects/enroll", params={"user_id": user_id}, json={"token": token})
+            else:
+                response = await client.post(
+                    f"/api/projects/{project_id}/enroll", params={"user_id": user_id, "token": token}
+                )
+            return user_id, response.status_code, time.perf_counter() - started
+
+        return await asyncio.gather(*(
+            enroll(user_id, attempt) for attempt in range(attempts) for user_id in user_ids
+        ))
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark simultaneous project enrollments")
+    parser.add_argument("--url", default="http://localhost:8000", help="Base URL of the running API")
+    parser.add_argument("--students", type=int, default=500, help="Students enrolling at once")
+    parser.add_argument("--attempts", type=int, default=2, help="Simultaneous enroll requests per student")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded project and students")
+    args = parser.parse_args(argv)
+
+    from sqlalchemy import func
+    from app.db.database import SessionLocal
+    from app.models.models import ProjectEnrollment
+
+    db = SessionLocal()
+    project_id, token, user_ids = seed(db, args.students)
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(fire(args.url, project_id, token, user_ids, args.attempts))
+        elapsed = time.perf_counter() - started
+
+        rows = db.query(ProjectEnrollment.user_id, func.count()).filter(
+            ProjectEnrollment.project_id == project_id
+        ).group_by(ProjectEnrollment.user_id).all()
+    finally:
+        if not args.keep:
+            cleanup(db, project_id, user_ids)
+        db.close()
+
+    statuses = Counter(status for _, status, _ in results)
+    accepted = Counter(user_id for user_id, status, _ in results if status == 200)
+    latencies = sorted(seconds for _, _, seconds in results)
+    server_errors = sum(n for status, n in statuses.items() if status >= 500)
+    duplicates = sum(1 for _, n in rows if n > 1)
+
+    print(f"{len(results)} requests ({args.students} students x {args.attempts}) in {elapsed:.2f}s"
+          f" = {len(results) / elapsed:.0f} req/s")
+    print(f"  status codes: {dict(sorted(statuses.items()))}")
+    print(f"  latency p50 {latencies[len(latencies) // 2] * 1000:.0f} ms"
+          f"  p95 {latencies[int(len(latencies) * 0.95)] * 1000:.0f} ms"
+          f"  max {latencies[-1] * 1000:.0f} ms")
+    print(f"  enrollment rows: {sum(n for _, n in rows)} for {len(rows)} students, {duplicates} duplicated")
+
+    failures = []
+    if server_errors:
+        failures.append(f"{server_errors} server errors")
+    if duplicates:
+        failures.append(f"{duplicates} students enrolled more than once")
+    if len(rows) != args.students:
+        failures.append(f"{args.students - len(rows)} students not enrolled")
+    if any(n != 1 for n in accepted.values()) or len(accepted) != args.students:
+        failures.append("not exactly one successful enroll response per student")
+    if failures:
+        print("FAILED: " + "; ".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Report chatbot system prompt size and FAQ retrieval latency: the old
+whole-FAQ prompt against the top-k retrieved prompt. No LLM or database
+needed. --synthetic pads the FAQ with generated entries to show growth.
+
+Usage:
+    python -m app.cli.bench_faq_prompt [--top-k 3] [--synthetic 0] [--repeat 200] [--embeddings]
+"""
+import argparse
+import sys
+import time
+
+SAMPLE_QUESTIONS = [
+    "How can I join a project?",
+    "where do I get the enrollment token",
+    "what stages does a submission go through",
+    "do all team members need to approve the submission",
+    "max upload size for a file",
+    "how to make a new team",
+    "can a student be part of two teams",
+    "my teammate rejected the invite, what now",
+    "how is my final score computed",
+    "who grades the supervisor score",
+    "when is the deadline",
+    "what is the capital of France",
+]
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark FAQ retrieval and chatbot prompt size")
+    parser.add_argument("--top-k", type=int, default=3, help="FAQ entries per prompt")
+    parser.add_argument("--synthetic", type=int, default=0, help="Extra generated FAQ entries")
+    parser.add_argument("--repeat", type=int, default=200, help="Retrievals per question")
+    parser.add_argument("--embeddings", action="store_true", help="Also build the embedding index")
+    args = parser.parse_args(argv)
+
+    from app.core.config import settings
+    from app.core.faq_index import faq_index
+    from app.routes import chatbot
+
+    entries = chatbot.FAQ_ENTRIES + [
+        {
+            "category": f"topic{i % 25}",
+            "q": f"How does feature {i} of module {i % 40} work?",
+            "a": f"Feature {i} is configured from the module {i % 40} settings page by an admin."
+        }
+        for i in range(args.synthetic)
+    ]
+    faq_index.build(entries, embedding_model=settings.RAG_EMBEDDING_MODEL if args.embeddings else None)
+    settings.FAQ_TOP_K = args.top_k
+
+    full_prompt = chatbot.system_prompt_prefix("student") + chatbot.format_faq(entries)
+    sizes, latencies = [], []
+    print(f"{len(entries)} FAQ entries, index built in {faq_index.build_seconds * 1000:.1f} ms"
+          f" ({'BM25 + embeddings' if faq_index.embeddings is not None else 'BM25'})")
+    for question in SAMPLE_QUESTIONS:
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            prompt = chatbot.build_system_prompt("student", question)
+            latencies.append(time.perf_counter() - started)
+        sizes.append(len(prompt))
+        top = faq_index.retrieve(question, 1)
+        print(f"  {question[:45]:<45} -> {top[0]['q'] if top else '(no match)'}")
+
+    # ~4 characters per token for English text
+    print(f"system prompt, whole FAQ:  {len(full_prompt):>8} chars  ~{len(full_prompt) // 4} tokens")
+    print(f"system prompt, top-{args.top_k}:     {max(sizes):>8} chars  ~{max(sizes) // 4} tokens (largest)")
+    print(f"prompt build + retrieval:  p50 {percentile(latencies, 0.5) * 1e6:.1f} us"
+          f"  p95 {percentile(latencies, 0.95) * 1e6:.1f} us")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Compare JSON rendering time and payload size for the leaderboard and
+team-detail response shapes, using synthetic data (no database needed).
+
+Usage:
+    python -m app.cli.bench_serialization [--teams 500] [--members 4] [--repeat 200]
+"""
+import argparse
+import gzip
+import sys
+import time
+from datetime import datetime, timedelta
+from fastapi.responses import JSONResponse, ORJSONResponse
+from app.schemas.schemas import (
+    LeaderboardEntry, LeaderboardResponse, TeamDetailResponse, TeamInvitationResponse, UserResponse
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def build_leaderboard(teams: int, members: int) -> LeaderboardResponse:
+    now = datetime.utcnow()
+    entries = [
+        LeaderboardEntry(
+            rank=i + 1,
+            team_name=f"Team {i}",
+            members=[f"Student {i}-{m}" for m in range(members)],
+            supervisor_avg=round(90 - i * 0.01, 2),
+            admin_score=round(88 - i * 0.01, 2),
+            final_score=round(89 - i * 0.01, 2),
+            submission_time=now - timedelta(minutes=i)
+        )
+        for i in range(teams)
+    ]
+    return LeaderboardResponse(entries=entries, project_id=1, total_teams=teams)
+
+def build_team_detail(members: int) -> TeamDetailResponse:
+    now = datetime.utcnow()
+    return TeamDetailResponse(
+        id=1, name="Team 1", status="active", is_locked=False, leader_id=1, project_id=1,
+        member_count=members, created_at=now,
+        members=[
+            UserResponse(
+                id=m, email=f"student{m}@dpg-itm.edu.in", name=f"Student {m}", role="student",
+                is_active=True, created_at=now, updated_at=now
+            )
+            for m in range(members)
+        ],
+        team_invitations=[
+            TeamInvitationResponse(id=m, invitee_email=f"student{m}@dpg-itm.edu.in", status="accepted", invited_at=now)
+            for m in range(members)
+        ]
+    )
+
+def bench(name: str, model, repeat: int) -> None:
+    # Both response classes receive what FastAPI hands them after response_model validation
+    content = model.model_dump(mode="json")
+    print(f"{name}")
+    for label, response_class in (("json", JSONResponse), ("orjson", ORJSONResponse)):
+        renderer = response_class.__new__(response_class)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            body = renderer.render(content)
+        per_call_us = (time.perf_counter() - started) / repeat * 1e6
+        print(f"  {label:<7} {per_call_us:10.1f} us/render  {len(body):>9} bytes")
+
+    sizes = [f"gzip {len(gzip.compress(body, 6))}"]
+    if brotli is not None:
+        sizes.append(f"br {len(brotli.compress(body, quality=4))}")
+    print(f"  compressed: {', '.join(sizes)} bytes")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON response rendering")
+    parser.add_argument("--teams", type=int, default=500, help="Leaderboard entries")
+    parser.add_argument("--members", type=int, default=4, help="Members per team")
+    parser.add_argument("--repeat", type=int, default=200, help="Renders per measurement")
+    args = parser.parse_args(argv)
+
+    bench(f"leaderboard ({args.teams} teams)", build_leaderboard(args.teams, args.members), args.repeat)
+    bench(f"team detail ({args.members} members)", build_team_detail(args.members), args.repeat)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
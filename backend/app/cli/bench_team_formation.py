@@ -0,0 +1,91 @@
+"""
+Seed a project with --students enrolled, unteamed students and time
+TeamFormationService.form_teams over them, as a dry run and as a real run.
+The real run is rolled back, and the seeded rows are removed at the end.
+
+Usage:
+    python -m app.cli.bench_team_formation [--students 2000] [--team-size 4] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
+
+DEPARTMENTS = ["CSE", "ECE", "ME", "CE"]
+BATCHES = ["2023", "2024"]
+
+def seed(db, students: int) -> dict:
+    from app.models.models import Project, ProjectEnrollment, User
+
+    tag = uuid.uuid4().hex[:8]
+    project_id = db.execute(insert(Project).returning(Project.id), {
+        "title": f"Team formation bench {tag}",
+        "description": "Created by app.cli.bench_team_formation",
+        "branch": "BENCH",
+        "batch": "BENCH",
+        "deadline": datetime.now(timezone.utc) + timedelta(days=1),
+        "enrollment_token": f"bench-{tag}",
+        "enrollment_link": f"/enroll/bench-{tag}"
+    }).scalar()
+    user_ids = db.execute(insert(User).returning(User.id, sort_by_parameter_order=True), [
+        {
+            "email": f"bench-{tag}-{i}@example.com", "name": f"Bench {i}", "role": "student",
+            "department": DEPARTMENTS[i % len(DEPARTMENTS)], "batch": BATCHES[i % len(BATCHES)]
+        }
+        for i in range(students)
+    ]).scalars().all()
+    db.execute(insert(ProjectEnrollment), [{"project_id": project_id, "user_id": u} for u in user_ids])
+    db.commit()
+    return {"project_id": project_id, "user_ids": user_ids}
+
+def timed(project_id: int, args, dry_run: bool) -> tuple:
+    from app.db.database import SessionLocal
+    from app.models.models import Project
+    from app.services.team_formation_service import TeamFormationService
+
+    db = SessionLocal()
+    try:
+        project = db.get(Project, project_id)
+        started = time.perf_counter()
+        result = TeamFormationService.form_teams(
+            project, db, args.team_size,
+            group_by_department=args.group, group_by_batch=args.group, dry_run=dry_run
+        )
+        return time.perf_counter() - started, result
+    finally:
+        db.rollback()
+        db.close()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark automatic team formation")
+    parser.add_argument("--students", type=int, default=2000, help="Unteamed enrolled students")
+    parser.add_argument("--team-size", type=int, default=4, help="Maximum members per team")
+    parser.add_argument("--group", action="store_true", help="Group by department and batch")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.models.models import Project, ProjectEnrollment, User
+
+    db = SessionLocal()
+    seeded = seed(db, args.students)
+    project_id = seeded["project_id"]
+    try:
+        for label, dry_run in (("dry run", True), ("form teams", False)):
+            runs = [timed(project_id, args, dry_run) for _ in range(args.repeat)]
+            seconds = sorted(elapsed for elapsed, _ in runs)
+            result = runs[-1][1]
+            print(f"  {label:<12} {result['total_students']} students -> {result['total_teams']} teams"
+                  f"  median {seconds[len(seconds) // 2] * 1000:.0f} ms  max {seconds[-1] * 1000:.0f} ms")
+    finally:
+        db.query(ProjectEnrollment).filter(ProjectEnrollment.project_id == project_id).delete()
+        db.query(User).filter(User.id.in_(seeded["user_ids"])).delete(synchronize_session=False)
+        db.query(Project).filter(Project.id == project_id).delete()
+        db.commit()
+        db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Import a student roster CSV from the command line.
+
+Usage:
+    python -m app.cli.import_students roster.csv [--project-id 3] [--batch-size 1000]
+"""
+import argparse
+import json
+import sys
+import time
+from app.db.database import SessionLocal
+from app.models.models import Project
+from app.services.roster_service import RosterService
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import students from a CSV roster")
+    parser.add_argument("csv_path", help="CSV with columns email, name, student_id, department, batch")
+    parser.add_argument("--project-id", type=int, default=None, help="Enroll imported students into this project")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per upsert batch")
+    args = parser.parse_args(argv)
+    
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        if args.project_id is not None and db.query(Project.id).filter(Project.id == args.project_id).first() is None:
+            print(f"Error: Project {args.project_id} not found", file=sys.stderr)
+            return 1
+        with open(args.csv_path, encoding="utf-8-sig", newline="") as lines:
+            report = RosterService.import_students(lines, db, args.project_id, args.batch_size)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    
+    elapsed = time.perf_counter() - started
+    print(json.dumps(report, indent=2, default=str))
+    print(
+        f"{report['imported']}/{report['total_rows']} rows imported, "
+        f"{report['enrolled']} enrolled, {len(report['errors'])} errors in {elapsed:.2f}s",
+        file=sys.stderr
+    )
+    return 0 if not report["errors"] else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from typing import List, Tuple
+from urllib.parse import urlsplit
+from fastapi import FastAPI
+from starlette.routing import Match
+
+# Request headers forwarded from the batch request to every sub-request
+FORWARDED_HEADERS = {"authorization", "cookie", "accept-language"}
+
+# Cost units per route template; anything not listed costs 1.
+# None marks routes that cannot be batched (streams, the batch route itself).
+ROUTE_COSTS = {
+    "/api/projects/": 3,
+    "/api/projects/{project_id}/leaderboard": 5,
+    "/api/projects/{project_id}/export": None,
+    "/api/admin/export/grades": None,
+    "/api/admin/stats": 2,
+    "/api/admin/logs": 3,
+    "/api/students/me/dashboard": 5,
+    "/api/batch": None,
+    "/metrics": None,
+}
+
+class SubRequestError(ValueError):
+    pass
+
+def resolve_route(app: FastAPI, method: str, path: str):
+    """Route a sub-request would hit, or None"""
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route
+    return None
+
+def plan_batch(app: FastAPI, items: list, max_requests: int, max_cost: int) -> int:
+    """Validate sub-requests against the limits; returns the total cost or raises SubRequestError"""
+    if not items:
+        raise SubRequestError("Batch is empty")
+    if len(items) > max_requests:
+        raise SubRequestError(f"At most {max_requests} sub-requests per batch")
+
+    total = 0
+    for index, item in enumerate(items):
+        if item.method.upper() != "GET":
+            raise SubRequestError(f"Sub-request {index}: only GET can be batched")
+        route = resolve_route(app, "GET", urlsplit(item.path).path)
+        if route is None:
+            raise SubRequestError(f"Sub-request {index}: no GET route for {item.path}")
+        cost = ROUTE_COSTS.get(route.path, 1)
+        if cost is None:
+            raise SubRequestError(f"Sub-request {index}: {route.path} cannot be batched")
+        total += cost
+
+    if total > max_cost:
+        raise SubRequestError(f"Batch cost {total} exceeds the limit of {max_cost}")
+    return total
+
+def _build_scope(parent_scope: dict, method: str, url: str, headers: dict) -> dict:
+    parts = urlsplit(url)
+    forwarded = [
+        (name, value) for name, value in parent_scope["headers"]
+        if name.decode("latin-1") in FORWARDED_HEADERS
+    ]
+    extra = [(k.lower().encode("latin-1"), str(v).encode("latin-1")) for k, v in headers.items()]
+    return {
+        "type": "http",
+        "asgi": parent_scope.get("asgi", {"version": "3.0"}),
+        "http_version": parent_scope.get("http_version", "1.1"),
+        "method": method,
+        "scheme": parent_scope.get("scheme", "http"),
+        "server": parent_scope.get("server"),
+        "client": parent_scope.get("client"),
+        "root_path": "",
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        # Sub-responses are embedded in one JSON document, never compressed individually
+        "headers": forwarded + extra + [(b"accept-encoding", b"identity")],
+    }
+
+async def call_in_process(app: FastAPI, scope: dict) -> Tuple[int, dict, bytes]:
+    """Run one request through the full ASGI stack without touching the network"""
+    status = 500
+    headers = {}
+    chunks: List[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, headers, b"".join(chunks)
+
+async def run_batch(
+    app: FastAPI,
+    parent_scope: dict,
+    items: list,
+    concurrency: int,
+    timeout: float
+) -> bytes:
+    """
+    Dispatch GET sub-requests concurrently and return one JSON document
+    {"responses": [{"id", "status", "etag", "body"}, ...]} in request order.
+    Sub-request bodies are spliced in as-is rather than parsed and re-encoded.
+    Each sub-request opens its own session through get_db, so at most
+    `concurrency` pooled connections are in use per batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(item) -> bytes:
+        scope = _build_scope(parent_scope, "GET", item.path, item.headers or {})
+
+        async with semaphore:
+            try:
+                status, headers, body = await asyncio.wait_for(call_in_process(app, scope), timeout)
+            except asyncio.TimeoutError:
+                status, headers, body = 504, {}, json.dumps({"detail": "Sub-request timed out"}).encode()
+            except Exception:
+                # The error middleware has already answered 500 and re-raised;
+                # keep the failure local to this sub-request
+                status, headers, body = 500, {}, json.dumps({"detail": "Internal Server Error"}).encode()
+
+        if not body or not headers.get("content-type", "").startswith("application/json"):
+            body = json.dumps(body.decode("utf-8", "replace") if body else None).encode()
+        meta = json.dumps({"id": item.id, "status": status, "etag": headers.get("etag")})
+        # Splice the raw body into the metadata object
+        return meta[:-1].encode() + b',"body":' + body + b"}"
+
+    parts = await asyncio.gather(*(run_one(item) for item in items))
+    return b'{"responses":[' + b",".join(parts) + b"]}"
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 from functools import lru_cache
 
 class Settings(BaseSettings):
@@ -42,10 +42,64 @@ class Settings(BaseSettings):
     # Groq LLM
     GROQ_API_KEY: str
     GROQ_MODEL_NAME: str = "mixtral-8x7b-32768"
+    # Override to point the client at a proxy or a local mock server
+    GROQ_BASE_URL: Optional[str] = None
+    
+    # LLM Client
+    LLM_PROVIDER: str = "groq"  # groq | fake
+    LLM_MAX_CONCURRENCY: int = 16
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_TIMEOUT_SECONDS: float = 30.0
+    LLM_MAX_RETRIES: int = 2
+    LLM_RETRY_BASE_SECONDS: float = 0.5
+    LLM_BREAKER_FAILURES: int = 5
+    LLM_BREAKER_RESET_SECONDS: float = 30.0
     
     # RAG
     RAG_MODEL_NAME: str = "ollama"
     RAG_EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    FAQ_TOP_K: int = 3
+    FAQ_EMBEDDINGS_ENABLED: bool = False  # needs numpy and sentence-transformers
+    
+    # Supervisor Assignment
+    SUPERVISOR_MAX_TEAMS: int = 15
+    
+    # Team Formation
+    AUTO_TEAM_SIZE: int = 4
+    
+    # Caching
+    STATS_CACHE_TTL_SECONDS: int = 60
+    ADMIN_STATS_REFRESH_SECONDS: int = 30
+    ENROLLMENT_TOKEN_CACHE_TTL_SECONDS: int = 300
+    DASHBOARD_CACHE_TTL_SECONDS: int = 120
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAXSIZE: int = 2048
+    RESPONSE_CACHE_TTL_SECONDS: int = 600
+    ROW_CACHE_MAXSIZE: int = 10000
+    ROW_CACHE_TTL_SECONDS: int = 300
+    
+    # Cross-worker Cache Invalidation (Postgres LISTEN/NOTIFY)
+    INVALIDATION_BUS_ENABLED: bool = True
+    INVALIDATION_HEARTBEAT_SECONDS: int = 30
+    INVALIDATION_RECONNECT_MAX_SECONDS: int = 30
+    
+    # Response Compression
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    
+    # Batch Requests
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_MAX_COST: int = 40
+    BATCH_CONCURRENCY: int = 8
+    BATCH_SUBREQUEST_TIMEOUT_SECONDS: float = 10.0
+    
+    # Metrics
+    METRICS_ENABLED: bool = True
+    
+    # N+1 Query Detection (dev only)
+    NPLUSONE_DETECT: bool = False
+    NPLUSONE_THRESHOLD: int = 5
     
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:3001"]
@@ -0,0 +1,136 @@
+import heapq
+import logging
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+logger = logging.getLogger("app.faq_index")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i if in is it me my of on or "
+    "the this to what when where which who why will with you your".split()
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word terms without stopwords, with a plural 's' folded away"""
+    terms = []
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+class BM25Index:
+    """Okapi BM25 over pre-tokenised documents, with postings lists so a query only touches matching docs"""
+
+    def __init__(self, documents: Sequence[List[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        n = len(documents)
+        avg_length = sum(len(doc) for doc in documents) / n if n else 1.0
+        # Per-document length normalisation, k1 * (1 - b + b * |d| / avgdl)
+        self._norms = [k1 * (1 - b + b * len(doc) / avg_length) for doc in documents]
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for index, doc in enumerate(documents):
+            for term, tf in Counter(doc).items():
+                self._postings[term].append((index, tf))
+        self._idf = {
+            term: math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def search(self, terms: List[str], k: int) -> List[Tuple[int, float]]:
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(terms):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for index, tf in self._postings[term]:
+                scores[index] += idf * tf * (self.k1 + 1) / (tf + self._norms[index])
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+class EmbeddingIndex:
+    """Dense index: one L2-normalised row per document in a float32 NumPy matrix"""
+
+    def __init__(self, model_name: str, texts: List[str]):
+        self.model = SentenceTransformer(model_name)
+        self.matrix = self._encode(texts)
+
+    def _encode(self, texts: List[str]):
+        vectors = np.asarray(self.model.encode(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def search(self, text: str, k: int) -> List[Tuple[int, float]]:
+        scores = self.matrix @ self._encode([text])[0]
+        top = np.argsort(-scores)[:k]
+        return [(int(index), float(scores[index])) for index in top]
+
+class FAQIndex:
+    """
+    Retrieval over FAQ entries ({"category", "q", "a"}), built once at
+    startup. Lexical BM25 always; with `embedding_model` set and NumPy plus
+    sentence-transformers installed, also a dense index, and the two rankings
+    are merged with reciprocal rank fusion.
+    """
+
+    # Reciprocal rank fusion damping constant
+    RRF_K = 60
+
+    def __init__(self):
+        self.entries: List[dict] = []
+        self.bm25: Optional[BM25Index] = None
+        self.embeddings: Optional[EmbeddingIndex] = None
+        self.build_seconds = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.bm25 is not None
+
+    def build(self, entries: List[dict], embedding_model: Optional[str] = None) -> None:
+        started = time.perf_counter()
+        # The question is repeated so its terms outweigh the answer's
+        texts = [f"{e['category']} {e['q']} {e['q']} {e['a']}" for e in entries]
+        bm25 = BM25Index([tokenize(text) for text in texts])
+
+        embeddings = None
+        if embedding_model:
+            if np is None or SentenceTransformer is None:
+                logger.warning("FAQ embeddings need numpy and sentence-transformers; using BM25 only")
+            else:
+                try:
+                    embeddings = EmbeddingIndex(embedding_model, [f"{e['q']} {e['a']}" for e in entries])
+                except Exception as e:
+                    logger.warning("Could not build FAQ embeddings, using BM25 only: %s", e)
+
+        self.entries, self.bm25, self.embeddings = list(entries), bm25, embeddings
+        self.build_seconds = time.perf_counter() - started
+
+    def retrieve(self, question: str, k: int) -> List[dict]:
+        """Top-k entries for `question`, best first; BM25-only retrieval returns nothing when no term matches"""
+        candidates = max(k * 4, 10)
+        ranked = [index for index, _ in self.bm25.search(tokenize(question), candidates)]
+        if self.embeddings is None:
+            return [self.entries[index] for index in ranked[:k]]
+
+        fused: Dict[int, float] = defaultdict(float)
+        for ranking in (ranked, [index for index, _ in self.embeddings.search(question, candidates)]):
+            for rank, index in enumerate(ranking):
+                fused[index] += 1 / (self.RRF_K + rank + 1)
+        top = heapq.nlargest(k, fused.items(), key=lambda item: item[1])
+        return [self.entries[index] for index, _ in top]
+
+faq_index = FAQIndex()
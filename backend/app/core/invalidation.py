@@ -0,0 +1,150 @@
+import asyncio
+import json
+import os
+import uuid
+from typing import Callable, Iterable, List
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+
+CHANNEL = "cache_invalidation"
+# pg_notify payloads are limited to 8000 bytes
+_MAX_PAYLOAD = 7500
+_PENDING = "invalidation_tags"
+
+# Identifies this worker so it can skip its own notifications
+WORKER_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+Handler = Callable[[List[str]], None]
+_handlers: List[Handler] = []
+
+def register(handler: Handler) -> None:
+    """
+    Subscribe a local cache to invalidation tags. Handlers receive every
+    batch of tags and act on the ones they own; "*" means drop everything.
+    """
+    _handlers.append(handler)
+
+def evict_local(tags: Iterable[str]) -> None:
+    tags = list(tags)
+    for handler in _handlers:
+        try:
+            handler(tags)
+        except Exception as e:
+            print(f"Warning: Cache invalidation handler failed: {e}")
+
+def invalidate(db: Session, *tags: str) -> None:
+    """
+    Queue tags on the session. On commit they are published with pg_notify
+    inside the same transaction, so other workers only hear about committed
+    writes, and this worker's caches are evicted right after the commit.
+    Call before db.commit().
+    """
+    db.info.setdefault(_PENDING, set()).update(tags)
+
+def _payloads(tags: List[str]) -> List[str]:
+    payloads, batch = [], []
+    for tag in tags:
+        candidate = batch + [tag]
+        if batch and len(json.dumps({"origin": WORKER_ID, "tags": candidate})) > _MAX_PAYLOAD:
+            payloads.append(json.dumps({"origin": WORKER_ID, "tags": batch}))
+            candidate = [tag]
+        batch = candidate
+    if batch:
+        payloads.append(json.dumps({"origin": WORKER_ID, "tags": batch}))
+    return payloads
+
+@event.listens_for(SessionLocal, "before_commit")
+def _publish(session: Session) -> None:
+    if not settings.INVALIDATION_BUS_ENABLED:
+        return
+    # Commit only flushes after this hook; flush now so tags queued by flush
+    # events (ORM updates seen by the row cache) go out with the rest
+    session.flush()
+    tags = session.info.get(_PENDING)
+    if not tags:
+        return
+    for payload in _payloads(sorted(tags)):
+        session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+@event.listens_for(SessionLocal, "after_commit")
+def _evict_committed(session: Session) -> None:
+    tags = session.info.pop(_PENDING, None)
+    if tags:
+        evict_local(tags)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+def _handle_payload(payload: str) -> None:
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        return
+    if message.get("origin") == WORKER_ID:
+        return
+    evict_local(message.get("tags", []))
+
+def _connect():
+    """Dedicated autocommit DBAPI connection outside the pool, subscribed to the channel"""
+    cargs, cparams = engine.dialect.create_connect_args(engine.url)
+    conn = engine.dialect.connect(*cargs, **cparams)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {CHANNEL}")
+    return conn
+
+def _drain(conn) -> None:
+    conn.poll()
+    while conn.notifies:
+        _handle_payload(conn.notifies.pop(0).payload)
+
+def _heartbeat(conn) -> None:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+async def run_listener() -> None:
+    """
+    Background task: LISTEN on the channel and evict what other workers
+    changed. Notifications sent while disconnected are lost, so every
+    (re)connect and every failed attempt drops all local caches; staleness
+    is then bounded by the reconnect backoff and each cache's own TTL.
+    """
+    loop = asyncio.get_running_loop()
+    delay = 1.0
+    while True:
+        conn = None
+        try:
+            conn = await loop.run_in_executor(None, _connect)
+            evict_local(["*"])
+            delay = 1.0
+
+            readable = asyncio.Event()
+            loop.add_reader(conn.fileno(), readable.set)
+            try:
+                while True:
+                    try:
+                        await asyncio.wait_for(readable.wait(), timeout=settings.INVALIDATION_HEARTBEAT_SECONDS)
+                        readable.clear()
+                        _drain(conn)
+                    except asyncio.TimeoutError:
+                        # Idle: make sure the connection is still alive
+                        await loop.run_in_executor(None, _heartbeat, conn)
+                        _drain(conn)
+            finally:
+                loop.remove_reader(conn.fileno())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Warning: Invalidation listener disconnected: {e}")
+            evict_local(["*"])
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.INVALIDATION_RECONNECT_MAX_SECONDS)
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
@@ -0,0 +1,306 @@
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator, List, Optional
+import groq
+import httpx
+from groq import AsyncGroq
+from app.core.config import settings
+from app.core.metrics import metrics
+
+class LLMError(Exception):
+    """A provider call failed; `retryable` marks timeouts, connection errors, 429s and 5xxs"""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+class LLMUnavailable(LLMError):
+    """No call was made or every attempt failed; callers should degrade instead of erroring"""
+
+class LLMProvider(ABC):
+    """Chat completion backend: one system prompt and one user question in, answer text out"""
+
+    @abstractmethod
+    async def complete(self, system_prompt: str, question: str) -> str:
+        ...
+
+    @abstractmethod
+    def stream(self, system_prompt: str, question: str) -> AsyncIterator[str]:
+        """Answer text chunks as they arrive; implement as an async generator"""
+
+    async def aclose(self) -> None:
+        pass
+
+class GroqProvider(LLMProvider):
+    """Groq chat completions over one shared, bounded httpx connection pool"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: Optional[str] = None,
+        max_connections: int = 20,
+        max_tokens: int = 1024
+    ):
+        self.model = model
+        self.max_tokens = max_tokens
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+        # Retries and timeouts are owned by LLMClient, not the SDK
+        self._client = AsyncGroq(api_key=api_key, base_url=base_url, http_client=self._http, max_retries=0)
+
+    def _messages(self, system_prompt: str, question: str) -> List[dict]:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": question}
+        ]
+
+    @staticmethod
+    def _error(e: Exception) -> LLMError:
+        if isinstance(e, groq.APIStatusError):
+            return LLMError(str(e), retryable=e.status_code == 429 or e.status_code >= 500)
+        if isinstance(e, groq.APIConnectionError):
+            return LLMError(str(e), retryable=True)
+        return LLMError(str(e))
+
+    async def complete(self, system_prompt: str, question: str) -> str:
+        try:
+            completion = await self._client.chat.completions.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=self._messages(system_prompt, question)
+            )
+        except Exception as e:
+            raise self._error(e) from e
+        return completion.choices[0].message.content or ""
+
+    async def stream(self, system_prompt: str, question: str) -> AsyncIterator[str]:
+        try:
+            stream = await self._client.chat.completions.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=self._messages(system_prompt, question),
+                stream=True
+            )
+        except Exception as e:
+            raise self._error(e) from e
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise self._error(e) from e
+        finally:
+            # Closing the response stops generation for a client that has left
+            await stream.response.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+class FakeProvider(LLMProvider):
+    """
+    In-process provider for tests and benchmarks: answers with `answer`
+    word by word, `token_delay` seconds apart, after `latency` seconds.
+    `fail_rate` of calls raise a retryable LLMError.
+    """
+
+    def __init__(
+        self,
+        answer: str = "This is a canned answer from the fake LLM provider.",
+        latency: float = 0.0,
+        token_delay: float = 0.0,
+        fail_rate: float = 0.0
+    ):
+        self.answer = answer
+        self.latency = latency
+        self.token_delay = token_delay
+        self.fail_rate = fail_rate
+        self.calls = 0
+
+    async def _start(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail_rate and random.random() < self.fail_rate:
+            raise LLMError("Fake provider failure", retryable=True)
+
+    async def complete(self, system_prompt: str, question: str) -> str:
+        await self._start()
+        await asyncio.sleep(self.token_delay * len(self.answer.split()))
+        return self.answer
+
+    async def stream(self, system_prompt: str, question: str) -> AsyncIterator[str]:
+        await self._start()
+        for i, word in enumerate(self.answer.split()):
+            await asyncio.sleep(self.token_delay)
+            yield word if i == 0 else f" {word}"
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for
+    `reset_seconds`. Then one probe call is let through (half-open): success
+    closes the breaker, failure opens it again. A probe that never reports
+    back (e.g. cancelled) expires after another `reset_seconds`.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_seconds:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open":
+            return False
+        now = time.monotonic()
+        if self._probe_at is not None and now - self._probe_at < self.reset_seconds:
+            return False
+        self._probe_at = now
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probe_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_at = None
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+class LLMClient:
+    """
+    Resilience wrapper around a provider, shared by all requests of a worker:
+    a global concurrency limit, a per-attempt timeout, retries with full
+    jitter on retryable errors, and a circuit breaker. Raises LLMUnavailable
+    when the breaker is open, no slot frees up in time, or retries run out.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        max_concurrency: int,
+        timeout: float,
+        max_retries: int,
+        retry_base_seconds: float,
+        breaker: CircuitBreaker
+    ):
+        self.provider = provider
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.breaker = breaker
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def _slot(self):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            metrics.llm_calls.inc((("outcome", "saturated"),))
+            raise LLMUnavailable("LLM concurrency limit reached")
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def _admit(self) -> None:
+        if not self.breaker.allow():
+            metrics.llm_calls.inc((("outcome", "rejected"),))
+            raise LLMUnavailable("LLM circuit breaker is open")
+
+    async def _failed(self, e: Exception, attempt: int, retry: bool = True) -> None:
+        """Book a failed attempt; returns to retry after a jittered backoff, raises otherwise"""
+        timed_out = isinstance(e, asyncio.TimeoutError)
+        retryable = timed_out or getattr(e, "retryable", False)
+        metrics.llm_calls.inc((("outcome", "timeout" if timed_out else "error"),))
+        if not retryable:
+            # The provider answered; the request itself was bad
+            self.breaker.record_success()
+            raise e if isinstance(e, LLMError) else LLMError(str(e))
+
+        self.breaker.record_failure()
+        if not retry or attempt >= self.max_retries:
+            raise LLMUnavailable(f"LLM call failed after {attempt + 1} attempt(s): {str(e) or 'timeout'}") from e
+        await asyncio.sleep(random.uniform(0, self.retry_base_seconds * 2 ** attempt))
+
+    async def complete(self, system_prompt: str, question: str) -> str:
+        async with self._slot():
+            for attempt in range(self.max_retries + 1):
+                self._admit()
+                try:
+                    answer = await asyncio.wait_for(self.provider.complete(system_prompt, question), self.timeout)
+                except (LLMError, asyncio.TimeoutError) as e:
+                    await self._failed(e, attempt)
+                    continue
+                self.breaker.record_success()
+                metrics.llm_calls.inc((("outcome", "ok"),))
+                return answer
+
+    async def stream(self, system_prompt: str, question: str) -> AsyncIterator[str]:
+        """
+        Yield answer text as it arrives. `timeout` bounds the wait for each
+        chunk. Attempts are only retried before the first chunk; a failure
+        mid-answer raises LLMUnavailable, since the caller has already
+        relayed part of it.
+        """
+        async with self._slot():
+            for attempt in range(self.max_retries + 1):
+                self._admit()
+                started = False
+                async with aclosing(self.provider.stream(system_prompt, question)) as chunks:
+                    try:
+                        while True:
+                            try:
+                                text = await asyncio.wait_for(chunks.__anext__(), self.timeout)
+                            except StopAsyncIteration:
+                                break
+                            started = True
+                            yield text
+                    except (LLMError, asyncio.TimeoutError) as e:
+                        await self._failed(e, attempt, retry=not started)
+                        continue
+                self.breaker.record_success()
+                metrics.llm_calls.inc((("outcome", "ok"),))
+                return
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+def build_provider() -> LLMProvider:
+    if settings.LLM_PROVIDER == "fake":
+        return FakeProvider()
+    return GroqProvider(
+        api_key=settings.GROQ_API_KEY,
+        model=settings.GROQ_MODEL_NAME,
+        base_url=settings.GROQ_BASE_URL,
+        max_connections=settings.LLM_MAX_CONNECTIONS
+    )
+
+def build_client(provider: LLMProvider) -> LLMClient:
+    return LLMClient(
+        provider,
+        max_concurrency=settings.LLM_MAX_CONCURRENCY,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+        max_retries=settings.LLM_MAX_RETRIES,
+        retry_base_seconds=settings.LLM_RETRY_BASE_SECONDS,
+        breaker=CircuitBreaker(settings.LLM_BREAKER_FAILURES, settings.LLM_BREAKER_RESET_SECONDS)
+    )
+
+llm = build_client(build_provider())
@@ -0,0 +1,229 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Optional, Sequence, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values: Dict[Labels, float] = {}
+        # Sync routes and background threads update metrics too
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> list:
+        with self._lock:
+            values = list(self.values.items())
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_format_labels(k)} {v}" for k, v in values]
+        return lines
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last is +Inf), sum]
+        self.series: Dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> list:
+        with self._lock:
+            snapshot = [(labels, list(counts), total) for labels, (counts, total) in self.series.items()]
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = 'le="%s"' % bound
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+class _QueryStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+# Per-request query totals; the threadpool copies the context, so sync
+# routes and dependencies add to the same object the middleware created
+_request_queries: ContextVar[Optional[_QueryStats]] = ContextVar("request_queries", default=None)
+
+class MetricsRegistry:
+    """
+    Minimal in-process Prometheus registry. Counters and histograms lock
+    their own updates; queries outside a request (background jobs) are
+    summed under the registry lock. Values are per worker process.
+    """
+
+    def __init__(self):
+        self.requests = Counter("http_requests_total", "HTTP requests by method, route and status")
+        self.latency = Histogram("http_request_duration_seconds", "HTTP request latency", LATENCY_BUCKETS)
+        self.queries = Counter("db_queries_total", "SQL statements executed, by route")
+        self.query_seconds = Counter("db_query_duration_seconds_total", "Time spent in SQL statements, by route")
+        self.queries_per_request = Histogram(
+            "db_queries_per_request", "SQL statements per HTTP request", QUERY_COUNT_BUCKETS
+        )
+        self.pool_checkouts = Counter("db_pool_checkouts_total", "Connections checked out of the pool")
+        self.pool_checkouts.inc(amount=0)
+        self.cache_requests = Counter("cache_requests_total", "Cache lookups by cache and result")
+        self.cache_invalidations = Counter("cache_invalidations_total", "Cache entries dropped by writes")
+        self.llm_calls = Counter("llm_calls_total", "LLM provider attempts by outcome")
+        self._background = _QueryStats()
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, queries: _QueryStats) -> None:
+        route_labels = (("method", method), ("route", route))
+        self.requests.inc(route_labels + (("status", str(status)),))
+        self.latency.observe(route_labels, seconds)
+        if queries.count:
+            self.queries.inc((("route", route),), queries.count)
+            self.query_seconds.inc((("route", route),), queries.seconds)
+        self.queries_per_request.observe((("route", route),), queries.count)
+
+    def record_query(self, seconds: float) -> None:
+        stats = _request_queries.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            return
+        with self._lock:
+            self._background.count += 1
+            self._background.seconds += seconds
+
+    def instrument_engine(self, engine: Engine) -> None:
+        """Count statements, statement time and pool checkouts on `engine`"""
+        self._engine = engine
+
+        # The start time lives on the statement's execution context, which is
+        # discarded with it, so a statement that fails leaves nothing behind
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            context._metrics_start = time.perf_counter()
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            self.record_query(time.perf_counter() - context._metrics_start)
+
+        @event.listens_for(engine, "handle_error")
+        def _failed(exception_context):
+            started = getattr(exception_context.execution_context, "_metrics_start", None)
+            if started is not None:
+                self.record_query(time.perf_counter() - started)
+
+        @event.listens_for(engine.pool, "checkout")
+        def _checkout(dbapi_connection, connection_record, connection_proxy):
+            self.pool_checkouts.inc()
+
+    def render(self) -> str:
+        lines = []
+        for metric in (
+            self.requests, self.latency, self.queries, self.query_seconds, self.queries_per_request,
+            self.cache_requests, self.cache_invalidations, self.llm_calls
+        ):
+            lines += metric.render()
+
+        with self._lock:
+            background = (self._background.count, self._background.seconds)
+        lines += [
+            "# HELP db_background_queries_total SQL statements executed outside a request",
+            "# TYPE db_background_queries_total counter",
+            f"db_background_queries_total {background[0]}",
+            "# HELP db_background_query_duration_seconds_total Time spent in SQL outside a request",
+            "# TYPE db_background_query_duration_seconds_total counter",
+            f"db_background_query_duration_seconds_total {background[1]}",
+        ]
+        lines += self.pool_checkouts.render()
+
+        if self._engine is not None:
+            pool = self._engine.pool
+            for name, help_text, value in (
+                ("db_pool_size", "Configured pool size", pool.size()),
+                ("db_pool_checked_out", "Connections currently checked out", pool.checkedout()),
+                ("db_pool_overflow", "Connections open beyond pool_size", max(pool.overflow(), 0)),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+class MetricsMiddleware:
+    """
+    Records count, latency, status and SQL statements per route template
+    (e.g. /api/teams/{team_id}, never the raw path, to bound cardinality).
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+        self._route_paths: Dict[object, str] = {}
+
+    def _route_template(self, scope: Scope) -> str:
+        route = scope.get("route")
+        if route is not None:
+            return route.path
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            router = scope["app"].router
+            path = next((r.path for r in router.routes if getattr(r, "endpoint", None) is endpoint), "unmatched")
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = _QueryStats()
+        token = _request_queries.set(stats)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_queries.reset(token)
+            self.registry.record_request(scope["method"], self._route_template(scope), status, elapsed, stats)
@@ -0,0 +1,125 @@
+import logging
+import re
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger("app.nplusone")
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAMS = re.compile(r"%\(\w+\)s|%s|\?|:\w+")
+_PARAM_LISTS = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+def fingerprint(statement: str) -> str:
+    """Statement shape with literals and bind parameters (including expanded IN lists) collapsed"""
+    shape = _PARAMS.sub("?", _LITERALS.sub("?", statement))
+    shape = _PARAM_LISTS.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+def _app_stack() -> List[str]:
+    """Frames from our own code only; SQLAlchemy and framework frames are noise"""
+    frames = [f for f in traceback.extract_stack() if "/app/" in f.filename and "/core/nplusone" not in f.filename]
+    return traceback.format_list(frames)
+
+class QueryTracker:
+    """Counts statements by fingerprint; keeps one stack per repeated shape"""
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.total = 0
+        self.shapes: Counter = Counter()
+        self.stacks: Dict[str, List[str]] = {}
+
+    def record(self, statement: str) -> None:
+        self.total += 1
+        shape = fingerprint(statement)
+        self.shapes[shape] += 1
+        # Capture the stack once, when the shape first crosses the threshold
+        if self.shapes[shape] == self.threshold:
+            self.stacks[shape] = _app_stack()
+
+    def repeated(self) -> Dict[str, int]:
+        return {shape: n for shape, n in self.shapes.items() if n >= self.threshold}
+
+    def report(self) -> str:
+        lines = []
+        for shape, n in sorted(self.repeated().items(), key=lambda item: -item[1]):
+            lines.append(f"{n}x {shape}")
+            lines.extend("    " + frame.rstrip() for frame in self.stacks.get(shape, []))
+        return "\n".join(lines)
+
+_tracker: ContextVar[Optional[QueryTracker]] = ContextVar("nplusone_tracker", default=None)
+# Budgets see every statement in the process, since a test client may run
+# the app on another thread where the caller's context is not visible
+_budgets: List[QueryTracker] = []
+
+def install(engine: Engine) -> None:
+    """Feed every statement on `engine` to the active tracker, if any"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        tracker = _tracker.get()
+        if tracker is not None:
+            tracker.record(statement)
+        for budget in _budgets:
+            budget.record(statement)
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+@contextmanager
+def query_budget(max_queries: int, threshold: int = 3):
+    """
+    Fail when the block runs more than `max_queries` statements. Intended for
+    tests, e.g.:
+
+        with query_budget(4):
+            client.get(f"/api/teams/{team.id}")
+
+    The engine must have been passed to install() (NPLUSONE_DETECT does this).
+    """
+    tracker = QueryTracker(threshold)
+    _budgets.append(tracker)
+    try:
+        yield tracker
+    finally:
+        _budgets.remove(tracker)
+
+    if tracker.total > max_queries:
+        raise QueryBudgetExceeded(
+            f"{tracker.total} queries executed, budget is {max_queries}\n{tracker.report()}"
+        )
+
+class NPlusOneMiddleware:
+    """
+    Dev-mode detector: logs a warning naming the route, each statement shape
+    that ran `threshold` or more times in one request, and where it came from.
+    """
+
+    def __init__(self, app: ASGIApp, threshold: int = 5):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracker = QueryTracker(self.threshold)
+        token = _tracker.set(tracker)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _tracker.reset(token)
+            if tracker.repeated():
+                endpoint = getattr(scope.get("endpoint"), "__name__", "?")
+                logger.warning(
+                    "Possible N+1 in %s (%s %s, %d queries):\n%s",
+                    endpoint, scope["method"], scope["path"], tracker.total, tracker.report()
+                )
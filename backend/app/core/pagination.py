@@ -0,0 +1,82 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import tuple_
+from typing import Any, List, Optional, Tuple
+
+MAX_PAGE_SIZE = 100
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key of the last row as an opaque URL-safe token"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+def _python_type(column) -> Optional[type]:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+def decode_cursor(cursor: str, columns: List[Any]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor; raises ValueError if it is
+    malformed or a value does not fit its column's type, so a forged cursor
+    is rejected here rather than by the database.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(payload, list) or len(payload) != len(columns):
+        raise ValueError("Invalid cursor")
+
+    values = []
+    for column, value in zip(columns, payload):
+        expected = _python_type(column)
+        if value is None or expected is None:
+            pass
+        elif expected is datetime:
+            if not isinstance(value, str):
+                raise ValueError("Invalid cursor")
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                raise ValueError("Invalid cursor")
+        elif type(value) is not expected and not (expected is float and type(value) is int):
+            # Exact type match, so true/false are not accepted as integers
+            raise ValueError("Invalid cursor")
+        values.append(value)
+    return values
+
+def keyset_paginate(
+    query,
+    columns: List[Any],
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    descending: bool = True
+) -> Tuple[list, Optional[str]]:
+    """
+    Keyset (seek) pagination over a query ordered by `columns`, which must
+    end in a unique column such as the primary key. Every page is a single
+    index range scan, so deep pages cost the same as the first one.
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        # Row-value comparison; Postgres turns this into an index range scan
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*values) if descending else key > tuple_(*values))
+
+    order = [c.desc() for c in columns] if descending else [c.asc() for c in columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    return rows, next_cursor
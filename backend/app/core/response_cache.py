@@ -0,0 +1,206 @@
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+import orjson
+from app.core.config import settings
+from app.core import invalidation
+from app.core.etag import etag_matches
+from app.core.metrics import metrics
+
+# Validator headers carried over from the handler's injected Response
+_KEPT_HEADERS = ("etag", "last-modified", "cache-control")
+
+class _Entry:
+    __slots__ = ("body", "headers", "tags", "expires_at")
+
+    def __init__(self, body: bytes, headers: Dict[str, str], tags: Set[str], expires_at: float):
+        self.body = body
+        self.headers = headers
+        self.tags = tags
+        self.expires_at = expires_at
+
+class ResponseCache:
+    """
+    Size-bounded LRU of serialised JSON responses, each tagged with the
+    entities it was built from (e.g. project:12, team:7) so writes can drop
+    exactly the responses they make stale. Every tag has a version that
+    invalidation bumps, and the cache a generation that clear() bumps; a
+    response is only stored if neither moved while it was being built, so a
+    read racing a write never caches the pre-write body.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def version(self, tags: Iterable[str]) -> Tuple[int, Tuple[int, ...]]:
+        """Token to pass to set(); take it before reading the data the response is built from"""
+        with self._lock:
+            return self._generation, tuple(self._versions.get(tag, 0) for tag in tags)
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        headers: Dict[str, str],
+        tags: Iterable[str],
+        version: Optional[Tuple[int, Tuple[int, ...]]] = None
+    ) -> bool:
+        """Store a response; returns False, storing nothing, if `version` is stale"""
+        tags = list(tags)
+        entry = _Entry(body, headers, set(tags), time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            if version is not None and version != (
+                self._generation, tuple(self._versions.get(tag, 0) for tag in tags)
+            ):
+                return False
+            self._drop(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+        return True
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry carrying any of `tags`; returns how many were dropped"""
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+                keys |= self._by_tag.get(tag, set())
+            for key in keys:
+                self._drop(key)
+        if keys:
+            metrics.cache_invalidations.inc((("cache", "response"),), len(keys))
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_tag.clear()
+            # The generation bump covers responses in flight, so tag versions can restart
+            self._versions.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+response_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+
+def _evict(tags) -> None:
+    if "*" in tags or "response:*" in tags:
+        response_cache.clear()
+    else:
+        response_cache.invalidate_tags(*tags)
+
+invalidation.register(_evict)
+
+def _record(result: str) -> None:
+    metrics.cache_requests.inc((("cache", "response"), ("result", result)))
+
+def cached_response(*tags: str, response_model: Any = None):
+    """
+    Cache a GET handler's serialised response, keyed by path and query string.
+    `tags` are format strings over the handler's arguments, e.g.
+    "project:{project_id}". `response_model` must match the route's, so the
+    cached body is what FastAPI would have sent. Responses the handler returns
+    itself (304s, streams) and errors are never cached. Send
+    `X-Cache-Bypass: 1` to skip the lookup; the fresh response still refills
+    the entry.
+    """
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def decorator(handler):
+        signature = inspect.signature(handler)
+        wants_request = "request" in signature.parameters
+        parameters = list(signature.parameters.values())
+        if not wants_request:
+            parameters.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"] if wants_request else kwargs.pop("request")
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return await handler(*args, **kwargs)
+
+            key = f"{request.url.path}?{'&'.join(sorted(request.url.query.split('&')))}"
+            bypass = request.headers.get("x-cache-bypass") == "1"
+
+            if bypass:
+                _record("bypass")
+            else:
+                entry = response_cache.get(key)
+                if entry is not None:
+                    _record("hit")
+                    if_none_match = request.headers.get("if-none-match")
+                    if if_none_match and "etag" in entry.headers and etag_matches(if_none_match, entry.headers["etag"]):
+                        return Response(status_code=304, headers=entry.headers)
+                    return Response(
+                        content=entry.body,
+                        media_type="application/json",
+                        headers={**entry.headers, "X-Cache": "HIT"}
+                    )
+                _record("miss")
+
+            entry_tags = [tag.format(**kwargs) for tag in tags]
+            # Taken before the handler reads, so a write committed meanwhile voids the store
+            version = response_cache.version(entry_tags)
+            result = await handler(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+
+            if adapter is not None:
+                body = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+            else:
+                body = orjson.dumps(jsonable_encoder(result))
+
+            injected = kwargs.get("response")
+            headers = {}
+            if isinstance(injected, Response):
+                headers = {k: v for k, v in injected.headers.items() if k in _KEPT_HEADERS}
+
+            response_cache.set(key, body, headers, entry_tags, version)
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers={**headers, "X-Cache": "BYPASS" if bypass else "MISS"}
+            )
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)
+        return wrapper
+
+    return decorator
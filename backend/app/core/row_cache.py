@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import BinaryExpression, BindParameter, BooleanClauseList
+from app.core import invalidation
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.models import User, Team, Project
+
+class RowSnapshot:
+    """Immutable, compact copy of a row's hot columns; not attached to any session"""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class UserRow(RowSnapshot):
+    __slots__ = ("id", "email", "name", "role", "is_active", "department", "batch")
+
+class TeamRow(RowSnapshot):
+    __slots__ = ("id", "project_id", "leader_id", "name", "status", "is_locked")
+
+class ProjectRow(RowSnapshot):
+    __slots__ = ("id", "title", "branch", "batch", "deadline", "is_active")
+
+class RowCache:
+    """
+    Read-through primary-key cache of RowSnapshots for read-only lookups.
+    Committed data only: a request that modifies a row should keep using the
+    ORM instance. Every row has a version that eviction bumps, and the cache a
+    generation that bulk writes bump; a query result is only stored if neither
+    moved while it was in flight, so a racing write never leaves a stale entry.
+    Entries also expire after `ttl_seconds`, bounding staleness should an
+    invalidation be missed (e.g. while a worker's listener reconnects). Past
+    `maxsize` the least recently used entries are dropped.
+    """
+
+    def __init__(self, model, snapshot: Type[RowSnapshot], tag: str, maxsize: int, ttl_seconds: float):
+        self.model = model
+        self.snapshot = snapshot
+        self.tag = tag
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._columns = [getattr(model, name) for name in snapshot.__slots__]
+        # pk -> (expires_at, snapshot), least recently used first
+        self._rows: "OrderedDict[int, Tuple[float, RowSnapshot]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, pk: int) -> Optional[RowSnapshot]:
+        return self.get_many(db, [pk]).get(pk)
+
+    def get_many(self, db: Session, pks: Iterable[int]) -> Dict[int, RowSnapshot]:
+        """Snapshots by primary key; all misses are filled with one IN query. Unknown ids are omitted."""
+        found, missing = {}, {}
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generation
+            for pk in pks:
+                entry = self._rows.get(pk)
+                if entry is not None and entry[0] > now:
+                    found[pk] = entry[1]
+                    self._rows.move_to_end(pk)
+                else:
+                    if entry is not None:
+                        del self._rows[pk]
+                    missing[pk] = self._versions.get(pk, 0)
+
+        if missing:
+            rows = db.query(*self._columns).filter(self.model.id.in_(list(missing))).all()
+            loaded = {row.id: self.snapshot(*row) for row in rows}
+            found.update(loaded)
+            expires_at = time.monotonic() + self.ttl_seconds
+            with self._lock:
+                if self._generation == generation:
+                    for pk, snapshot in loaded.items():
+                        if self._versions.get(pk, 0) == missing[pk]:
+                            self._rows[pk] = (expires_at, snapshot)
+                    while len(self._rows) > self.maxsize:
+                        self._rows.popitem(last=False)
+        return found
+
+    def evict(self, pk: int) -> None:
+        with self._lock:
+            self._rows.pop(pk, None)
+            self._versions[pk] = self._versions.get(pk, 0) + 1
+
+    def evict_all(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._rows.clear()
+            # The generation bump covers queries in flight, so per-row versions can restart
+            self._versions.clear()
+
+user_rows = RowCache(User, UserRow, "user", settings.ROW_CACHE_MAXSIZE, settings.ROW_CACHE_TTL_SECONDS)
+team_rows = RowCache(Team, TeamRow, "team", settings.ROW_CACHE_MAXSIZE, settings.ROW_CACHE_TTL_SECONDS)
+project_rows = RowCache(Project, ProjectRow, "project", settings.ROW_CACHE_MAXSIZE, settings.ROW_CACHE_TTL_SECONDS)
+
+_caches = {cache.model: cache for cache in (user_rows, team_rows, project_rows)}
+_by_tag = {cache.tag: cache for cache in _caches.values()}
+
+def _evict(tags) -> None:
+    for tag in tags:
+        if tag == "*":
+            for cache in _caches.values():
+                cache.evict_all()
+            continue
+        prefix, _, key = tag.partition(":")
+        cache = _by_tag.get(prefix)
+        if cache is None:
+            continue
+        if key == "*":
+            cache.evict_all()
+        elif key.isdigit():
+            cache.evict(int(key))
+
+invalidation.register(_evict)
+
+# Unit-of-work writes: evict the row once the transaction commits, in every worker
+def _row_written(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        invalidation.invalidate(session, f"{_caches[type(target)].tag}:{target.id}")
+
+for _model in _caches:
+    event.listen(_model, "after_update", _row_written)
+    event.listen(_model, "after_delete", _row_written)
+
+def _pinned_keys(whereclause, cache: RowCache) -> Optional[List[int]]:
+    """Primary keys a WHERE clause restricts the statement to (`id = x` or `id IN (...)` ANDed in), else None"""
+    if whereclause is None:
+        return None
+    if isinstance(whereclause, BooleanClauseList) and whereclause.operator is operators.and_:
+        conjuncts = whereclause.clauses
+    else:
+        conjuncts = [whereclause]
+    for clause in conjuncts:
+        if not (isinstance(clause, BinaryExpression) and isinstance(clause.right, BindParameter)):
+            continue
+        column = clause.left
+        if getattr(column, "table", None) is not cache.model.__table__ or column.key != "id":
+            continue
+        value = clause.right.effective_value
+        if clause.operator is operators.eq and value is not None:
+            return [value]
+        if clause.operator is operators.in_op and value is not None:
+            return list(value)
+    return None
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _bulk_written(state) -> None:
+    """
+    Bulk UPDATE/DELETE statements evict the rows their WHERE clause pins by
+    primary key, or else the whole entity. INSERTs are ignored: plain inserts
+    only add rows, and misses are never cached; upserts must queue the tags
+    of the rows they overwrite at the call site.
+    """
+    if not (state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    cache = _caches.get(mapper.class_) if mapper is not None else None
+    if cache is None:
+        return
+    keys = _pinned_keys(state.statement.whereclause, cache)
+    if keys is None:
+        invalidation.invalidate(state.session, f"{cache.tag}:*")
+    else:
+        invalidation.invalidate(state.session, *(f"{cache.tag}:{key}" for key in keys))
@@ -1,5 +1,5 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.core.config import settings
 
 engine = create_engine(
@@ -18,6 +18,10 @@ SessionLocal = sessionmaker(
 
 Base = declarative_base()
 
+def advisory_xact_lock(db: Session, key: str) -> None:
+    """Wait for the Postgres advisory lock named `key`; it is held until the transaction ends"""
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtext(key))))
+
 def get_db():
     """Dependency for database session"""
     db = SessionLocal()
@@ -1,6 +1,13 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import MetricsMiddleware, metrics
+from app.core import nplusone
+from app.core import invalidation
+from app.core.llm import llm
 from app.db.database import engine, Base
 from app.routes.auth import router as auth_router
 from app.routes.admin import router as admin_router
@@ -8,7 +15,10 @@ from app.routes.projects import router as projects_router
 from app.routes.teams import router as teams_router
 from app.routes.submissions import router as submissions_router
 from app.routes.supervisor import router as supervisor_router
-from app.routes.chatbot import router as chatbot_router
+from app.routes.chatbot import router as chatbot_router, build_faq_index
+from app.routes.students import router as students_router
+from app.routes.batch import router as batch_router
+from app.services.stats_service import StatsService
 
 # Create database tables (with error handling)
 try:
@@ -23,7 +33,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     docs_url="/docs",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -33,8 +44,47 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
+# Response compression (brotli when available, else gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_BYTES,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
+# Metrics middleware (outermost, so latency includes compression)
+if settings.METRICS_ENABLED:
+    metrics.instrument_engine(engine)
+    app.add_middleware(MetricsMiddleware)
+
+# N+1 query detector (dev mode)
+if settings.NPLUSONE_DETECT:
+    nplusone.install(engine)
+    app.add_middleware(nplusone.NPlusOneMiddleware, threshold=settings.NPLUSONE_THRESHOLD)
+
+# Retrieval indexes
+@app.on_event("startup")
+async def build_indexes():
+    build_faq_index()
+
+# Background tasks
+@app.on_event("startup")
+async def start_background_tasks():
+    app.state.admin_stats_task = asyncio.create_task(StatsService.run_admin_stats_refresher())
+    app.state.invalidation_task = (
+        asyncio.create_task(invalidation.run_listener()) if settings.INVALIDATION_BUS_ENABLED else None
+    )
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    app.state.admin_stats_task.cancel()
+    if app.state.invalidation_task is not None:
+        app.state.invalidation_task.cancel()
+    await llm.aclose()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -44,6 +94,11 @@ async def health_check():
         "version": settings.APP_VERSION
     }
 
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(admin_router)
@@ -52,6 +107,8 @@ app.include_router(teams_router)
 app.include_router(submissions_router)
 app.include_router(supervisor_router)
 app.include_router(chatbot_router)
+app.include_router(students_router)
+app.include_router(batch_router)
 
 @app.get("/")
 async def root():
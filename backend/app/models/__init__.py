@@ -2,13 +2,13 @@
 from app.models.models import (
     User, Project, ProjectEnrollment, Team, TeamInvitation,
     Submission, SubmissionApproval, SubmissionFeedback,
-    SupervisorRequest, AdminLog, OTPToken, Notification, ChatSession,
+    SupervisorAssignment, SupervisorRequest, AdminLog, OTPToken, Notification, ChatSession,
     RoleEnum, SubmissionStageEnum, ApprovalStatusEnum, TeamStatusEnum
 )
 
 __all__ = [
     "User", "Project", "ProjectEnrollment", "Team", "TeamInvitation",
     "Submission", "SubmissionApproval", "SubmissionFeedback",
-    "SupervisorRequest", "AdminLog", "OTPToken", "Notification", "ChatSession",
+    "SupervisorAssignment", "SupervisorRequest", "AdminLog", "OTPToken", "Notification", "ChatSession",
     "RoleEnum", "SubmissionStageEnum", "ApprovalStatusEnum", "TeamStatusEnum"
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum, Text, ForeignKey, Table, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum, Text, ForeignKey, Table, Float, JSON, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -83,6 +83,13 @@ class Project(Base):
     # Relationships
     teams = relationship("Team", back_populates="project")
     enrollments = relationship("ProjectEnrollment", back_populates="project")
+    
+    __table_args__ = (
+        # Keyset pagination (newest first) and the list_projects filters
+        Index('ix_projects_created_at_id', 'created_at', 'id'),
+        Index('ix_projects_branch_batch_created_at', 'branch', 'batch', 'created_at', 'id'),
+        Index('ix_projects_is_active_deadline', 'is_active', 'deadline'),
+    )
 
 class ProjectEnrollment(Base):
     __tablename__ = "project_enrollments"
@@ -92,6 +99,10 @@ class ProjectEnrollment(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     enrolled_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (
+        UniqueConstraint('project_id', 'user_id', name='uq_project_enrollments_project_user'),
+    )
+    
     # Relationships
     project = relationship("Project", back_populates="enrollments")
     user = relationship("User")
@@ -100,11 +111,15 @@ class Team(Base):
     __tablename__ = "teams"
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False)
+    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False, index=True)
     leader_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     name = Column(String, nullable=False)
     status = Column(String, default=TeamStatusEnum.PENDING)
     is_locked = Column(Boolean, default=False)
+    # Denormalised counters, updated atomically by the membership/invitation routes
+    member_count = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_invitation_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rejected_invitation_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -114,12 +129,13 @@ class Team(Base):
     members = relationship("User", secondary=team_members_table, back_populates="teams")
     team_invitations = relationship("TeamInvitation", back_populates="team")
     submissions = relationship("Submission", back_populates="team")
+    supervisor_assignment = relationship("SupervisorAssignment", back_populates="team", uselist=False)
 
 class TeamInvitation(Base):
     __tablename__ = "team_invitations"
     
     id = Column(Integer, primary_key=True, index=True)
-    team_id = Column(Integer, ForeignKey('teams.id'), nullable=False)
+    team_id = Column(Integer, ForeignKey('teams.id'), nullable=False, index=True)
     invitee_email = Column(String, nullable=False)
     status = Column(String, default=ApprovalStatusEnum.PENDING)
     invited_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -137,9 +153,22 @@ class Submission(Base):
     file_url = Column(String, nullable=False)  # OneDrive URL
     uploaded_by = Column(Integer, ForeignKey('users.id'), nullable=False)
     approval_status = Column(String, default=ApprovalStatusEnum.PENDING)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    is_latest = Column(Boolean, nullable=False, default=True, server_default=text("true"))
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
     approved_at = Column(DateTime(timezone=True), nullable=True)
     
+    __table_args__ = (
+        UniqueConstraint('team_id', 'stage', 'version', name='uq_submissions_team_stage_version'),
+        # At most one current version per (team, stage); "current" lookups probe this index
+        Index(
+            'uq_submissions_team_stage_latest', 'team_id', 'stage',
+            unique=True,
+            postgresql_where=text('is_latest'),
+            sqlite_where=text('is_latest')
+        ),
+    )
+    
     # Relationships
     team = relationship("Team", back_populates="submissions")
     uploader = relationship("User", back_populates="submissions", foreign_keys=[uploaded_by])
@@ -150,7 +179,7 @@ class SubmissionApproval(Base):
     __tablename__ = "submission_approvals"
     
     id = Column(Integer, primary_key=True, index=True)
-    submission_id = Column(Integer, ForeignKey('submissions.id'), nullable=False)
+    submission_id = Column(Integer, ForeignKey('submissions.id'), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     status = Column(String, default=ApprovalStatusEnum.PENDING)  # pending, approved, rejected
     responded_at = Column(DateTime(timezone=True), nullable=True)
@@ -163,8 +192,8 @@ class SubmissionFeedback(Base):
     __tablename__ = "submission_feedbacks"
     
     id = Column(Integer, primary_key=True, index=True)
-    submission_id = Column(Integer, ForeignKey('submissions.id'), nullable=False)
-    supervisor_id = Column(Integer, ForeignKey('users.id'), nullable=True)
+    submission_id = Column(Integer, ForeignKey('submissions.id'), nullable=False, index=True)
+    supervisor_id = Column(Integer, ForeignKey('users.id'), nullable=True, index=True)
     admin_id = Column(Integer, ForeignKey('users.id'), nullable=True)
     supervisor_score = Column(Float, nullable=True)  # 0-10
     admin_score = Column(Float, nullable=True)  # 0-20
@@ -178,6 +207,19 @@ class SubmissionFeedback(Base):
     supervisor = relationship("User", back_populates="supervisor_feedbacks", foreign_keys=[supervisor_id])
     admin = relationship("User", back_populates="admin_feedbacks", foreign_keys=[admin_id])
 
+class SupervisorAssignment(Base):
+    __tablename__ = "supervisor_assignments"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey('projects.id'), nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey('teams.id'), unique=True, nullable=False)
+    supervisor_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
+    assigned_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    team = relationship("Team", back_populates="supervisor_assignment")
+    supervisor = relationship("User")
+
 class SupervisorRequest(Base):
     __tablename__ = "supervisor_requests"
     
@@ -207,6 +249,10 @@ class AdminLog(Base):
     
     # Relationships
     admin = relationship("User", back_populates="admin_logs")
+    
+    __table_args__ = (
+        Index('ix_admin_logs_created_at_id', 'created_at', 'id'),
+    )
 
 class OTPToken(Base):
     __tablename__ = "otp_tokens"
@@ -243,3 +289,7 @@ class ChatSession(Base):
     
     # Relationships
     user = relationship("User")
+    
+    __table_args__ = (
+        Index('ix_chat_sessions_user_created_at_id', 'user_id', 'created_at', 'id'),
+    )
@@ -1,11 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
-from app.models.models import User, SupervisorRequest, AdminLog
-from app.schemas.schemas import SupervisorRequestCreate, SupervisorRequestResponse, SupervisorRequestApproveRequest
+from app.models.models import User, Project, SupervisorRequest, AdminLog
+from app.schemas.schemas import (
+    SupervisorRequestCreate, SupervisorRequestResponse, SupervisorRequestApproveRequest,
+    SupervisorAssignmentResult, TeamFormationResult, RosterImportResult, AdminLogListResponse
+)
 from app.services.auth_service import AuthService, UserService
 from app.services.email_service import EmailService
-from typing import List
+from app.services.assignment_service import AssignmentService
+from app.services.stats_service import StatsService
+from app.services.team_formation_service import TeamFormationService
+from app.services.roster_service import RosterService
+from app.services.export_service import ExportService
+from app.services.dashboard_service import DashboardService
+from app.core.config import settings
+from app.core.pagination import keyset_paginate
+from app.core.response_cache import cached_response
+from app.core import invalidation
+from typing import List, Optional
+import io
 import json
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -19,6 +35,7 @@ def get_current_user(db: Session = Depends(get_db)) -> User:
     pass
 
 @router.get("/requests", response_model=List[SupervisorRequestResponse])
+@cached_response("supervisor_requests", response_model=List[SupervisorRequestResponse])
 async def get_supervisor_requests(db: Session = Depends(get_db)):
     """
     Get all pending supervisor access requests
@@ -70,6 +87,7 @@ async def approve_supervisor_request(
     )
     db.add(log)
     
+    invalidation.invalidate(db, "supervisor_requests")
     db.commit()
     
     # Send approval email
@@ -113,6 +131,7 @@ async def reject_supervisor_request(
     )
     db.add(log)
     
+    invalidation.invalidate(db, "supervisor_requests")
     db.commit()
     
     # Send rejection email
@@ -123,31 +142,182 @@ async def reject_supervisor_request(
         "message": "Supervisor request rejected"
     }
 
-@router.get("/logs")
-async def get_admin_logs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.post("/projects/{project_id}/assign-supervisors", response_model=SupervisorAssignmentResult)
+async def auto_assign_supervisors(
+    project_id: int,
+    dry_run: bool = False,
+    capacity: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
     """
-    Get admin action logs for audit trail
+    Bulk-assign unassigned teams of a project to supervisors of the same
+    department, balancing current review load. Use dry_run to preview.
     """
-    logs = db.query(AdminLog).order_by(AdminLog.created_at.desc()).offset(skip).limit(limit).all()
-    return logs
+    project = db.query(Project).filter(Project.id == project_id).first()
+    
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if capacity is not None and capacity < 1:
+        raise HTTPException(status_code=400, detail="Capacity must be at least 1")
+    
+    result = AssignmentService.auto_assign(project, db, capacity=capacity, dry_run=dry_run)
+    
+    if not dry_run:
+        # Log admin action
+        if current_user:
+            log = AdminLog(
+                admin_id=current_user.id,
+                action="auto_assign_supervisors",
+                resource_type="project",
+                resource_id=project_id,
+                details={
+                    "total_assigned": result["total_assigned"],
+                    "unassigned": len(result["unassigned_team_ids"])
+                }
+            )
+            db.add(log)
+        
+        db.commit()
+    
+    return result
 
-@router.get("/stats")
-async def get_admin_stats(db: Session = Depends(get_db)):
+@router.post("/projects/{project_id}/form-teams", response_model=TeamFormationResult)
+async def auto_form_teams(
+    project_id: int,
+    team_size: Optional[int] = None,
+    group_by_department: bool = False,
+    group_by_batch: bool = False,
+    dry_run: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
     """
-    Get admin dashboard statistics
+    Put every enrolled student without a team into auto-formed teams,
+    optionally grouped by department/batch. Use dry_run to preview.
     """
-    from sqlalchemy import func
+    project = db.query(Project).filter(Project.id == project_id).first()
     
-    total_users = db.query(func.count(User.id)).scalar()
-    total_supervisors = db.query(func.count(User.id)).filter(User.role == "supervisor").scalar()
-    total_students = db.query(func.count(User.id)).filter(User.role == "student").scalar()
-    pending_requests = db.query(func.count(SupervisorRequest.id)).filter(
-        SupervisorRequest.status == "pending"
-    ).scalar()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    team_size = team_size or settings.AUTO_TEAM_SIZE
+    if team_size < 1:
+        raise HTTPException(status_code=400, detail="Team size must be at least 1")
+    
+    result = TeamFormationService.form_teams(
+        project,
+        db,
+        team_size=team_size,
+        group_by_department=group_by_department,
+        group_by_batch=group_by_batch,
+        dry_run=dry_run
+    )
+    
+    if not dry_run:
+        # Log admin action
+        if current_user:
+            log = AdminLog(
+                admin_id=current_user.id,
+                action="auto_form_teams",
+                resource_type="project",
+                resource_id=project_id,
+                details={
+                    "total_students": result["total_students"],
+                    "total_teams": result["total_teams"],
+                    "team_size": team_size
+                }
+            )
+            db.add(log)
+        
+        DashboardService.clear(db)
+        db.commit()
+    
+    return result
+
+@router.post("/students/import", response_model=RosterImportResult)
+async def import_students(
+    file: UploadFile = File(...),
+    project_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Import a CSV roster (email, name, student_id, department, batch),
+    optionally enrolling every imported student into a project
+    """
+    if project_id is not None:
+        project = db.query(Project.id).filter(Project.id == project_id).first()
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+    
+    # Stream the spooled upload line by line instead of reading it into memory
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = await run_in_threadpool(RosterService.import_students, lines, db, project_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="CSV must be UTF-8 encoded")
+    finally:
+        lines.detach()
+    
+    # Log admin action
+    if current_user:
+        log = AdminLog(
+            admin_id=current_user.id,
+            action="import_students",
+            resource_type="user",
+            details={
+                "filename": file.filename,
+                "total_rows": report["total_rows"],
+                "imported": report["imported"],
+                "errors": len(report["errors"]),
+                "project_id": project_id
+            }
+        )
+        db.add(log)
+        db.commit()
+    
+    return report
+
+@router.get("/export/grades")
+async def export_department_grades(branch: str, format: str = "csv"):
+    """
+    Stream grades for every project of a department (CSV or XLSX)
+    """
+    try:
+        content, media_type = ExportService.stream(format, branch=branch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": ExportService.content_disposition(f"{branch}_grades.{format}")}
+    )
+
+@router.get("/logs", response_model=AdminLogListResponse)
+async def get_admin_logs(cursor: Optional[str] = None, limit: int = 100, db: Session = Depends(get_db)):
+    """
+    Get admin action logs for audit trail, newest first, with cursor pagination
+    """
+    try:
+        logs, next_cursor = keyset_paginate(
+            db.query(AdminLog), [AdminLog.created_at, AdminLog.id], cursor, limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return {
-        "total_users": total_users,
-        "total_supervisors": total_supervisors,
-        "total_students": total_students,
-        "pending_requests": pending_requests
+        "logs": logs,
+        "next_cursor": next_cursor
     }
+
+@router.get("/stats")
+async def get_admin_stats():
+    """
+    Get admin dashboard statistics (snapshot refreshed in the background)
+    """
+    return StatsService.get_admin_stats()
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.schemas.schemas import BatchRequest
+from app.core.batch import SubRequestError, plan_batch, run_batch
+from app.core.config import settings
+
+router = APIRouter(prefix="/api/batch", tags=["batch"])
+
+@router.post("")
+async def batch(batch_request: BatchRequest, request: Request):
+    """
+    Run several GET requests against the API in one round-trip.
+    Sub-requests run in-process and concurrently, each with its own
+    database session, share this request's credentials, and come back in
+    request order.
+    """
+    try:
+        plan_batch(
+            request.app,
+            batch_request.requests,
+            settings.BATCH_MAX_REQUESTS,
+            settings.BATCH_MAX_COST
+        )
+    except SubRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    content = await run_batch(
+        request.app,
+        request.scope,
+        batch_request.requests,
+        concurrency=settings.BATCH_CONCURRENCY,
+        timeout=settings.BATCH_SUBREQUEST_TIMEOUT_SECONDS
+    )
+    
+    return Response(content=content, media_type="application/json")
@@ -1,16 +1,22 @@
+import json
+from contextlib import aclosing
+from functools import lru_cache
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
-from app.models.models import ChatSession, User
+from app.models.models import ChatSession
 from app.schemas.schemas import ChatbotQuestion, ChatbotResponse
-from groq import Groq
 from app.core.config import settings
+from app.core.faq_index import faq_index
+from app.core.llm import LLMError, LLMUnavailable, llm
+from app.core.pagination import keyset_paginate
+from app.core.row_cache import user_rows
+from typing import List, Optional
 
 router = APIRouter(prefix="/api/chatbot", tags=["chatbot"])
 
-# Initialize Groq client
-client = Groq(api_key=settings.GROQ_API_KEY)
-
 # FAQ knowledge base
 FAQ_DATABASE = {
     "enrollment": [
@@ -81,15 +87,70 @@ FAQ_DATABASE = {
     ]
 }
 
-def get_faq_context() -> str:
-    """Generate FAQ context for RAG"""
+FAQ_FALLBACK_ANSWER = (
+    "The assistant is unavailable right now. Please check the FAQ or contact "
+    "your project supervisor or the department admin for help."
+)
+
+FAQ_ENTRIES = [
+    {"category": category, **item}
+    for category, items in FAQ_DATABASE.items()
+    for item in items
+]
+
+def build_faq_index() -> None:
+    """Index the FAQ; called once at startup"""
+    faq_index.build(
+        FAQ_ENTRIES,
+        embedding_model=settings.RAG_EMBEDDING_MODEL if settings.FAQ_EMBEDDINGS_ENABLED else None
+    )
+
+def format_faq(entries: List[dict]) -> str:
     context = "FAQ Database:\n\n"
-    for category, items in FAQ_DATABASE.items():
-        context += f"## {category.upper()}\n"
-        for item in items:
-            context += f"Q: {item['q']}\nA: {item['a']}\n\n"
+    for entry in entries:
+        context += f"## {entry['category'].upper()}\nQ: {entry['q']}\nA: {entry['a']}\n\n"
     return context
 
+def get_faq_context(question: str) -> str:
+    """FAQ entries relevant to the question, for RAG"""
+    if not faq_index.ready:
+        build_faq_index()
+    entries = faq_index.retrieve(question, settings.FAQ_TOP_K)
+    if not entries:
+        return "FAQ Database: no entry matches this question.\n"
+    return format_faq(entries)
+
+@lru_cache(maxsize=None)
+def system_prompt_prefix(role: str) -> str:
+    """Question-independent part of the system prompt, kept byte-identical per role"""
+    return f"""You are a helpful assistant for the DPG Project Management System. 
+Your role is to help students, supervisors, and admins with questions about the system.
+
+User Role: {role}
+
+Based on the FAQ below and your knowledge, answer the user's question helpfully.
+If the question is not related to the system, politely redirect them to the FAQ.
+Keep answers concise and clear.
+
+"""
+
+def build_system_prompt(role: str, question: str) -> str:
+    """System prompt for a user of the given role: the role prefix plus the top FAQ entries for the question"""
+    return system_prompt_prefix(role) + get_faq_context(question)
+
+def faq_only_answer(question: str) -> str:
+    """Best FAQ match for the question, served while the LLM is unavailable"""
+    if not faq_index.ready:
+        build_faq_index()
+    entries = faq_index.retrieve(question, 1)
+    if not entries:
+        return FAQ_FALLBACK_ANSWER
+    best = entries[0]
+    return f"{best['a']}\n\n(The assistant is busy right now, so this is the closest FAQ answer: \"{best['q']}\")"
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
 @router.post("/ask", response_model=ChatbotResponse)
 async def ask_chatbot(
     question: ChatbotQuestion,
@@ -100,40 +161,19 @@ async def ask_chatbot(
     RAG-based chatbot using Groq LLM and FAQ knowledge base
     """
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = user_rows.get(db, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Build context with FAQ
-        faq_context = get_faq_context()
-        role_specific = f"User Role: {user.role}\n"
-        
-        # System prompt
-        system_prompt = f"""You are a helpful assistant for the DPG Project Management System. 
-Your role is to help students, supervisors, and admins with questions about the system.
-
-{role_specific}
-
-{faq_context}
-
-Based on the FAQ above and your knowledge, answer the user's question helpfully.
-If the question is not related to the system, politely redirect them to the FAQ.
-Keep answers concise and clear."""
-        
-        # Call Groq API
-        message = client.messages.create(
-            model=settings.GROQ_MODEL_NAME,
-            max_tokens=1024,
-            system=system_prompt,
-            messages=[
-                {
-                    "role": "user",
-                    "content": question.question
-                }
-            ]
-        )
+        system_prompt = build_system_prompt(user.role, question.question)
         
-        answer = message.content[0].text
+        # Call the LLM; degrade to the FAQ when it is down or overloaded
+        degraded = False
+        try:
+            answer = await llm.complete(system_prompt, question.question)
+        except LLMUnavailable:
+            answer = faq_only_answer(question.question)
+            degraded = True
         
         # Save chat session
         chat_session = ChatSession(
@@ -148,30 +188,103 @@ Keep answers concise and clear."""
         return ChatbotResponse(
             answer=answer,
             session_id=chat_session.id,
-            created_at=chat_session.created_at
+            created_at=chat_session.created_at,
+            degraded=degraded
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error processing chatbot request: {str(e)}"
         )
 
+@router.post("/ask/stream")
+async def ask_chatbot_stream(
+    question: ChatbotQuestion,
+    user_id: int,  # From JWT token
+    db: Session = Depends(get_db)
+):
+    """
+    Streaming variant of /ask: relays the answer as Server-Sent Events.
+    Emits `token` events ({"text"}) as the model generates, then one `done`
+    event ({"session_id", "created_at", "degraded"}) after the ChatSession is
+    saved, or an `error` event. If the LLM is unavailable before the first
+    token, the FAQ answer is sent as a single token. If the client
+    disconnects, the upstream call is cancelled and nothing is saved.
+    """
+    user = user_rows.get(db, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    system_prompt = build_system_prompt(user.role, question.question)
+    
+    async def events():
+        parts = []
+        degraded = False
+        try:
+            # aclosing() shuts the upstream stream as soon as this generator is cancelled or closed
+            async with aclosing(llm.stream(system_prompt, question.question)) as tokens:
+                async for text in tokens:
+                    parts.append(text)
+                    yield _sse("token", {"text": text})
+        except LLMUnavailable as e:
+            if parts:
+                yield _sse("error", {"detail": f"Error processing chatbot request: {str(e)}"})
+                return
+            parts = [faq_only_answer(question.question)]
+            degraded = True
+            yield _sse("token", {"text": parts[0]})
+        except LLMError as e:
+            yield _sse("error", {"detail": f"Error processing chatbot request: {str(e)}"})
+            return
+        
+        # Save chat session once the answer is complete
+        chat_session = ChatSession(
+            user_id=user_id,
+            question=question.question,
+            answer="".join(parts)
+        )
+        db.add(chat_session)
+        db.commit()
+        db.refresh(chat_session)
+        
+        yield _sse("done", {
+            "session_id": chat_session.id,
+            "created_at": chat_session.created_at,
+            "degraded": degraded
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/sessions")
 async def get_chat_history(
     user_id: int,  # From JWT token
     limit: int = 50,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get chat history for a user
+    Get chat history for a user, newest first, with cursor pagination
     """
-    sessions = db.query(ChatSession).filter(
-        ChatSession.user_id == user_id
-    ).order_by(ChatSession.created_at.desc()).limit(limit).all()
+    try:
+        sessions, next_cursor = keyset_paginate(
+            db.query(ChatSession).filter(ChatSession.user_id == user_id),
+            [ChatSession.created_at, ChatSession.id],
+            cursor,
+            limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return {
         "user_id": user_id,
+        "next_cursor": next_cursor,
         "sessions": [
             {
                 "id": s.id,
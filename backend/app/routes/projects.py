@@ -1,13 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, load_only, selectinload
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from app.db.database import get_db
 from app.models.models import Project, Team, Submission, SubmissionFeedback, User
-from app.schemas.schemas import ProjectCreate, ProjectResponse, LeaderboardEntry, LeaderboardResponse
+from app.schemas.schemas import (
+    ProjectCreate, ProjectResponse, ProjectListResponse, ProjectEnrollRequest,
+    LeaderboardEntry, LeaderboardResponse
+)
 from app.core.security import JWTHandler
+from app.core.pagination import keyset_paginate
+from app.core.etag import conditional_get
+from app.core.response_cache import cached_response
+from app.core import invalidation
 from app.services.email_service import EmailService
+from app.services.enrollment_service import EnrollmentService
+from app.services.export_service import ExportService
+from app.services.project_service import ProjectService
+from app.services.validator_service import ValidatorService
+from app.services.dashboard_service import DashboardService
 import secrets
 from datetime import datetime
+from typing import Optional
 import json
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
@@ -35,28 +50,72 @@ async def create_project(
     )
     
     db.add(new_project)
+    invalidation.invalidate(db, "projects")
     db.commit()
     db.refresh(new_project)
     
     return new_project
 
-@router.get("/", response_model=list[ProjectResponse])
+@router.get("/", response_model=ProjectListResponse)
+@cached_response("projects", response_model=ProjectListResponse)
 async def list_projects(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    branch: Optional[str] = None,
+    batch: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
     db: Session = Depends(get_db)
 ):
     """
-    List all projects
+    List projects, newest first, with optional filters and cursor pagination
     """
-    projects = db.query(Project).order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
-    return projects
+    query = db.query(Project)
+    
+    if branch is not None:
+        query = query.filter(Project.branch == branch)
+    if batch is not None:
+        query = query.filter(Project.batch == batch)
+    if is_active is not None:
+        query = query.filter(Project.is_active == is_active)
+    if deadline_from is not None:
+        query = query.filter(Project.deadline >= deadline_from)
+    if deadline_to is not None:
+        query = query.filter(Project.deadline <= deadline_to)
+    
+    etag, last_modified = ValidatorService.project_list(query, str(request.query_params))
+    not_modified = conditional_get(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+    
+    try:
+        projects, next_cursor = keyset_paginate(query, [Project.created_at, Project.id], cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "projects": projects,
+        "next_cursor": next_cursor
+    }
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, db: Session = Depends(get_db)):
+@cached_response("project:{project_id}", response_model=ProjectResponse)
+async def get_project(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get project details
     """
+    validator = ValidatorService.project(project_id, db)
+    
+    if not validator:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    not_modified = conditional_get(request, response, *validator)
+    if not_modified:
+        return not_modified
+    
     project = db.query(Project).filter(Project.id == project_id).first()
     
     if not project:
@@ -64,6 +123,22 @@ async def get_project(project_id: int, db: Session = Depends(get_db)):
     
     return project
 
+@router.post("/enroll")
+async def enroll_with_token(
+    request: ProjectEnrollRequest,
+    user_id: int,  # From JWT token
+    db: Session = Depends(get_db)
+):
+    """
+    Student enrolls in a project using only the enrollment token
+    """
+    project_id = EnrollmentService.resolve_token(request.token, db)
+    
+    if project_id is None:
+        raise HTTPException(status_code=400, detail="Invalid enrollment token")
+    
+    return _enroll(project_id, user_id, db)
+
 @router.post("/{project_id}/enroll")
 async def enroll_in_project(
     project_id: int,
@@ -74,34 +149,27 @@ async def enroll_in_project(
     """
     Student enrolls in a project using token
     """
-    from app.models.models import ProjectEnrollment
-    
-    project = db.query(Project).filter(Project.id == project_id).first()
-    
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
     # Verify token
-    if project.enrollment_token != token:
+    if EnrollmentService.resolve_token(token, db) != project_id:
         raise HTTPException(status_code=400, detail="Invalid enrollment token")
     
-    # Check if already enrolled
-    existing = db.query(ProjectEnrollment).filter(
-        ProjectEnrollment.project_id == project_id,
-        ProjectEnrollment.user_id == user_id
-    ).first()
+    return _enroll(project_id, user_id, db)
+
+def _enroll(project_id: int, user_id: int, db: Session) -> dict:
+    """Single-statement enrollment shared by both enroll routes"""
+    try:
+        enrolled = EnrollmentService.enroll(project_id, user_id, db)
+        if enrolled:
+            DashboardService.invalidate_users([user_id], db)
+        db.commit()
+    except IntegrityError:
+        # Project deleted after its token was cached, or unknown user
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Project or user not found")
     
-    if existing:
+    if not enrolled:
         raise HTTPException(status_code=400, detail="Already enrolled in this project")
     
-    # Create enrollment
-    enrollment = ProjectEnrollment(
-        project_id=project_id,
-        user_id=user_id
-    )
-    db.add(enrollment)
-    db.commit()
-    
     return {
         "status": "success",
         "message": "Enrolled in project",
@@ -109,61 +177,75 @@ async def enroll_in_project(
     }
 
 @router.get("/{project_id}/leaderboard", response_model=LeaderboardResponse)
-async def get_project_leaderboard(project_id: int, db: Session = Depends(get_db)):
+async def get_project_leaderboard(
+    project_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """
     Get final leaderboard for a project
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    validator = ValidatorService.leaderboard(project_id, db)
     
-    if not project:
+    if not validator:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Get all teams for this project with their final scores
-    teams = db.query(Team).filter(Team.project_id == project_id).all()
+    not_modified = conditional_get(request, response, *validator)
+    if not_modified:
+        return not_modified
+    
+    # Get all teams for this project with their members' names
+    teams = db.query(Team).options(
+        load_only(Team.id, Team.name),
+        selectinload(Team.members).load_only(User.name)
+    ).filter(Team.project_id == project_id).all()
+    team_ids = [team.id for team in teams]
+    
+    # Supervisor average over every scored feedback, per team
+    supervisor_avgs = dict(db.query(
+        Submission.team_id, func.avg(SubmissionFeedback.supervisor_score)
+    ).join(
+        SubmissionFeedback, SubmissionFeedback.submission_id == Submission.id
+    ).filter(
+        Submission.team_id.in_(team_ids),
+        SubmissionFeedback.supervisor_score != None
+    ).group_by(Submission.team_id).all())
+    
+    # Latest admin score per team
+    admin_scores = dict(db.query(
+        Submission.team_id, SubmissionFeedback.admin_score
+    ).join(
+        SubmissionFeedback, SubmissionFeedback.submission_id == Submission.id
+    ).filter(
+        Submission.team_id.in_(team_ids),
+        SubmissionFeedback.admin_score != None
+    ).order_by(
+        Submission.team_id, SubmissionFeedback.created_at.desc()
+    ).distinct(Submission.team_id).all())
+    
+    # Submission time of each team's current final submission
+    submission_times = dict(db.query(Submission.team_id, Submission.submitted_at).filter(
+        Submission.team_id.in_(team_ids),
+        Submission.stage == "final_submission",
+        Submission.is_latest == True
+    ).all())
     
     entries = []
     
     for idx, team in enumerate(teams, 1):
-        # Calculate supervisor average
-        supervisor_feedbacks = db.query(SubmissionFeedback).join(
-            Submission
-        ).filter(
-            Submission.team_id == team.id,
-            SubmissionFeedback.supervisor_score != None
-        ).all()
-        
-        supervisor_avg = 0
-        if supervisor_feedbacks:
-            supervisor_avg = sum(fb.supervisor_score for fb in supervisor_feedbacks) / len(supervisor_feedbacks)
-        
-        # Get admin score (latest feedback)
-        admin_feedback = db.query(SubmissionFeedback).join(
-            Submission
-        ).filter(
-            Submission.team_id == team.id,
-            SubmissionFeedback.admin_score != None
-        ).order_by(SubmissionFeedback.created_at.desc()).first()
-        
-        admin_score = admin_feedback.admin_score if admin_feedback else 0
+        supervisor_avg = supervisor_avgs.get(team.id) or 0
+        admin_score = admin_scores.get(team.id) or 0
         
         # Calculate final score (max 30)
         final_score = supervisor_avg + admin_score
         
-        # Get submission time
-        submission = db.query(Submission).filter(
-            Submission.team_id == team.id,
-            Submission.stage == "final_submission"
-        ).order_by(Submission.submitted_at.asc()).first()
-        
-        submission_time = submission.submitted_at if submission else datetime.now()
-        
-        # Get team members names
-        members = [member.name for member in team.members]
+        submission_time = submission_times.get(team.id) or datetime.now()
         
         entry = LeaderboardEntry(
             rank=idx,
             team_name=team.name,
-            members=members,
+            members=[member.name for member in team.members],
             supervisor_avg=round(supervisor_avg, 2),
             admin_score=admin_score,
             final_score=round(final_score, 2),
@@ -184,6 +266,27 @@ async def get_project_leaderboard(project_id: int, db: Session = Depends(get_db)
         total_teams=len(teams)
     )
 
+@router.get("/{project_id}/export")
+async def export_project_grades(project_id: int, format: str = "csv", db: Session = Depends(get_db)):
+    """
+    Stream one row per student with stage-wise scores, final score and rank (CSV or XLSX)
+    """
+    project = db.query(Project.id).filter(Project.id == project_id).first()
+    
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    try:
+        content, media_type = ExportService.stream(format, project_ids=[project_id])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": ExportService.content_disposition(f"project_{project_id}_grades.{format}")}
+    )
+
 @router.put("/{project_id}")
 async def update_project(
     project_id: int,
@@ -204,6 +307,8 @@ async def update_project(
     project.batch = project_update.batch
     project.deadline = project_update.deadline
     
+    DashboardService.clear(db)
+    invalidation.invalidate(db, f"project:{project_id}", "projects")
     db.commit()
     db.refresh(project)
     
@@ -212,17 +317,22 @@ async def update_project(
 @router.delete("/{project_id}")
 async def delete_project(project_id: int, db: Session = Depends(get_db)):
     """
-    Delete a project
+    Delete a project with its teams, submissions, feedback and enrollments
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    token = db.query(Project.enrollment_token).filter(Project.id == project_id).scalar()
     
-    if not project:
+    if not token:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(project)
+    result = ProjectService.delete_project(project_id, db)
+    EnrollmentService.forget_token(token, db)
+    DashboardService.clear(db)
+    # Teams, submissions and feedback of the project went with it
+    invalidation.invalidate(db, "response:*")
     db.commit()
     
     return {
         "status": "success",
-        "message": "Project deleted"
+        "message": "Project deleted",
+        **result
     }
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.services.dashboard_service import DashboardService
+from typing import Optional
+
+router = APIRouter(prefix="/api/students", tags=["students"])
+
+@router.get("/me/dashboard")
+async def get_my_dashboard(
+    user_id: int,  # From JWT token
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Student dashboard in one call: profile, enrolled projects, teams with
+    members, current submission per stage with feedback, and notifications.
+    `fields` is a comma-separated subset of those sections.
+    """
+    try:
+        selected = DashboardService.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    dashboard = DashboardService.get_dashboard(user_id, db, selected)
+    
+    if dashboard is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    return dashboard
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, File, UploadFile
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from app.db.database import get_db
 from app.models.models import (
-    Submission, SubmissionApproval, SubmissionFeedback, Team, User,
+    Submission, SubmissionApproval, SubmissionFeedback, Team,
     ApprovalStatusEnum, SubmissionStageEnum
 )
 from app.schemas.schemas import (
@@ -10,6 +12,14 @@ from app.schemas.schemas import (
     SupervisorFeedbackRequest, AdminFeedbackRequest
 )
 from app.services.email_service import EmailService
+from app.services.stats_service import StatsService
+from app.services.submission_service import SubmissionService
+from app.services.validator_service import ValidatorService
+from app.services.dashboard_service import DashboardService
+from app.core.etag import conditional_get
+from app.core.response_cache import cached_response
+from app.core import invalidation
+from app.core.row_cache import team_rows, user_rows
 
 router = APIRouter(prefix="/api/submissions", tags=["submissions"])
 
@@ -39,17 +49,14 @@ async def upload_submission(
     if stage not in valid_stages:
         raise HTTPException(status_code=400, detail=f"Invalid stage. Must be one of {valid_stages}")
     
-    # Create submission
-    submission = Submission(
-        team_id=team_id,
-        stage=stage,
-        file_url=file_url,
-        uploaded_by=user_id,
-        approval_status=ApprovalStatusEnum.PENDING
-    )
+    # Create submission as the next version for this stage
+    submission = SubmissionService.create_version(team_id, stage, file_url, user_id, db)
     
-    db.add(submission)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Another submission for this stage is in progress, please retry")
     db.refresh(submission)
     
     # Create approval records for all team members (except leader)
@@ -62,10 +69,11 @@ async def upload_submission(
             )
             db.add(approval)
     
+    DashboardService.invalidate_users([member.id for member in team.members], db)
     db.commit()
     
     # Send emails to members for approval
-    leader = db.query(User).filter(User.id == user_id).first()
+    leader = user_rows.get(db, user_id)
     for member in team.members:
         if member.id != user_id:
             EmailService.send_team_invitation_email(
@@ -115,6 +123,8 @@ async def approve_submission(
         
         if all_approved:
             submission.approval_status = ApprovalStatusEnum.APPROVED
+            submission.approved_at = func.now()
+            DashboardService.invalidate_team(submission.team_id, db)
             db.commit()
             
             # Notify supervisor
@@ -123,6 +133,8 @@ async def approve_submission(
     else:
         # No approvals needed, mark as approved
         submission.approval_status = ApprovalStatusEnum.APPROVED
+        submission.approved_at = func.now()
+        DashboardService.invalidate_team(submission.team_id, db)
         db.commit()
     
     return {
@@ -144,11 +156,28 @@ async def get_submission(submission_id: int, db: Session = Depends(get_db)):
     return submission
 
 @router.get("/team/{team_id}")
-async def get_team_submissions(team_id: int, db: Session = Depends(get_db)):
+async def get_team_submissions(
+    team_id: int,
+    request: Request,
+    response: Response,
+    latest_only: bool = False,
+    db: Session = Depends(get_db)
+):
     """
-    Get all submissions for a team
+    Get all submissions for a team (only the current version per stage if latest_only)
     """
-    submissions = db.query(Submission).filter(Submission.team_id == team_id).all()
+    not_modified = conditional_get(
+        request, response, *ValidatorService.team_submissions(team_id, db, str(request.query_params))
+    )
+    if not_modified:
+        return not_modified
+    
+    query = db.query(Submission).filter(Submission.team_id == team_id)
+    
+    if latest_only:
+        query = query.filter(Submission.is_latest == True)
+    
+    submissions = query.order_by(Submission.stage, Submission.version.desc()).all()
     
     return {
         "team_id": team_id,
@@ -156,6 +185,8 @@ async def get_team_submissions(team_id: int, db: Session = Depends(get_db)):
             {
                 "id": s.id,
                 "stage": s.stage,
+                "version": s.version,
+                "is_latest": s.is_latest,
                 "file_url": s.file_url,
                 "approval_status": s.approval_status,
                 "submitted_at": s.submitted_at
@@ -164,6 +195,25 @@ async def get_team_submissions(team_id: int, db: Session = Depends(get_db)):
         ]
     }
 
+@router.get("/team/{team_id}/{stage}/current", response_model=SubmissionResponse)
+async def get_current_submission(team_id: int, stage: str, db: Session = Depends(get_db)):
+    """
+    Get the current (latest) submission of a team for a stage
+    """
+    submission = SubmissionService.get_current(team_id, stage, db)
+    
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    
+    return submission
+
+@router.get("/team/{team_id}/{stage}/history", response_model=list[SubmissionResponse])
+async def get_submission_history(team_id: int, stage: str, db: Session = Depends(get_db)):
+    """
+    Get every version of a team's submission for a stage, newest first
+    """
+    return SubmissionService.get_history(team_id, stage, db)
+
 @router.post("/{submission_id}/supervisor-feedback")
 async def add_supervisor_feedback(
     submission_id: int,
@@ -184,10 +234,15 @@ async def add_supervisor_feedback(
         SubmissionFeedback.supervisor_id != None
     ).first()
     
+    # Published with whichever commit below records the feedback
+    DashboardService.invalidate_team(submission.team_id, db)
+    invalidation.invalidate(db, f"submission:{submission_id}")
+    
     if existing_feedback:
         existing_feedback.supervisor_score = feedback.score
         existing_feedback.comments = feedback.comments
         existing_feedback.resubmission_deadline = feedback.resubmission_deadline
+        StatsService.invalidate_supervisor_stats(existing_feedback.supervisor_id, db)
         db.commit()
         feedback_id = existing_feedback.id
     else:
@@ -203,8 +258,8 @@ async def add_supervisor_feedback(
         feedback_id = new_feedback.id
     
     # Send feedback email to team leader
-    team = submission.team
-    leader = db.query(User).filter(User.id == team.leader_id).first()
+    team = team_rows.get(db, submission.team_id)
+    leader = user_rows.get(db, team.leader_id)
     
     EmailService.send_submission_feedback_email(
         leader.email,
@@ -241,6 +296,10 @@ async def add_admin_feedback(
         SubmissionFeedback.admin_id != None
     ).first()
     
+    # Published with whichever commit below records the feedback
+    DashboardService.invalidate_team(submission.team_id, db)
+    invalidation.invalidate(db, f"submission:{submission_id}")
+    
     if existing_feedback:
         existing_feedback.admin_score = feedback.score
         existing_feedback.comments = feedback.comments
@@ -265,6 +324,7 @@ async def add_admin_feedback(
     }
 
 @router.get("/{submission_id}/feedback")
+@cached_response("submission:{submission_id}")
 async def get_submission_feedback(submission_id: int, db: Session = Depends(get_db)):
     """
     Get all feedback for a submission
@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.db.database import get_db
-from app.models.models import Submission, SubmissionFeedback, Team, User
+from app.models.models import Submission, SubmissionFeedback, SupervisorAssignment, Team
 from app.services.email_service import EmailService
+from app.services.stats_service import StatsService
+from app.services.dashboard_service import DashboardService
+from app.core import invalidation
+from app.core.row_cache import team_rows, user_rows
 
 router = APIRouter(prefix="/api/supervisor", tags=["supervisor"])
 
@@ -12,14 +16,37 @@ async def get_pending_submissions(
     db: Session = Depends(get_db)
 ):
     """
-    Get all pending submissions assigned to supervisor
-    Note: Need to implement supervisor assignment logic
+    Get all submissions of teams assigned to supervisor that they have not scored yet
     """
-    # TODO: Implement supervisor assignment to teams/projects
-    # For now, return empty list
+    reviewed = db.query(SubmissionFeedback.id).filter(
+        SubmissionFeedback.submission_id == Submission.id,
+        SubmissionFeedback.supervisor_id == user_id
+    ).exists()
+    
+    rows = db.query(Submission, Team.name).join(
+        Team, Team.id == Submission.team_id
+    ).join(
+        SupervisorAssignment, SupervisorAssignment.team_id == Submission.team_id
+    ).filter(
+        SupervisorAssignment.supervisor_id == user_id,
+        Submission.is_latest == True,
+        ~reviewed
+    ).order_by(Submission.submitted_at.asc()).all()
+    
     return {
         "supervisor_id": user_id,
-        "submissions": []
+        "submissions": [
+            {
+                "id": s.id,
+                "team_id": s.team_id,
+                "team_name": team_name,
+                "stage": s.stage,
+                "file_url": s.file_url,
+                "approval_status": s.approval_status,
+                "submitted_at": s.submitted_at
+            }
+            for s, team_name in rows
+        ]
     }
 
 @router.get("/submissions/{submission_id}")
@@ -31,7 +58,10 @@ async def get_submission_detail(
     """
     Get submission details for review
     """
-    submission = db.query(Submission).filter(Submission.id == submission_id).first()
+    # Submission and team in one joined query, members in a second one
+    submission = db.query(Submission).options(
+        joinedload(Submission.team).selectinload(Team.members)
+    ).filter(Submission.id == submission_id).first()
     
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
@@ -83,12 +113,15 @@ async def score_submission(
     )
     
     db.add(feedback)
+    StatsService.invalidate_supervisor_stats(user_id, db)
+    DashboardService.invalidate_team(submission.team_id, db)
+    invalidation.invalidate(db, f"submission:{submission_id}")
     db.commit()
     db.refresh(feedback)
     
     # Send notification to team leader
-    team = submission.team
-    leader = db.query(User).filter(User.id == team.leader_id).first()
+    team = team_rows.get(db, submission.team_id)
+    leader = user_rows.get(db, team.leader_id)
     
     EmailService.send_submission_feedback_email(
         leader.email,
@@ -111,21 +144,6 @@ async def get_supervisor_stats(
     db: Session = Depends(get_db)
 ):
     """
-    Get supervisor statistics
+    Get supervisor statistics with a per-stage breakdown
     """
-    from sqlalchemy import func
-    
-    # Get stats for this supervisor
-    feedback_count = db.query(func.count(SubmissionFeedback.id)).filter(
-        SubmissionFeedback.supervisor_id == user_id
-    ).scalar()
-    
-    avg_score = db.query(func.avg(SubmissionFeedback.supervisor_score)).filter(
-        SubmissionFeedback.supervisor_id == user_id
-    ).scalar() or 0
-    
-    return {
-        "supervisor_id": user_id,
-        "total_submissions_reviewed": feedback_count,
-        "average_score_given": round(avg_score, 2)
-    }
+    return StatsService.get_supervisor_stats(user_id, db)
@@ -1,15 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from sqlalchemy import case, func, insert, literal, select, union_all, update, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.models import (
     Team, TeamInvitation, User, Submission,
-    SubmissionApproval, ApprovalStatusEnum, TeamStatusEnum
+    SubmissionApproval, ApprovalStatusEnum, TeamStatusEnum, team_members_table
 )
 from app.schemas.schemas import (
     TeamCreate, TeamResponse, TeamDetailResponse,
-    TeamInviteRequest, TeamInvitationApproveRequest
+    TeamInviteRequest, TeamInvitationApproveRequest,
+    TeamBulkInviteRequest, TeamBulkInviteResponse
 )
 from app.services.email_service import EmailService
+from app.services.validator_service import ValidatorService
+from app.services.dashboard_service import DashboardService
+from app.core.etag import conditional_get
+from app.core.response_cache import cached_response
+from app.core import invalidation
+from app.core.row_cache import project_rows, team_rows, user_rows
 
 router = APIRouter(prefix="/api/teams", tags=["teams"])
 
@@ -23,8 +32,7 @@ async def create_team(
     Student creates a new team for a project
     """
     # Verify project exists
-    from app.models.models import Project
-    project = db.query(Project).filter(Project.id == team.project_id).first()
+    project = project_rows.get(db, team.project_id)
     
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -34,25 +42,37 @@ async def create_team(
         project_id=team.project_id,
         leader_id=user_id,
         name=team.name,
-        status=TeamStatusEnum.PENDING
+        status=TeamStatusEnum.PENDING,
+        member_count=1
     )
     
     db.add(new_team)
-    db.commit()
-    db.refresh(new_team)
+    db.flush()
     
     # Add leader to members
-    leader = db.query(User).filter(User.id == user_id).first()
-    new_team.members.append(leader)
+    db.execute(insert(team_members_table).values(team_id=new_team.id, user_id=user_id))
+    DashboardService.invalidate_users([user_id], db)
     db.commit()
+    db.refresh(new_team)
     
     return new_team
 
 @router.get("/{team_id}", response_model=TeamDetailResponse)
-async def get_team(team_id: int, db: Session = Depends(get_db)):
+async def get_team(team_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get team details with members and invitations
     """
+    validator = ValidatorService.team(team_id, db)
+    
+    if not validator:
+        raise HTTPException(status_code=404, detail="Team not found")
+    
+    not_modified = conditional_get(request, response, *validator)
+    if not_modified:
+        return not_modified
+    
+    # Lazy loading already costs one query per collection whatever the team
+    # size; selectinload and load_only measured slower (app.cli.bench_detail_endpoints)
     team = db.query(Team).filter(Team.id == team_id).first()
     
     if not team:
@@ -70,7 +90,7 @@ async def invite_member(
     """
     Team leader invites a member
     """
-    team = db.query(Team).filter(Team.id == team_id).first()
+    team = team_rows.get(db, team_id)
     
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
@@ -96,11 +116,16 @@ async def invite_member(
     )
     
     db.add(invitation)
+    db.execute(
+        update(Team).where(Team.id == team_id).values(
+            pending_invitation_count=Team.pending_invitation_count + 1
+        )
+    )
     db.commit()
     db.refresh(invitation)
     
     # Send email
-    leader = db.query(User).filter(User.id == user_id).first()
+    leader = user_rows.get(db, user_id)
     EmailService.send_team_invitation_email(
         invite_request.invitee_email,
         team.name,
@@ -114,6 +139,115 @@ async def invite_member(
         "invitation_id": invitation.id
     }
 
+@router.post("/{team_id}/invite/bulk", response_model=TeamBulkInviteResponse)
+async def bulk_invite_members(
+    team_id: int,
+    invite_request: TeamBulkInviteRequest,
+    user_id: int,  # From JWT token
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """
+    Team leader invites several members at once; emails are sent after the response
+    """
+    row = db.query(Team, User.name).join(
+        User, User.id == Team.leader_id
+    ).filter(Team.id == team_id).first()
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Team not found")
+    
+    team, leader_name = row
+    
+    # Check if user is team leader
+    if team.leader_id != user_id:
+        raise HTTPException(status_code=403, detail="Only team leader can invite members")
+    
+    # De-duplicate while keeping request order
+    emails = []
+    duplicates = []
+    for email in invite_request.invitee_emails:
+        if email in emails:
+            duplicates.append(email)
+        else:
+            emails.append(email)
+    results = dict.fromkeys(emails)
+    
+    # Existing pending invitations and memberships in one round-trip
+    existing = db.execute(union_all(
+        select(
+            TeamInvitation.invitee_email.label("email"),
+            literal("already_invited", String).label("reason")
+        ).where(
+            TeamInvitation.team_id == team_id,
+            TeamInvitation.invitee_email.in_(emails),
+            TeamInvitation.status == ApprovalStatusEnum.PENDING
+        ),
+        select(
+            User.email.label("email"),
+            literal("already_member", String).label("reason")
+        ).join(
+            team_members_table, team_members_table.c.user_id == User.id
+        ).where(
+            team_members_table.c.team_id == team_id,
+            User.email.in_(emails)
+        )
+    )).all()
+    
+    for email, reason in existing:
+        # Membership wins over a stale pending invitation
+        if results.get(email) != "already_member":
+            results[email] = reason
+    
+    new_emails = [email for email in emails if results[email] is None]
+    invitation_ids = {}
+    if new_emails:
+        inserted = db.execute(
+            insert(TeamInvitation).returning(TeamInvitation.id, TeamInvitation.invitee_email),
+            [
+                {
+                    "team_id": team_id,
+                    "invitee_email": email,
+                    "status": ApprovalStatusEnum.PENDING
+                }
+                for email in new_emails
+            ]
+        ).all()
+        invitation_ids = {email: invitation_id for invitation_id, email in inserted}
+        db.execute(
+            update(Team).where(Team.id == team_id).values(
+                pending_invitation_count=Team.pending_invitation_count + len(new_emails)
+            )
+        )
+        db.commit()
+        
+        # Send emails asynchronously over one SMTP session
+        background_tasks.add_task(
+            EmailService.send_team_invitation_emails,
+            [
+                (email, f"http://localhost:3000/teams/{team_id}/invitations/{invitation_ids[email]}")
+                for email in new_emails
+            ],
+            team.name,
+            leader_name
+        )
+    
+    return {
+        "team_id": team_id,
+        "invited": len(new_emails),
+        "results": [
+            {
+                "email": email,
+                "status": results[email] or "invited",
+                "invitation_id": invitation_ids.get(email)
+            }
+            for email in emails
+        ] + [
+            {"email": email, "status": "duplicate"}
+            for email in duplicates
+        ]
+    }
+
 @router.post("/{team_id}/invitations/{invitation_id}/respond")
 async def respond_to_invitation(
     team_id: int,
@@ -125,7 +259,7 @@ async def respond_to_invitation(
     """
     Team member accepts or rejects invitation
     """
-    invitation = db.query(TeamInvitation).filter(
+    invitation = db.query(TeamInvitation.invitee_email).filter(
         TeamInvitation.id == invitation_id,
         TeamInvitation.team_id == team_id
     ).first()
@@ -134,37 +268,65 @@ async def respond_to_invitation(
         raise HTTPException(status_code=404, detail="Invitation not found")
     
     # Get user by email
-    user = db.query(User).filter(User.email == invitation.invitee_email).first()
+    invitee_id = db.query(User.id).filter(User.email == invitation.invitee_email).scalar()
     
-    if not user:
+    if not invitee_id:
         raise HTTPException(status_code=404, detail="User not found")
     
-    team = db.query(Team).filter(Team.id == team_id).first()
-    
+    # Claim the pending invitation; a concurrent or repeated response loses here
+    claimed = db.execute(
+        update(TeamInvitation).where(
+            TeamInvitation.id == invitation_id,
+            TeamInvitation.status == ApprovalStatusEnum.PENDING
+        ).values(
+            status=ApprovalStatusEnum.APPROVED if approve else ApprovalStatusEnum.REJECTED,
+            responded_at=func.now()
+        )
+    ).rowcount
+    
+    if not claimed:
+        raise HTTPException(status_code=400, detail="Invitation already responded")
+    
+    joined = 0
     if approve:
-        # Add user to team
-        if user not in team.members:
-            team.members.append(user)
-        invitation.status = ApprovalStatusEnum.APPROVED
-    else:
-        invitation.status = ApprovalStatusEnum.REJECTED
-    
-    # Check if all members have approved
-    all_invitations = db.query(TeamInvitation).filter(
-        TeamInvitation.team_id == team_id
-    ).all()
-    
-    all_approved = all(inv.status == ApprovalStatusEnum.APPROVED for inv in all_invitations)
-    
-    if all_approved and len(team.members) > 1:
-        team.status = TeamStatusEnum.ACTIVE
-    
+        # Add user to team; the primary key makes this an existence probe
+        joined = db.execute(
+            pg_insert(team_members_table).values(
+                team_id=team_id,
+                user_id=invitee_id
+            ).on_conflict_do_nothing()
+        ).rowcount
+    
+    # Update counters and decide activation in one conditional UPDATE.
+    # SET expressions see the pre-update row, hence the deltas in the CASE.
+    rejected = 0 if approve else 1
+    team_status = db.execute(
+        update(Team).where(Team.id == team_id).values(
+            member_count=Team.member_count + joined,
+            pending_invitation_count=Team.pending_invitation_count - 1,
+            rejected_invitation_count=Team.rejected_invitation_count + rejected,
+            status=case(
+                (
+                    (Team.status == TeamStatusEnum.PENDING)
+                    & (Team.pending_invitation_count - 1 == 0)
+                    & (Team.rejected_invitation_count + rejected == 0)
+                    & (Team.member_count + joined > 1),
+                    TeamStatusEnum.ACTIVE.value
+                ),
+                else_=Team.status
+            )
+        ).returning(Team.status)
+    ).scalar()
+    
+    # Members are queried after the insert, so the new member is included
+    DashboardService.invalidate_team(team_id, db)
+    invalidation.invalidate(db, f"team:{team_id}")
     db.commit()
     
     return {
         "status": "success",
         "message": "Response recorded",
-        "team_status": team.status
+        "team_status": team_status
     }
 
 @router.post("/{team_id}/lock")
@@ -189,6 +351,7 @@ async def lock_team(
     
     team.is_locked = True
     team.status = TeamStatusEnum.LOCKED
+    DashboardService.invalidate_team(team_id, db)
     db.commit()
     
     return {
@@ -197,15 +360,19 @@ async def lock_team(
     }
 
 @router.get("/{team_id}/members")
+@cached_response("team:{team_id}")
 async def get_team_members(team_id: int, db: Session = Depends(get_db)):
     """
     Get all team members
     """
-    team = db.query(Team).filter(Team.id == team_id).first()
-    
-    if not team:
+    if team_rows.get(db, team_id) is None:
         raise HTTPException(status_code=404, detail="Team not found")
     
+    member_ids = db.execute(
+        select(team_members_table.c.user_id).where(team_members_table.c.team_id == team_id)
+    ).scalars().all()
+    members = user_rows.get_many(db, member_ids)
+    
     return {
         "team_id": team_id,
         "members": [
@@ -215,6 +382,6 @@ async def get_team_members(team_id: int, db: Session = Depends(get_db)):
                 "email": member.email,
                 "role": member.role
             }
-            for member in team.members
+            for member in members.values()
         ]
     }
@@ -4,13 +4,17 @@ from app.schemas.schemas import *
 __all__ = [
     "LoginRequest", "OTPVerifyRequest", "OTPVerifyResponse", "AdminLoginRequest",
     "UserBase", "UserCreate", "UserResponse",
-    "ProjectCreate", "ProjectResponse", "ProjectEnrollRequest",
-    "TeamCreate", "TeamInviteRequest", "TeamResponse", "TeamDetailResponse",
+    "ProjectCreate", "ProjectResponse", "ProjectListResponse", "ProjectEnrollRequest",
+    "BatchSubRequest", "BatchRequest",
+    "TeamCreate", "TeamInviteRequest", "TeamBulkInviteRequest", "TeamBulkInviteResult", "TeamBulkInviteResponse", "TeamResponse", "TeamDetailResponse",
     "TeamInvitationResponse", "TeamInvitationApproveRequest",
     "SubmissionUploadRequest", "SubmissionApprovalRequest", "SubmissionResponse",
     "SupervisorFeedbackRequest", "AdminFeedbackRequest", "FeedbackResponse",
     "SupervisorRequestCreate", "SupervisorRequestResponse", "SupervisorRequestApproveRequest",
+    "SupervisorAssignmentEntry", "SupervisorAssignmentResult",
+    "TeamFormationEntry", "TeamFormationResult",
+    "RosterImportError", "RosterImportResult",
     "LeaderboardEntry", "LeaderboardResponse",
     "ChatbotQuestion", "ChatbotResponse",
-    "NotificationResponse", "AdminLogResponse"
+    "NotificationResponse", "AdminLogResponse", "AdminLogListResponse"
 ]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 # Auth Schemas
 class LoginRequest(BaseModel):
@@ -71,9 +71,23 @@ class ProjectResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ProjectListResponse(BaseModel):
+    projects: List[ProjectResponse]
+    next_cursor: Optional[str] = None
+
 class ProjectEnrollRequest(BaseModel):
     token: str
 
+# Batch Schemas
+class BatchSubRequest(BaseModel):
+    id: Optional[str] = None
+    method: str = "GET"
+    path: str  # e.g. /api/teams/7/members?user_id=3
+    headers: Optional[Dict[str, str]] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
 # Team Schemas
 class TeamCreate(BaseModel):
     name: str
@@ -82,6 +96,19 @@ class TeamCreate(BaseModel):
 class TeamInviteRequest(BaseModel):
     invitee_email: EmailStr
 
+class TeamBulkInviteRequest(BaseModel):
+    invitee_emails: List[EmailStr] = Field(..., min_length=1, max_length=50)
+
+class TeamBulkInviteResult(BaseModel):
+    email: str
+    status: str  # invited, already_invited, already_member, duplicate
+    invitation_id: Optional[int] = None
+
+class TeamBulkInviteResponse(BaseModel):
+    team_id: int
+    invited: int
+    results: List[TeamBulkInviteResult]
+
 class TeamResponse(BaseModel):
     id: int
     name: str
@@ -89,6 +116,7 @@ class TeamResponse(BaseModel):
     is_locked: bool
     leader_id: int
     project_id: int
+    member_count: int
     created_at: datetime
     
     class Config:
@@ -125,6 +153,8 @@ class SubmissionResponse(BaseModel):
     id: int
     team_id: int
     stage: str
+    version: int
+    is_latest: bool
     file_url: str
     approval_status: str
     submitted_at: datetime
@@ -178,6 +208,49 @@ class SupervisorRequestApproveRequest(BaseModel):
     request_id: int
     approve: bool
 
+# Supervisor Assignment Schemas
+class SupervisorAssignmentEntry(BaseModel):
+    team_id: int
+    team_name: str
+    supervisor_id: int
+    supervisor_name: str
+
+class SupervisorAssignmentResult(BaseModel):
+    project_id: int
+    dry_run: bool
+    total_assigned: int
+    assignments: List[SupervisorAssignmentEntry]
+    unassigned_team_ids: List[int]
+    supervisor_loads: dict
+
+# Roster Import Schemas
+class RosterImportError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    error: str
+
+class RosterImportResult(BaseModel):
+    total_rows: int
+    imported: int
+    enrolled: int
+    errors: List[RosterImportError]
+
+# Team Formation Schemas
+class TeamFormationEntry(BaseModel):
+    team_id: Optional[int] = None
+    team_name: str
+    leader_id: int
+    member_ids: List[int]
+    department: Optional[str] = None
+    batch: Optional[str] = None
+
+class TeamFormationResult(BaseModel):
+    project_id: int
+    dry_run: bool
+    total_students: int
+    total_teams: int
+    teams: List[TeamFormationEntry]
+
 # Leaderboard Schemas
 class LeaderboardEntry(BaseModel):
     rank: int
@@ -201,6 +274,7 @@ class ChatbotResponse(BaseModel):
     answer: str
     session_id: int
     created_at: datetime
+    degraded: bool = False  # LLM unavailable, answer taken from the FAQ
 
 # Notification Schemas
 class NotificationResponse(BaseModel):
@@ -227,5 +301,9 @@ class AdminLogResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class AdminLogListResponse(BaseModel):
+    logs: List[AdminLogResponse]
+    next_cursor: Optional[str] = None
+
 # Update forward references for Pydantic V2
 TeamDetailResponse.model_rebuild()
@@ -1,5 +1,15 @@
 # Services module init
 from app.services.auth_service import AuthService, UserService
 from app.services.email_service import EmailService, NotificationService
+from app.services.assignment_service import AssignmentService
+from app.services.stats_service import StatsService
+from app.services.submission_service import SubmissionService
+from app.services.team_formation_service import TeamFormationService
+from app.services.roster_service import RosterService
+from app.services.enrollment_service import EnrollmentService
+from app.services.export_service import ExportService
+from app.services.project_service import ProjectService
+from app.services.validator_service import ValidatorService
+from app.services.dashboard_service import DashboardService
 
-__all__ = ["AuthService", "UserService", "EmailService", "NotificationService"]
+__all__ = ["AuthService", "UserService", "EmailService", "NotificationService", "AssignmentService", "StatsService", "SubmissionService", "TeamFormationService", "RosterService", "EnrollmentService", "ExportService", "ProjectService", "ValidatorService", "DashboardService"]
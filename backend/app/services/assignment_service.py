@@ -0,0 +1,130 @@
+import heapq
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from app.models.models import Project, Team, User, SupervisorAssignment, RoleEnum
+from app.core.config import settings
+from app.db.database import advisory_xact_lock
+from typing import Dict, List, Optional, Tuple
+
+class AssignmentService:
+    """Supervisor assignment business logic"""
+
+    @staticmethod
+    def plan_assignments(
+        team_ids: List[int],
+        supervisor_ids: List[int],
+        loads: Dict[int, int],
+        capacity: int
+    ) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """
+        Greedy least-loaded assignment using a min-heap keyed on current load.
+        Returns (team_id, supervisor_id) pairs and the team ids left unassigned
+        once every supervisor is at capacity.
+        """
+        heap = [
+            (loads.get(supervisor_id, 0), supervisor_id)
+            for supervisor_id in supervisor_ids
+            if loads.get(supervisor_id, 0) < capacity
+        ]
+        heapq.heapify(heap)
+
+        assignments = []
+        for idx, team_id in enumerate(team_ids):
+            if not heap:
+                return assignments, team_ids[idx:]
+
+            load, supervisor_id = heapq.heappop(heap)
+            assignments.append((team_id, supervisor_id))
+
+            load += 1
+            if load < capacity:
+                heapq.heappush(heap, (load, supervisor_id))
+
+        return assignments, []
+
+    @staticmethod
+    def auto_assign(
+        project: Project,
+        db: Session,
+        capacity: Optional[int] = None,
+        dry_run: bool = False
+    ) -> dict:
+        """
+        Assign every unassigned team of a project to a supervisor of the same
+        department. Rows are written with a single bulk insert; the caller
+        owns the transaction and must commit.
+        """
+        capacity = capacity or settings.SUPERVISOR_MAX_TEAMS
+
+        if not dry_run:
+            # Runs drawing on the same supervisors go one at a time: a second
+            # run waits here, then sees the first run's teams as assigned and
+            # its loads as taken
+            advisory_xact_lock(db, f"assign_supervisors:{project.branch}")
+
+        supervisors = db.query(User.id, User.name).filter(
+            User.role == RoleEnum.SUPERVISOR,
+            User.is_active == True,
+            User.department_supervisor == project.branch
+        ).order_by(User.id).all()
+        supervisor_names = {s.id: s.name for s in supervisors}
+
+        # Current review load across all projects, in one grouped query
+        loads = dict(
+            db.query(
+                SupervisorAssignment.supervisor_id,
+                func.count(SupervisorAssignment.id)
+            ).filter(
+                SupervisorAssignment.supervisor_id.in_(list(supervisor_names))
+            ).group_by(SupervisorAssignment.supervisor_id).all()
+        ) if supervisor_names else {}
+
+        # Teams without an assignment (anti-join)
+        teams = db.query(Team.id, Team.name).outerjoin(
+            SupervisorAssignment, SupervisorAssignment.team_id == Team.id
+        ).filter(
+            Team.project_id == project.id,
+            SupervisorAssignment.id == None
+        ).order_by(Team.id).all()
+        team_names = {t.id: t.name for t in teams}
+
+        assignments, unassigned = AssignmentService.plan_assignments(
+            [t.id for t in teams],
+            list(supervisor_names),
+            loads,
+            capacity
+        )
+
+        if assignments and not dry_run:
+            db.execute(
+                insert(SupervisorAssignment),
+                [
+                    {
+                        "project_id": project.id,
+                        "team_id": team_id,
+                        "supervisor_id": supervisor_id
+                    }
+                    for team_id, supervisor_id in assignments
+                ]
+            )
+
+        final_loads = {supervisor_id: loads.get(supervisor_id, 0) for supervisor_id in supervisor_names}
+        for _, supervisor_id in assignments:
+            final_loads[supervisor_id] += 1
+
+        return {
+            "project_id": project.id,
+            "dry_run": dry_run,
+            "total_assigned": len(assignments),
+            "assignments": [
+                {
+                    "team_id": team_id,
+                    "team_name": team_names[team_id],
+                    "supervisor_id": supervisor_id,
+                    "supervisor_name": supervisor_names[supervisor_id]
+                }
+                for team_id, supervisor_id in assignments
+            ],
+            "unassigned_team_ids": unassigned,
+            "supervisor_loads": final_loads
+        }
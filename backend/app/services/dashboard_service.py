@@ -0,0 +1,167 @@
+from collections import defaultdict
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.models import (
+    User, Project, ProjectEnrollment, Team, Submission, SubmissionFeedback, Notification,
+    team_members_table
+)
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core import invalidation
+from typing import Iterable, Optional, Set
+
+DASHBOARD_SECTIONS = ("profile", "projects", "teams", "submissions", "notifications")
+
+_dashboard_cache = TTLCache(ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS, maxsize=4096)
+
+def _evict(tags) -> None:
+    for tag in tags:
+        if tag in ("*", "dashboard:*"):
+            _dashboard_cache.clear()
+        elif tag.startswith("dashboard:"):
+            _dashboard_cache.invalidate(int(tag.split(":", 1)[1]))
+
+invalidation.register(_evict)
+
+class DashboardService:
+    """Student dashboard assembled from a fixed number of batched queries"""
+
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> Set[str]:
+        """Comma-separated section names -> set; raises ValueError on unknown names"""
+        if not fields:
+            return set(DASHBOARD_SECTIONS)
+        requested = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = requested - set(DASHBOARD_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown dashboard fields: {', '.join(sorted(unknown))}")
+        return requested
+
+    @staticmethod
+    def get_dashboard(user_id: int, db: Session, fields: Optional[Set[str]] = None) -> Optional[dict]:
+        """Cached dashboard for a student, trimmed to `fields`; None if the user does not exist"""
+        dashboard = _dashboard_cache.get(user_id)
+        if dashboard is None:
+            dashboard = DashboardService.build_dashboard(user_id, db)
+            if dashboard is None:
+                return None
+            _dashboard_cache.set(user_id, dashboard)
+
+        if fields is None:
+            return dashboard
+        return {key: value for key, value in dashboard.items() if key in fields}
+
+    @staticmethod
+    def build_dashboard(user_id: int, db: Session, notification_limit: int = 20) -> Optional[dict]:
+        """
+        Seven queries regardless of how many projects, teams, members,
+        submissions or feedback rows the student has: user, projects,
+        teams, members, current submissions, feedback, notifications.
+        """
+        user = db.query(
+            User.id, User.email, User.name, User.role, User.student_id, User.department, User.batch
+        ).filter(User.id == user_id).first()
+        if user is None:
+            return None
+
+        projects = db.query(
+            Project.id, Project.title, Project.branch, Project.batch, Project.deadline,
+            Project.is_active, ProjectEnrollment.enrolled_at
+        ).join(
+            ProjectEnrollment, ProjectEnrollment.project_id == Project.id
+        ).filter(ProjectEnrollment.user_id == user_id).order_by(Project.deadline.asc()).all()
+
+        teams = db.query(
+            Team.id, Team.name, Team.project_id, Team.leader_id, Team.status,
+            Team.is_locked, Team.member_count
+        ).join(
+            team_members_table, team_members_table.c.team_id == Team.id
+        ).filter(team_members_table.c.user_id == user_id).all()
+        team_ids = [t.id for t in teams]
+
+        members_by_team = defaultdict(list)
+        submissions = []
+        feedback_by_submission = defaultdict(list)
+        if team_ids:
+            for row in db.execute(
+                select(team_members_table.c.team_id, User.id, User.name, User.email).join(
+                    User, User.id == team_members_table.c.user_id
+                ).where(team_members_table.c.team_id.in_(team_ids))
+            ):
+                members_by_team[row.team_id].append({"id": row.id, "name": row.name, "email": row.email})
+
+            submissions = db.query(
+                Submission.id, Submission.team_id, Submission.stage, Submission.version,
+                Submission.file_url, Submission.approval_status, Submission.submitted_at,
+                Submission.approved_at
+            ).filter(
+                Submission.team_id.in_(team_ids),
+                Submission.is_latest == True
+            ).order_by(Submission.team_id, Submission.stage).all()
+
+            submission_ids = [s.id for s in submissions]
+            if submission_ids:
+                for f in db.query(
+                    SubmissionFeedback.submission_id, SubmissionFeedback.supervisor_score,
+                    SubmissionFeedback.admin_score, SubmissionFeedback.comments,
+                    SubmissionFeedback.resubmission_deadline, SubmissionFeedback.created_at
+                ).filter(
+                    SubmissionFeedback.submission_id.in_(submission_ids)
+                ).order_by(SubmissionFeedback.created_at.asc()):
+                    feedback_by_submission[f.submission_id].append({
+                        "supervisor_score": f.supervisor_score,
+                        "admin_score": f.admin_score,
+                        "comments": f.comments,
+                        "resubmission_deadline": f.resubmission_deadline,
+                        "created_at": f.created_at
+                    })
+
+        notifications = db.query(
+            Notification.id, Notification.title, Notification.message,
+            Notification.notification_type, Notification.is_read, Notification.created_at
+        ).filter(
+            Notification.user_id == user_id
+        ).order_by(Notification.created_at.desc()).limit(notification_limit).all()
+
+        submissions_by_team = defaultdict(dict)
+        for s in submissions:
+            submissions_by_team[s.team_id][s.stage] = {
+                "id": s.id,
+                "version": s.version,
+                "file_url": s.file_url,
+                "approval_status": s.approval_status,
+                "submitted_at": s.submitted_at,
+                "approved_at": s.approved_at,
+                "feedback": feedback_by_submission.get(s.id, [])
+            }
+
+        return {
+            "profile": dict(user._mapping),
+            "projects": [dict(p._mapping) for p in projects],
+            "teams": [
+                {**t._mapping, "is_leader": t.leader_id == user_id, "members": members_by_team.get(t.id, [])}
+                for t in teams
+            ],
+            "submissions": [
+                {"team_id": team_id, "stages": stages} for team_id, stages in submissions_by_team.items()
+            ],
+            "notifications": [dict(n._mapping) for n in notifications]
+        }
+
+    @staticmethod
+    def invalidate_users(user_ids: Iterable[int], db: Session) -> None:
+        """Drop these students' dashboards in every worker once the write commits"""
+        invalidation.invalidate(db, *(f"dashboard:{user_id}" for user_id in user_ids))
+
+    @staticmethod
+    def invalidate_team(team_id: int, db: Session) -> None:
+        """Drop the dashboards of every member of a team; call after membership changes are flushed"""
+        member_ids = db.execute(
+            select(team_members_table.c.user_id).where(team_members_table.c.team_id == team_id)
+        ).scalars().all()
+        DashboardService.invalidate_users(member_ids, db)
+
+    @staticmethod
+    def clear(db: Session) -> None:
+        """Drop all cached dashboards, for bulk or project-wide writes"""
+        invalidation.invalidate(db, "dashboard:*")
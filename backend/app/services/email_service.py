@@ -4,7 +4,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from app.core.config import settings
-import asyncio
+from app.services.dashboard_service import DashboardService
 from typing import List
 
 class EmailService:
@@ -41,7 +41,34 @@ class EmailService:
         """Send team invitation email"""
         try:
             subject = f"Team Invitation: {team_name}"
-            body = f"""
+            body = EmailService._team_invitation_body(team_name, leader_name, accept_link)
+            EmailService._send_email(email, subject, body)
+            return True
+        except Exception as e:
+            print(f"Error sending team invitation email: {e}")
+            return False
+    
+    @staticmethod
+    def send_team_invitation_emails(invitations: List[tuple], team_name: str, leader_name: str) -> None:
+        """Send several team invitation emails over one SMTP connection.
+        invitations: list of (email, accept_link)"""
+        subject = f"Team Invitation: {team_name}"
+        messages = [
+            EmailService._build_message(
+                email, subject, EmailService._team_invitation_body(team_name, leader_name, accept_link)
+            )
+            for email, accept_link in invitations
+        ]
+        
+        try:
+            EmailService._send_messages(messages)
+        except Exception as e:
+            print(f"Error sending team invitation emails: {e}")
+    
+    @staticmethod
+    def _team_invitation_body(team_name: str, leader_name: str, accept_link: str) -> str:
+        """HTML body shared by the single and bulk team invitation emails"""
+        return f"""
             <html>
                 <body style="font-family: Arial, sans-serif;">
                     <h2>Team Invitation</h2>
@@ -58,11 +85,6 @@ class EmailService:
                 </body>
             </html>
             """
-            EmailService._send_email(email, subject, body)
-            return True
-        except Exception as e:
-            print(f"Error sending team invitation email: {e}")
-            return False
     
     @staticmethod
     def send_submission_feedback_email(
@@ -153,26 +175,44 @@ class EmailService:
             print(f"Error sending supervisor request email: {e}")
             return False
     
+    @staticmethod
+    def _build_message(to_email: str, subject: str, body: str) -> MIMEMultipart:
+        """Internal method to build an HTML email"""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = settings.SMTP_FROM_EMAIL
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # Attach HTML body
+        msg.attach(MIMEText(body, 'html'))
+        return msg
+    
     @staticmethod
     def _send_email(to_email: str, subject: str, body: str) -> None:
         """Internal method to send email"""
         try:
-            msg = MIMEMultipart('alternative')
-            msg['From'] = settings.SMTP_FROM_EMAIL
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # Attach HTML body
-            msg.attach(MIMEText(body, 'html'))
-            
-            # Send email
-            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                server.starttls()
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-                server.send_message(msg)
+            failed = EmailService._send_messages([EmailService._build_message(to_email, subject, body)])
+            if failed:
+                raise smtplib.SMTPRecipientsRefused({to_email: (550, b"Recipient refused")})
         except Exception as e:
             print(f"Failed to send email to {to_email}: {e}")
             raise
+    
+    @staticmethod
+    def _send_messages(messages: List[MIMEMultipart]) -> List[str]:
+        """Internal method to send emails over a single SMTP session.
+        Returns the recipients that were refused."""
+        failed = []
+        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
+            server.starttls()
+            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+            for msg in messages:
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPRecipientsRefused as e:
+                    print(f"Failed to send email to {msg['To']}: {e}")
+                    failed.append(msg['To'])
+        return failed
 
 class NotificationService:
     """In-app notification service"""
@@ -189,6 +229,7 @@ class NotificationService:
             notification_type=notification_type
         )
         db.add(notification)
+        DashboardService.invalidate_users([user_id], db)
         db.commit()
     
     @staticmethod
@@ -211,4 +252,5 @@ class NotificationService:
         notification = db.query(Notification).filter(Notification.id == notification_id).first()
         if notification:
             notification.is_read = True
+            DashboardService.invalidate_users([notification.user_id], db)
             db.commit()
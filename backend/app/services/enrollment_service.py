@@ -0,0 +1,56 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.models.models import Project, ProjectEnrollment
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core import invalidation
+from typing import Optional
+
+# enrollment_token -> project_id; tokens never change once issued
+_token_cache = TTLCache(ttl_seconds=settings.ENROLLMENT_TOKEN_CACHE_TTL_SECONDS, maxsize=4096)
+
+def _evict(tags) -> None:
+    for tag in tags:
+        if tag == "*":
+            _token_cache.clear()
+        elif tag.startswith("enrollment_token:"):
+            _token_cache.invalidate(tag.split(":", 1)[1])
+
+invalidation.register(_evict)
+
+class EnrollmentService:
+    """Project enrollment business logic"""
+
+    @staticmethod
+    def resolve_token(token: str, db: Session) -> Optional[int]:
+        """Map an enrollment token to its project id, hitting the DB only on a cache miss"""
+        project_id = _token_cache.get(token)
+        if project_id is not None:
+            return project_id
+
+        project_id = db.query(Project.id).filter(Project.enrollment_token == token).scalar()
+        if project_id is not None:
+            _token_cache.set(token, project_id)
+        return project_id
+
+    @staticmethod
+    def forget_token(token: str, db: Session) -> None:
+        """Drop a cached token in every worker, e.g. when its project is deleted"""
+        invalidation.invalidate(db, f"enrollment_token:{token}")
+
+    @staticmethod
+    def enroll(project_id: int, user_id: int, db: Session) -> bool:
+        """
+        Enroll a user with a single INSERT ... ON CONFLICT DO NOTHING on the
+        (project_id, user_id) unique constraint. Returns False if the user was
+        already enrolled. The caller commits.
+        """
+        enrollment_id = db.execute(
+            pg_insert(ProjectEnrollment).values(
+                project_id=project_id,
+                user_id=user_id
+            ).on_conflict_do_nothing(
+                index_elements=[ProjectEnrollment.project_id, ProjectEnrollment.user_id]
+            ).returning(ProjectEnrollment.id)
+        ).scalar()
+        return enrollment_id is not None
@@ -0,0 +1,187 @@
+import csv
+import io
+import re
+import tempfile
+from urllib.parse import quote
+from sqlalchemy import select, func, case, and_
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.models import (
+    Project, Team, User, Submission, SubmissionFeedback, SubmissionStageEnum, team_members_table
+)
+from typing import Iterator, List, Optional
+
+STAGES = [stage.value for stage in SubmissionStageEnum]
+
+EXPORT_COLUMNS = (
+    ["project_id", "project_title", "team_id", "team_name", "rank",
+     "student_id", "student_name", "email"]
+    + [f"{stage}_score" for stage in STAGES]
+    + ["supervisor_avg", "admin_score", "final_score"]
+)
+
+# Rows fetched per round-trip from the server-side cursor
+EXPORT_YIELD_PER = 500
+
+class ExportService:
+    """Grade export business logic"""
+
+    @staticmethod
+    def grades_query(project_ids: Optional[List[int]] = None, branch: Optional[str] = None):
+        """
+        One row per student per team, with the same scoring as the leaderboard:
+        supervisor average over all feedback plus the latest admin score, ranked
+        by final score then current final-submission time.
+        """
+        score = SubmissionFeedback.supervisor_score
+
+        team_scores = select(
+            Submission.team_id.label("team_id"),
+            func.avg(score).label("supervisor_avg"),
+            *[
+                func.avg(case(
+                    (and_(Submission.stage == stage, Submission.is_latest == True), score)
+                )).label(f"{stage}_score")
+                for stage in STAGES
+            ]
+        ).join(
+            SubmissionFeedback, SubmissionFeedback.submission_id == Submission.id
+        ).group_by(Submission.team_id).subquery()
+
+        latest_admin_score = select(SubmissionFeedback.admin_score).join(
+            Submission, Submission.id == SubmissionFeedback.submission_id
+        ).where(
+            Submission.team_id == Team.id,
+            SubmissionFeedback.admin_score != None
+        ).order_by(SubmissionFeedback.created_at.desc()).limit(1).correlate(Team).scalar_subquery()
+
+        final_time = select(Submission.submitted_at).where(
+            Submission.team_id == Team.id,
+            Submission.stage == SubmissionStageEnum.FINAL_SUBMISSION.value,
+            Submission.is_latest == True
+        ).correlate(Team).scalar_subquery()
+
+        admin_score = func.coalesce(latest_admin_score, 0)
+        supervisor_avg = func.coalesce(team_scores.c.supervisor_avg, 0)
+
+        ranked_teams = select(
+            Team.id.label("team_id"),
+            Team.name.label("team_name"),
+            Project.id.label("project_id"),
+            Project.title.label("project_title"),
+            supervisor_avg.label("supervisor_avg"),
+            admin_score.label("admin_score"),
+            (supervisor_avg + admin_score).label("final_score"),
+            *[team_scores.c[f"{stage}_score"] for stage in STAGES],
+            func.row_number().over(
+                partition_by=Team.project_id,
+                order_by=[(supervisor_avg + admin_score).desc(), final_time.asc().nulls_last()]
+            ).label("rank")
+        ).join(
+            Project, Project.id == Team.project_id
+        ).outerjoin(
+            team_scores, team_scores.c.team_id == Team.id
+        )
+
+        if project_ids is not None:
+            ranked_teams = ranked_teams.where(Team.project_id.in_(project_ids))
+        if branch is not None:
+            ranked_teams = ranked_teams.where(Project.branch == branch)
+
+        ranked_teams = ranked_teams.subquery()
+
+        return select(
+            ranked_teams.c.project_id,
+            ranked_teams.c.project_title,
+            ranked_teams.c.team_id,
+            ranked_teams.c.team_name,
+            ranked_teams.c.rank,
+            User.student_id,
+            User.name.label("student_name"),
+            User.email,
+            *[ranked_teams.c[f"{stage}_score"] for stage in STAGES],
+            ranked_teams.c.supervisor_avg,
+            ranked_teams.c.admin_score,
+            ranked_teams.c.final_score
+        ).join(
+            team_members_table, team_members_table.c.team_id == ranked_teams.c.team_id
+        ).join(
+            User, User.id == team_members_table.c.user_id
+        ).order_by(
+            ranked_teams.c.project_id, ranked_teams.c.rank, User.name
+        )
+
+    @staticmethod
+    def iter_grade_rows(project_ids: Optional[List[int]] = None, branch: Optional[str] = None) -> Iterator[list]:
+        """Yield export rows from a server-side cursor in its own session"""
+        db: Session = SessionLocal()
+        try:
+            result = db.execute(
+                ExportService.grades_query(project_ids, branch),
+                execution_options={"yield_per": EXPORT_YIELD_PER}
+            )
+            for row in result:
+                yield [
+                    round(value, 2) if isinstance(value, float) else value
+                    for value in row
+                ]
+        finally:
+            db.close()
+
+    @staticmethod
+    def stream_csv(project_ids: Optional[List[int]] = None, branch: Optional[str] = None) -> Iterator[str]:
+        """Render rows as CSV, flushing one chunk per cursor batch"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+
+        for idx, row in enumerate(ExportService.iter_grade_rows(project_ids, branch), 1):
+            writer.writerow(row)
+            if idx % EXPORT_YIELD_PER == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
+    @staticmethod
+    def stream_xlsx(project_ids: Optional[List[int]] = None, branch: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Render rows as XLSX. The zip container can only be finalised at the
+        end, so the write-only workbook goes to a spooled temp file which is
+        then streamed back in chunks.
+        """
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Grades")
+        sheet.append(EXPORT_COLUMNS)
+        for row in ExportService.iter_grade_rows(project_ids, branch):
+            sheet.append(row)
+
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as output:
+            workbook.save(output)
+            output.seek(0)
+            while chunk := output.read(64 * 1024):
+                yield chunk
+
+    @staticmethod
+    def content_disposition(filename: str) -> str:
+        """
+        Attachment header for a user-supplied filename: an ASCII fallback for
+        old clients plus the exact name as RFC 5987 filename*
+        """
+        fallback = re.sub(r"[^A-Za-z0-9._-]", "_", filename)
+        return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+    @staticmethod
+    def stream(export_format: str, project_ids: Optional[List[int]] = None, branch: Optional[str] = None):
+        """Return (iterator, media type) for a supported export format"""
+        if export_format == "csv":
+            return ExportService.stream_csv(project_ids, branch), "text/csv"
+        if export_format == "xlsx":
+            return (
+                ExportService.stream_xlsx(project_ids, branch),
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+        raise ValueError("Export format must be csv or xlsx")
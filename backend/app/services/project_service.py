@@ -0,0 +1,47 @@
+import time
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from app.models.models import (
+    Project, ProjectEnrollment, Team, TeamInvitation, Submission, SubmissionApproval,
+    SubmissionFeedback, SupervisorAssignment, team_members_table
+)
+
+class ProjectService:
+    """Project lifecycle business logic"""
+
+    @staticmethod
+    def delete_project(project_id: int, db: Session) -> dict:
+        """
+        Delete a project and everything hanging off it with set-based
+        DELETE ... WHERE ... IN (subquery) statements in foreign-key order,
+        without loading any rows into the session. The caller commits, so the
+        whole cascade is one transaction. Returns rows deleted per table and
+        the elapsed time.
+        """
+        team_ids = select(Team.id).where(Team.project_id == project_id)
+        submission_ids = select(Submission.id).where(Submission.team_id.in_(team_ids))
+
+        steps = [
+            ("submission_feedbacks", delete(SubmissionFeedback).where(SubmissionFeedback.submission_id.in_(submission_ids))),
+            ("submission_approvals", delete(SubmissionApproval).where(SubmissionApproval.submission_id.in_(submission_ids))),
+            ("submissions", delete(Submission).where(Submission.team_id.in_(team_ids))),
+            ("team_invitations", delete(TeamInvitation).where(TeamInvitation.team_id.in_(team_ids))),
+            ("team_members", delete(team_members_table).where(team_members_table.c.team_id.in_(team_ids))),
+            ("supervisor_assignments", delete(SupervisorAssignment).where(SupervisorAssignment.project_id == project_id)),
+            ("teams", delete(Team).where(Team.project_id == project_id)),
+            ("project_enrollments", delete(ProjectEnrollment).where(ProjectEnrollment.project_id == project_id)),
+            ("projects", delete(Project).where(Project.id == project_id)),
+        ]
+
+        started = time.perf_counter()
+        deleted = {}
+        for table, stmt in steps:
+            deleted[table] = db.execute(
+                stmt, execution_options={"synchronize_session": False}
+            ).rowcount
+
+        return {
+            "deleted": deleted,
+            "total_rows": sum(deleted.values()),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
@@ -0,0 +1,155 @@
+import csv
+from sqlalchemy import select, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from email_validator import validate_email, EmailNotValidError
+from app.models.models import User, ProjectEnrollment, RoleEnum
+from app.core import invalidation
+from app.services.dashboard_service import DashboardService
+from typing import Iterable, List, Optional
+
+class RosterService:
+    """Bulk student roster import business logic"""
+
+    @staticmethod
+    def validate_row(row: dict) -> dict:
+        """Normalise a CSV row; raises ValueError with a readable message"""
+        email = (row.get("email") or "").strip()
+        name = (row.get("name") or "").strip()
+        if not email:
+            raise ValueError("email is required")
+        if not name:
+            raise ValueError("name is required")
+        try:
+            email = validate_email(email, check_deliverability=False).normalized
+        except EmailNotValidError as e:
+            raise ValueError(f"invalid email: {e}")
+
+        return {
+            "email": email,
+            "name": name,
+            "role": RoleEnum.STUDENT.value,
+            "student_id": (row.get("student_id") or "").strip() or None,
+            "department": (row.get("department") or "").strip() or None,
+            "batch": (row.get("batch") or "").strip() or None,
+            "is_active": True
+        }
+
+    @staticmethod
+    def _upsert_statement():
+        stmt = pg_insert(User)
+        return stmt.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={
+                "name": stmt.excluded.name,
+                "student_id": stmt.excluded.student_id,
+                "department": stmt.excluded.department,
+                "batch": stmt.excluded.batch
+            },
+            # Never turn an admin or supervisor account into a student
+            where=User.role == RoleEnum.STUDENT.value
+        ).returning(User.id, User.email)
+
+    @staticmethod
+    def _enroll(user_ids: List[int], project_id: int, db: Session) -> int:
+        """Enroll users that are not yet enrolled in the project"""
+        if not user_ids:
+            return 0
+        return db.execute(
+            pg_insert(ProjectEnrollment).from_select(
+                ["project_id", "user_id"],
+                select(literal(project_id), User.id).where(User.id.in_(user_ids))
+            ).on_conflict_do_nothing(
+                index_elements=[ProjectEnrollment.project_id, ProjectEnrollment.user_id]
+            )
+        ).rowcount
+
+    @staticmethod
+    def _flush_batch(batch: List[tuple], project_id: Optional[int], db: Session, report: dict) -> None:
+        """Upsert one batch; on a constraint error retry row by row to pinpoint failures"""
+        rows = [values for _, values in batch]
+        failed = set()
+        try:
+            with db.begin_nested():
+                returned = db.execute(RosterService._upsert_statement(), rows).all()
+        except IntegrityError:
+            returned = []
+            for line_no, values in batch:
+                try:
+                    with db.begin_nested():
+                        returned.extend(db.execute(RosterService._upsert_statement(), [values]).all())
+                except IntegrityError:
+                    failed.add(line_no)
+                    report["errors"].append({
+                        "row": line_no,
+                        "email": values["email"],
+                        "error": "student_id already belongs to another user"
+                    })
+
+        written = {email for _, email in returned}
+        for line_no, values in batch:
+            if line_no not in failed and values["email"] not in written:
+                report["errors"].append({
+                    "row": line_no,
+                    "email": values["email"],
+                    "error": "email belongs to a non-student account"
+                })
+
+        report["imported"] += len(returned)
+        if project_id is not None:
+            report["enrolled"] += RosterService._enroll([user_id for user_id, _ in returned], project_id, db)
+            DashboardService.clear(db)
+        # Upserted names and emails show up in cached rows and member lists;
+        # published with the batch, so the CLI reaches running servers as the route does
+        invalidation.invalidate(db, "response:*", *(f"user:{user_id}" for user_id, _ in returned))
+        db.commit()
+
+    @staticmethod
+    def import_students(
+        lines: Iterable[str],
+        db: Session,
+        project_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> dict:
+        """
+        Stream a CSV roster (email, name, student_id, department, batch) and
+        upsert students in batches, committing each batch. Memory is bounded
+        by the batch size plus the set of keys seen so far.
+        """
+        reader = csv.DictReader(lines)
+        missing = [c for c in ("email", "name") if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+
+        report = {"total_rows": 0, "imported": 0, "enrolled": 0, "errors": []}
+        seen_emails = set()
+        seen_student_ids = set()
+        batch = []
+
+        # Header is line 1
+        for line_no, row in enumerate(reader, start=2):
+            report["total_rows"] += 1
+            try:
+                values = RosterService.validate_row(row)
+                if values["email"] in seen_emails:
+                    raise ValueError("duplicate email in file")
+                if values["student_id"] and values["student_id"] in seen_student_ids:
+                    raise ValueError("duplicate student_id in file")
+            except ValueError as e:
+                report["errors"].append({"row": line_no, "email": row.get("email"), "error": str(e)})
+                continue
+
+            seen_emails.add(values["email"])
+            if values["student_id"]:
+                seen_student_ids.add(values["student_id"])
+            batch.append((line_no, values))
+
+            if len(batch) >= batch_size:
+                RosterService._flush_batch(batch, project_id, db, report)
+                batch = []
+
+        if batch:
+            RosterService._flush_batch(batch, project_id, db, report)
+
+        return report
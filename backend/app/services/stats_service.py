@@ -0,0 +1,221 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+from sqlalchemy import func, case, literal, select, union_all, String
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.models import (
+    User, Team, Submission, SubmissionFeedback, SupervisorAssignment, SupervisorRequest,
+    RoleEnum, ApprovalStatusEnum, SubmissionStageEnum
+)
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core import invalidation
+
+# Supervisor score distribution buckets (lower bound inclusive, upper exclusive; last includes 10)
+SCORE_BUCKETS = [("0-4", 0, 4), ("4-6", 4, 6), ("6-8", 6, 8), ("8-10", 8, None)]
+
+_supervisor_stats_cache = TTLCache(ttl_seconds=settings.STATS_CACHE_TTL_SECONDS)
+
+# Admin dashboard snapshot; the TTL outlives the refresh interval so readers
+# keep hitting the previous snapshot while the background task replaces it
+_admin_stats_cache = TTLCache(ttl_seconds=settings.ADMIN_STATS_REFRESH_SECONDS * 2, maxsize=1)
+_admin_stats_lock = threading.Lock()
+
+def _evict(tags) -> None:
+    for tag in tags:
+        if tag == "*":
+            _supervisor_stats_cache.clear()
+        elif tag.startswith("supervisor_stats:"):
+            _supervisor_stats_cache.invalidate(int(tag.split(":", 1)[1]))
+
+invalidation.register(_evict)
+
+class StatsService:
+    """Dashboard statistics business logic"""
+
+    @staticmethod
+    def pending_review_count_query(supervisor_id: int, db: Session):
+        """Submissions of teams assigned to the supervisor that they have not scored"""
+        reviewed = db.query(SubmissionFeedback.id).filter(
+            SubmissionFeedback.submission_id == Submission.id,
+            SubmissionFeedback.supervisor_id == supervisor_id
+        ).correlate(Submission).exists()
+
+        return db.query(func.count(Submission.id)).join(
+            SupervisorAssignment, SupervisorAssignment.team_id == Submission.team_id
+        ).filter(
+            SupervisorAssignment.supervisor_id == supervisor_id,
+            Submission.is_latest == True,
+            ~reviewed
+        )
+
+    @staticmethod
+    def get_supervisor_stats(supervisor_id: int, db: Session) -> dict:
+        """Per-stage score statistics for a supervisor, cached until they score again"""
+        cached = _supervisor_stats_cache.get(supervisor_id)
+        if cached is not None:
+            return cached
+
+        score = SubmissionFeedback.supervisor_score
+        bucket_columns = [
+            func.sum(case(
+                (score >= low if high is None else (score >= low) & (score < high), 1),
+                else_=0
+            )).label(f"bucket_{idx}")
+            for idx, (_, low, high) in enumerate(SCORE_BUCKETS)
+        ]
+        # Uncorrelated, so the pending count rides along in the same round-trip
+        pending = StatsService.pending_review_count_query(
+            supervisor_id, db
+        ).correlate(None).scalar_subquery()
+
+        rows = db.query(
+            Submission.stage,
+            func.count(SubmissionFeedback.id).label("reviewed"),
+            func.count(score).label("scored"),
+            func.sum(score).label("total"),
+            func.min(score).label("min"),
+            func.max(score).label("max"),
+            *bucket_columns,
+            pending.label("pending")
+        ).join(
+            Submission, Submission.id == SubmissionFeedback.submission_id
+        ).filter(
+            SubmissionFeedback.supervisor_id == supervisor_id
+        ).group_by(Submission.stage).all()
+
+        if rows:
+            pending_reviews = rows[0].pending
+        else:
+            pending_reviews = StatsService.pending_review_count_query(supervisor_id, db).scalar()
+
+        by_stage = {row.stage: row for row in rows}
+        stages = {}
+        total_reviewed = 0
+        total_scored = 0
+        score_sum = 0.0
+        for stage in SubmissionStageEnum:
+            row = by_stage.get(stage.value)
+            if row is None:
+                stages[stage.value] = {
+                    "count": 0,
+                    "average": 0,
+                    "min": None,
+                    "max": None,
+                    "distribution": {name: 0 for name, _, _ in SCORE_BUCKETS}
+                }
+                continue
+
+            total_reviewed += row.reviewed
+            total_scored += row.scored
+            score_sum += row.total or 0
+            stages[stage.value] = {
+                "count": row.reviewed,
+                "average": round(row.total / row.scored, 2) if row.scored else 0,
+                "min": row.min,
+                "max": row.max,
+                "distribution": {
+                    name: row._mapping[f"bucket_{idx}"] or 0
+                    for idx, (name, _, _) in enumerate(SCORE_BUCKETS)
+                }
+            }
+
+        stats = {
+            "supervisor_id": supervisor_id,
+            "total_submissions_reviewed": total_reviewed,
+            "average_score_given": round(score_sum / total_scored, 2) if total_scored else 0,
+            "pending_reviews": pending_reviews or 0,
+            "stages": stages
+        }
+        _supervisor_stats_cache.set(supervisor_id, stats)
+        return stats
+
+    @staticmethod
+    def invalidate_supervisor_stats(supervisor_id: int, db: Session) -> None:
+        """Drop cached stats, in every worker, once the supervisor's score commits"""
+        if supervisor_id is not None:
+            invalidation.invalidate(db, f"supervisor_stats:{supervisor_id}")
+
+    @staticmethod
+    def compute_admin_stats(db: Session) -> dict:
+        """
+        Build the admin dashboard snapshot from a single UNION ALL of grouped
+        counts, so every figure comes from the same point-in-time view.
+        """
+        def grouped(metric: str, column, id_column):
+            return select(
+                literal(metric, String).label("metric"),
+                column.label("key"),
+                func.count(id_column).label("count")
+            ).group_by(column)
+
+        stmt = union_all(
+            grouped("users", User.role, User.id),
+            grouped("supervisor_requests", SupervisorRequest.status, SupervisorRequest.id),
+            grouped("teams", Team.status, Team.id),
+            grouped("submission_stages", Submission.stage, Submission.id),
+            grouped("submission_approvals", Submission.approval_status, Submission.id)
+        )
+
+        counts = {
+            "users": {},
+            "supervisor_requests": {},
+            "teams": {},
+            "submission_stages": {},
+            "submission_approvals": {}
+        }
+        for row in db.execute(stmt):
+            counts[row.metric][row.key] = row.count
+
+        users = counts["users"]
+        return {
+            "total_users": sum(users.values()),
+            "total_supervisors": users.get(RoleEnum.SUPERVISOR.value, 0),
+            "total_students": users.get(RoleEnum.STUDENT.value, 0),
+            "pending_requests": counts["supervisor_requests"].get(ApprovalStatusEnum.PENDING.value, 0),
+            "teams_by_status": counts["teams"],
+            "submissions_by_stage": {
+                stage.value: counts["submission_stages"].get(stage.value, 0)
+                for stage in SubmissionStageEnum
+            },
+            "pending_approvals": counts["submission_approvals"].get(ApprovalStatusEnum.PENDING.value, 0),
+            "generated_at": datetime.now(timezone.utc)
+        }
+
+    @staticmethod
+    def refresh_admin_stats() -> dict:
+        """Recompute the admin snapshot in its own session and publish it"""
+        db = SessionLocal()
+        try:
+            stats = StatsService.compute_admin_stats(db)
+        finally:
+            db.close()
+        _admin_stats_cache.set("admin", stats)
+        return stats
+
+    @staticmethod
+    def get_admin_stats() -> dict:
+        """
+        Return the cached admin snapshot. On a cold cache only one caller
+        recomputes it; concurrent callers wait and reuse the result.
+        """
+        stats = _admin_stats_cache.get("admin")
+        if stats is not None:
+            return stats
+
+        with _admin_stats_lock:
+            stats = _admin_stats_cache.get("admin")
+            if stats is None:
+                stats = StatsService.refresh_admin_stats()
+        return stats
+
+    @staticmethod
+    async def run_admin_stats_refresher() -> None:
+        """Background task that keeps the admin snapshot warm"""
+        while True:
+            try:
+                await asyncio.to_thread(StatsService.refresh_admin_stats)
+            except Exception as e:
+                print(f"Warning: Could not refresh admin stats: {e}")
+            await asyncio.sleep(settings.ADMIN_STATS_REFRESH_SECONDS)
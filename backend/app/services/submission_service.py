@@ -0,0 +1,52 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from app.models.models import Submission, ApprovalStatusEnum
+from typing import List, Optional
+
+class SubmissionService:
+    """Submission versioning business logic"""
+
+    @staticmethod
+    def create_version(team_id: int, stage: str, file_url: str, uploaded_by: int, db: Session) -> Submission:
+        """
+        Add a new version of a team's stage submission and mark it latest.
+        The previous latest row is demoted in the same UPDATE that reads its
+        version number; the caller commits. Two concurrent first uploads
+        collide on the partial unique index and one of them fails.
+        """
+        previous_version = db.execute(
+            update(Submission).where(
+                Submission.team_id == team_id,
+                Submission.stage == stage,
+                Submission.is_latest == True
+            ).values(is_latest=False).returning(Submission.version)
+        ).scalar()
+
+        submission = Submission(
+            team_id=team_id,
+            stage=stage,
+            file_url=file_url,
+            uploaded_by=uploaded_by,
+            approval_status=ApprovalStatusEnum.PENDING,
+            version=(previous_version or 0) + 1,
+            is_latest=True
+        )
+        db.add(submission)
+        return submission
+
+    @staticmethod
+    def get_current(team_id: int, stage: str, db: Session) -> Optional[Submission]:
+        """Current submission for a team and stage (single partial-index probe)"""
+        return db.query(Submission).filter(
+            Submission.team_id == team_id,
+            Submission.stage == stage,
+            Submission.is_latest == True
+        ).first()
+
+    @staticmethod
+    def get_history(team_id: int, stage: str, db: Session) -> List[Submission]:
+        """All versions of a team's stage submission, newest first"""
+        return db.query(Submission).filter(
+            Submission.team_id == team_id,
+            Submission.stage == stage
+        ).order_by(Submission.version.desc()).all()
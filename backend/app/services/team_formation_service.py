@@ -0,0 +1,125 @@
+import math
+from itertools import groupby
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from app.db.database import advisory_xact_lock
+from app.models.models import (
+    Project, ProjectEnrollment, Team, User, TeamStatusEnum, team_members_table
+)
+from typing import List
+
+class TeamFormationService:
+    """Automatic team formation business logic"""
+
+    @staticmethod
+    def get_unteamed_students(project_id: int, db: Session) -> list:
+        """Enrolled users not yet in any team of the project (anti-join)"""
+        in_team = db.query(team_members_table.c.user_id).join(
+            Team, Team.id == team_members_table.c.team_id
+        ).filter(
+            Team.project_id == project_id,
+            team_members_table.c.user_id == User.id
+        ).correlate(User).exists()
+
+        return db.query(User.id, User.department, User.batch).join(
+            ProjectEnrollment, ProjectEnrollment.user_id == User.id
+        ).filter(
+            ProjectEnrollment.project_id == project_id,
+            ~in_team
+        ).distinct().all()
+
+    @staticmethod
+    def partition(member_ids: List[int], team_size: int) -> List[List[int]]:
+        """Split members into the fewest teams of at most team_size, sizes differing by at most one"""
+        if not member_ids:
+            return []
+        team_count = math.ceil(len(member_ids) / team_size)
+        base, extra = divmod(len(member_ids), team_count)
+
+        teams = []
+        start = 0
+        for idx in range(team_count):
+            size = base + (1 if idx < extra else 0)
+            teams.append(member_ids[start:start + size])
+            start += size
+        return teams
+
+    @staticmethod
+    def form_teams(
+        project: Project,
+        db: Session,
+        team_size: int,
+        group_by_department: bool = False,
+        group_by_batch: bool = False,
+        dry_run: bool = False
+    ) -> dict:
+        """
+        Put every unteamed enrolled student of a project into a new team.
+        Teams and team_members rows are written with bulk inserts; the caller
+        owns the transaction and must commit.
+        """
+        if not dry_run:
+            # A concurrent run waits here, then finds this run's students teamed
+            advisory_xact_lock(db, f"form_teams:{project.id}")
+
+        def group_key(student) -> tuple:
+            return (
+                (student.department or "") if group_by_department else "",
+                (student.batch or "") if group_by_batch else ""
+            )
+
+        students = sorted(
+            TeamFormationService.get_unteamed_students(project.id, db),
+            key=lambda s: (group_key(s), s.id)
+        )
+
+        # Number after the project's existing teams so a later run doesn't reuse names
+        numbered_from = db.query(func.count(Team.id)).filter(Team.project_id == project.id).scalar()
+
+        planned = []
+        for (department, batch), group in groupby(students, key=group_key):
+            for members in TeamFormationService.partition([s.id for s in group], team_size):
+                label = " ".join(part for part in (department, batch) if part)
+                planned.append({
+                    "team_name": f"Team {numbered_from + len(planned) + 1}" + (f" ({label})" if label else ""),
+                    "leader_id": members[0],
+                    "member_ids": members,
+                    "department": department or None,
+                    "batch": batch or None
+                })
+
+        if planned and not dry_run:
+            team_ids = db.execute(
+                insert(Team).returning(Team.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "project_id": project.id,
+                        "leader_id": team["leader_id"],
+                        "name": team["team_name"],
+                        "status": TeamStatusEnum.ACTIVE if len(team["member_ids"]) > 1 else TeamStatusEnum.PENDING,
+                        "is_locked": False,
+                        "member_count": len(team["member_ids"])
+                    }
+                    for team in planned
+                ]
+            ).scalars().all()
+
+            db.execute(
+                insert(team_members_table),
+                [
+                    {"team_id": team_id, "user_id": user_id}
+                    for team_id, team in zip(team_ids, planned)
+                    for user_id in team["member_ids"]
+                ]
+            )
+
+            for team_id, team in zip(team_ids, planned):
+                team["team_id"] = team_id
+
+        return {
+            "project_id": project.id,
+            "dry_run": dry_run,
+            "total_students": len(students),
+            "total_teams": len(planned),
+            "teams": planned
+        }
@@ -0,0 +1,116 @@
+from sqlalchemy import select, func, case
+from sqlalchemy.orm import Session
+from app.models.models import (
+    Project, Team, TeamInvitation, Submission, SubmissionFeedback, User, ApprovalStatusEnum,
+    team_members_table
+)
+from app.core.etag import make_etag
+from datetime import datetime
+from typing import Optional, Tuple
+
+Validator = Tuple[str, Optional[datetime]]
+
+def _latest(*values: Optional[datetime]) -> Optional[datetime]:
+    present = [v for v in values if v is not None]
+    return max(present) if present else None
+
+def _members_modified(team_ids):
+    """Latest change to any member of the teams; member names and emails are part of the payload"""
+    return select(func.max(func.coalesce(User.updated_at, User.created_at))).join(
+        team_members_table, team_members_table.c.user_id == User.id
+    ).where(team_members_table.c.team_id.in_(team_ids)).scalar_subquery()
+
+class ValidatorService:
+    """
+    Cheap HTTP cache validators (ETag, Last-Modified) for read endpoints,
+    derived from timestamps, counts and version columns with one small
+    aggregate query each, without loading or serialising the resource.
+    """
+
+    @staticmethod
+    def project(project_id: int, db: Session) -> Optional[Validator]:
+        row = db.query(Project.updated_at, Project.created_at).filter(Project.id == project_id).first()
+        if row is None:
+            return None
+        modified = row.updated_at or row.created_at
+        return make_etag("project", project_id, modified), modified
+
+    @staticmethod
+    def project_list(query, query_string: str) -> Validator:
+        """Validator for a filtered project query; query_string covers cursor and limit"""
+        count, modified = query.with_entities(
+            func.count(Project.id),
+            func.max(func.coalesce(Project.updated_at, Project.created_at))
+        ).one()
+        return make_etag("projects", query_string, count, modified), modified
+
+    @staticmethod
+    def leaderboard(project_id: int, db: Session) -> Optional[Validator]:
+        team_ids = select(Team.id).where(Team.project_id == project_id)
+        row = db.execute(select(
+            select(func.coalesce(Project.updated_at, Project.created_at)).where(
+                Project.id == project_id
+            ).scalar_subquery().label("project_modified"),
+            select(func.count(Team.id)).where(Team.project_id == project_id).scalar_subquery().label("teams"),
+            select(func.sum(Team.member_count)).where(Team.project_id == project_id).scalar_subquery().label("members"),
+            select(func.max(func.coalesce(Team.updated_at, Team.created_at))).where(
+                Team.project_id == project_id
+            ).scalar_subquery().label("teams_modified"),
+            select(func.count(Submission.id)).where(
+                Submission.team_id.in_(team_ids)
+            ).scalar_subquery().label("submissions"),
+            select(func.max(Submission.submitted_at)).where(
+                Submission.team_id.in_(team_ids)
+            ).scalar_subquery().label("submissions_modified"),
+            select(func.count(SubmissionFeedback.id)).join(
+                Submission, Submission.id == SubmissionFeedback.submission_id
+            ).where(Submission.team_id.in_(team_ids)).scalar_subquery().label("feedbacks"),
+            select(func.max(func.coalesce(SubmissionFeedback.updated_at, SubmissionFeedback.created_at))).join(
+                Submission, Submission.id == SubmissionFeedback.submission_id
+            ).where(Submission.team_id.in_(team_ids)).scalar_subquery().label("feedbacks_modified"),
+            _members_modified(team_ids).label("members_modified")
+        )).one()
+
+        if row.project_modified is None:
+            return None
+        modified = _latest(
+            row.project_modified, row.teams_modified, row.submissions_modified, row.feedbacks_modified,
+            row.members_modified
+        )
+        return make_etag("leaderboard", project_id, *row), modified
+
+    @staticmethod
+    def team(team_id: int, db: Session) -> Optional[Validator]:
+        row = db.query(
+            Team.updated_at,
+            Team.created_at,
+            Team.member_count,
+            Team.pending_invitation_count,
+            Team.rejected_invitation_count,
+            select(func.count(TeamInvitation.id)).where(
+                TeamInvitation.team_id == team_id
+            ).scalar_subquery().label("invitations"),
+            select(func.max(func.coalesce(TeamInvitation.responded_at, TeamInvitation.invited_at))).where(
+                TeamInvitation.team_id == team_id
+            ).scalar_subquery().label("invitations_modified"),
+            _members_modified([team_id]).label("members_modified")
+        ).filter(Team.id == team_id).first()
+
+        if row is None:
+            return None
+        modified = _latest(row.updated_at or row.created_at, row.invitations_modified, row.members_modified)
+        return make_etag("team", team_id, *row), modified
+
+    @staticmethod
+    def team_submissions(team_id: int, db: Session, query_string: str = "") -> Validator:
+        row = db.query(
+            func.count(Submission.id),
+            func.max(Submission.version),
+            func.max(Submission.submitted_at),
+            func.max(Submission.approved_at),
+            func.count(case((Submission.approval_status == ApprovalStatusEnum.APPROVED.value, 1))),
+            func.count(case((Submission.approval_status == ApprovalStatusEnum.REJECTED.value, 1)))
+        ).filter(Submission.team_id == team_id).one()
+
+        modified = _latest(row[2], row[3])
+        return make_etag("team_submissions", team_id, query_string, *row), modified
@@ -0,0 +1,150 @@
+"""
+Shared fixtures. Tests that touch the database need a disposable Postgres
+database named by TEST_DATABASE_URL and are skipped without one, e.g.:
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost/dpg_test pytest -q
+"""
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Settings are read at import time, so configure them before importing the app
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql://localhost/unused"
+os.environ["NPLUSONE_DETECT"] = "true"
+os.environ["INVALIDATION_BUS_ENABLED"] = "false"
+os.environ["LLM_PROVIDER"] = "fake"
+for _name, _value in {
+    "SECRET_KEY": "test",
+    "JWT_SECRET_KEY": "test",
+    "GROQ_API_KEY": "test",
+    "SMTP_HOST": "localhost",
+    "SMTP_PORT": "1",
+    "SMTP_USER": "test",
+    "SMTP_PASSWORD": "test",
+    "SMTP_FROM_EMAIL": "noreply@example.com",
+    "ONEDRIVE_TENANT_ID": "test",
+    "ONEDRIVE_CLIENT_ID": "test",
+    "ONEDRIVE_CLIENT_SECRET": "test",
+    "ONEDRIVE_FOLDER_ID": "test",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import pytest
+from sqlalchemy import text
+from app.core import invalidation, nplusone
+from app.db.database import Base, SessionLocal, engine
+from app.models.models import (
+    Project, ProjectEnrollment, Submission, SupervisorAssignment, Team, User,
+    RoleEnum, TeamStatusEnum, team_members_table
+)
+
+@pytest.fixture(scope="session")
+def database():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(database):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        with database.begin() as conn:
+            conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        # Rows are gone, so must be every cached copy of them
+        invalidation.evict_local(["*"])
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.routes import admin
+
+    def current_admin():
+        return db.query(User).filter(User.role == RoleEnum.ADMIN).first()
+
+    app.dependency_overrides[admin.get_current_user] = current_admin
+    try:
+        # Not used as a context manager, so startup background tasks stay off
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+@pytest.fixture
+def query_budget(database):
+    """
+    `with query_budget(n): ...` fails the test when the block runs more than
+    n statements, listing any statement shape repeated 3+ times.
+    """
+    return nplusone.query_budget
+
+class Factory:
+    """Committed test rows with sensible defaults"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def _save(self, obj):
+        self.db.add(obj)
+        self.db.commit()
+        return obj
+
+    def user(self, role: str = RoleEnum.STUDENT, **fields) -> User:
+        role = RoleEnum(role).value
+        suffix = uuid.uuid4().hex[:8]
+        fields.setdefault("email", f"{role}-{suffix}@example.com")
+        fields.setdefault("name", f"{role.title()} {suffix}")
+        fields.setdefault("department", "CSE")
+        fields.setdefault("batch", "2024")
+        # UserResponse requires updated_at, which the column only sets on UPDATE
+        fields.setdefault("updated_at", datetime.now(timezone.utc))
+        return self._save(User(role=role, **fields))
+
+    def project(self, **fields) -> Project:
+        token = uuid.uuid4().hex
+        fields.setdefault("title", f"Project {token[:6]}")
+        fields.setdefault("description", "Test project")
+        fields.setdefault("branch", "CSE")
+        fields.setdefault("batch", "2024")
+        fields.setdefault("deadline", datetime.now(timezone.utc) + timedelta(days=30))
+        fields.setdefault("enrollment_token", token)
+        fields.setdefault("enrollment_link", f"/enroll/{token}")
+        return self._save(Project(**fields))
+
+    def enroll(self, project: Project, *users: User) -> None:
+        for user in users:
+            self.db.add(ProjectEnrollment(project_id=project.id, user_id=user.id))
+        self.db.commit()
+
+    def team(self, project: Project, leader: User, members=(), **fields) -> Team:
+        fields.setdefault("name", f"Team {uuid.uuid4().hex[:6]}")
+        fields.setdefault("status", TeamStatusEnum.ACTIVE)
+        team = Team(project_id=project.id, leader_id=leader.id, member_count=1 + len(members), **fields)
+        self._save(team)
+        self.db.execute(team_members_table.insert(), [
+            {"team_id": team.id, "user_id": user.id} for user in (leader, *members)
+        ])
+        self.db.commit()
+        return team
+
+    def submission(self, team: Team, stage: str, uploaded_by: User, **fields) -> Submission:
+        fields.setdefault("file_url", f"https://files.example.com/{uuid.uuid4().hex}")
+        return self._save(Submission(team_id=team.id, stage=stage, uploaded_by=uploaded_by.id, **fields))
+
+    def assign(self, team: Team, supervisor: User) -> SupervisorAssignment:
+        return self._save(SupervisorAssignment(
+            project_id=team.project_id, team_id=team.id, supervisor_id=supervisor.id
+        ))
+
+@pytest.fixture
+def factory(db):
+    return Factory(db)
@@ -0,0 +1,42 @@
+from app.models.models import AdminLog, SupervisorRequest
+
+def test_get_admin_logs_query_budget(client, factory, db, query_budget):
+    admin = factory.user("admin")
+    for i in range(5):
+        db.add(AdminLog(admin_id=admin.id, action="import_students", resource_type="user", resource_id=i))
+    db.commit()
+
+    with query_budget(1):
+        response = client.get("/api/admin/logs")
+
+    assert response.status_code == 200
+    assert len(response.json()["logs"]) == 5
+
+def test_get_supervisor_requests_query_budget(client, db, query_budget):
+    for i in range(3):
+        db.add(SupervisorRequest(
+            name=f"Teacher {i}", email=f"teacher{i}@example.com", department="CSE", teacher_id=f"T{i}"
+        ))
+    db.commit()
+
+    with query_budget(1):
+        response = client.get("/api/admin/requests")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+def test_export_grades_filename_survives_non_ascii_branch(client, db):
+    response = client.get("/api/admin/export/grades", params={"branch": "计算机", "format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == (
+        "attachment; filename=\"____grades.csv\"; filename*=UTF-8''%E8%AE%A1%E7%AE%97%E6%9C%BA_grades.csv"
+    )
+
+def test_export_grades_filename_cannot_inject_parameters(client, db):
+    response = client.get("/api/admin/export/grades", params={"branch": 'CSE"; x="1', "format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == (
+        "attachment; filename=\"CSE___x__1_grades.csv\"; filename*=UTF-8''CSE%22%3B%20x%3D%221_grades.csv"
+    )
@@ -0,0 +1,39 @@
+import threading
+from app.db.database import SessionLocal
+from app.models.models import Project, SupervisorAssignment
+from app.services.assignment_service import AssignmentService
+
+def test_concurrent_auto_assign_assigns_each_team_once(factory, db):
+    project = factory.project()
+    for _ in range(2):
+        factory.user("supervisor", department_supervisor=project.branch)
+    for _ in range(4):
+        factory.team(project, factory.user())
+    project_id = project.id
+
+    first = SessionLocal()
+    results = {}
+
+    def second_run():
+        session = SessionLocal()
+        try:
+            results["second"] = AssignmentService.auto_assign(session.get(Project, project_id), session)
+            session.commit()
+        finally:
+            session.close()
+
+    try:
+        results["first"] = AssignmentService.auto_assign(first.get(Project, project_id), first)
+        other = threading.Thread(target=second_run)
+        other.start()
+        # The second run must wait for the first transaction instead of racing it
+        other.join(timeout=0.5)
+        assert other.is_alive()
+        first.commit()
+        other.join(timeout=5)
+    finally:
+        first.close()
+
+    assert results["first"]["total_assigned"] == 4
+    assert results["second"]["total_assigned"] == 0
+    assert db.query(SupervisorAssignment).count() == 4
@@ -0,0 +1,16 @@
+from app.services.email_service import EmailService
+
+def test_login_and_verify_otp_query_budget(client, factory, monkeypatch, query_budget):
+    student = factory.user(email="ana@example.com")
+    sent = {}
+    monkeypatch.setattr(EmailService, "send_otp_email", lambda email, otp: sent.setdefault(email, otp) or True)
+
+    with query_budget(4):
+        response = client.post("/api/auth/login", json={"email": student.email})
+    assert response.status_code == 200
+
+    with query_budget(3):
+        response = client.post("/api/auth/verify-otp", json={"email": student.email, "otp": sent[student.email]})
+
+    assert response.status_code == 200
+    assert response.json()["user_id"] == student.id
@@ -0,0 +1,36 @@
+from sqlalchemy import event
+from app.db.database import SessionLocal
+
+def test_batch_query_budget(client, factory, query_budget):
+    project = factory.project()
+    team_ids = [factory.team(project, factory.user(), [factory.user()]).id for _ in range(3)]
+
+    # Each /members sub-request costs at most three queries
+    with query_budget(9):
+        response = client.post("/api/batch", json={
+            "requests": [{"id": str(team_id), "path": f"/api/teams/{team_id}/members"} for team_id in team_ids]
+        })
+
+    assert response.status_code == 200
+    responses = response.json()["responses"]
+    assert [r["status"] for r in responses] == [200, 200, 200]
+    assert [len(r["body"]["members"]) for r in responses] == [2, 2, 2]
+
+def test_batch_sub_requests_use_their_own_sessions(client, factory):
+    project = factory.project()
+    team_ids = [factory.team(project, factory.user()).id for _ in range(3)]
+    sessions = set()
+
+    def began(session, transaction, connection):
+        sessions.add(id(session))
+
+    event.listen(SessionLocal, "after_begin", began)
+    try:
+        response = client.post("/api/batch", json={
+            "requests": [{"path": f"/api/teams/{team_id}/members"} for team_id in team_ids]
+        })
+    finally:
+        event.remove(SessionLocal, "after_begin", began)
+
+    assert response.status_code == 200
+    assert len(sessions) == 3
@@ -0,0 +1,59 @@
+import json
+from app.core.llm import CircuitBreaker, FakeProvider, LLMClient
+from app.models.models import ChatSession
+from app.routes import chatbot
+
+def test_get_chat_history_query_budget(client, factory, db, query_budget):
+    student_id = factory.user().id
+    for i in range(5):
+        db.add(ChatSession(user_id=student_id, question=f"Question {i}", answer="Answer"))
+    db.commit()
+
+    with query_budget(1):
+        response = client.get(f"/api/chatbot/sessions?user_id={student_id}")
+
+    assert response.status_code == 200
+    assert len(response.json()["sessions"]) == 5
+
+def _events(body: str):
+    """[(event, data)] from a Server-Sent Events body"""
+    parsed = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        parsed.append((fields["event"], json.loads(fields["data"])))
+    return parsed
+
+def _llm(provider):
+    return LLMClient(
+        provider, max_concurrency=2, timeout=1.0, max_retries=0,
+        retry_base_seconds=0.0, breaker=CircuitBreaker(5, 60.0)
+    )
+
+def test_ask_stream_relays_tokens_then_saves_the_session(client, factory, db, monkeypatch):
+    student_id = factory.user().id
+    monkeypatch.setattr(chatbot, "llm", _llm(FakeProvider(answer="Teams need two members")))
+
+    response = client.post(f"/api/chatbot/ask/stream?user_id={student_id}", json={"question": "How big is a team?"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert events[:-1] == [("token", {"text": t}) for t in ["Teams", " need", " two", " members"]]
+    done, data = events[-1]
+    assert (done, data["degraded"]) == ("done", False)
+    saved = db.get(ChatSession, data["session_id"])
+    assert (saved.user_id, saved.question, saved.answer) == (student_id, "How big is a team?", "Teams need two members")
+
+def test_ask_stream_sends_faq_answer_when_llm_is_unavailable(client, factory, db, monkeypatch):
+    student_id = factory.user().id
+    monkeypatch.setattr(chatbot, "llm", _llm(FakeProvider(fail_rate=1.0)))
+    question = "What is the maximum file size for uploads?"
+
+    response = client.post(f"/api/chatbot/ask/stream?user_id={student_id}", json={"question": question})
+
+    assert response.status_code == 200
+    events = _events(response.text)
+    assert [event for event, _ in events] == ["token", "done"]
+    assert events[0][1]["text"] == chatbot.faq_only_answer(question)
+    assert events[1][1]["degraded"] is True
+    assert db.get(ChatSession, events[1][1]["session_id"]).answer == events[0][1]["text"]
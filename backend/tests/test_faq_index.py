@@ -0,0 +1,67 @@
+import logging
+import pytest
+from app.core import faq_index as faq_index_module
+from app.core.faq_index import FAQIndex, tokenize
+from app.routes.chatbot import FAQ_ENTRIES
+
+ENTRIES = [
+    {"category": "account", "q": "How do I reset my password?", "a": "Use the forgot password link."},
+    {"category": "teams", "q": "How do I change my team name?", "a": "Team leaders can rename teams."},
+    {"category": "grades", "q": "Who can see my grades?", "a": "Only your supervisors."},
+]
+
+def test_tokenize_drops_stopwords_and_folds_plurals():
+    assert tokenize("What are the Submission Stages, and who grades them?") == [
+        "submission", "stage", "grade", "them"
+    ]
+    # Short words and double-s endings keep their 's'
+    assert tokenize("Is this class OK? yes") == ["class", "ok", "yes"]
+
+def test_bm25_ranks_the_matching_entry_first():
+    index = FAQIndex()
+    index.build(FAQ_ENTRIES)
+
+    assert index.retrieve("file size limit", 3)[0]["q"] == "What is the file size limit?"
+
+def test_bm25_returns_nothing_when_no_term_matches():
+    index = FAQIndex()
+    index.build(FAQ_ENTRIES)
+
+    assert index.retrieve("capital of France", 3) == []
+
+class StubEncoder:
+    """Stands in for SentenceTransformer: fixed vectors per text"""
+    VECTORS = {
+        "How do I reset my password? Use the forgot password link.": [0.0, 1.0, 0.0],
+        "How do I change my team name? Team leaders can rename teams.": [0.0, 0.0, 1.0],
+        "Who can see my grades? Only your supervisors.": [1.0, 0.0, 0.0],
+        # Closest to the grades entry, then password, then team name
+        "rename team": [0.9, 0.4, 0.1],
+    }
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def encode(self, texts):
+        return [self.VECTORS[text] for text in texts]
+
+def test_rank_fusion_merges_lexical_and_dense_rankings(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(faq_index_module, "SentenceTransformer", StubEncoder)
+    index = FAQIndex()
+    index.build(ENTRIES, embedding_model="stub")
+
+    # BM25 only matches the team entry; the dense ranking is grades, password, team.
+    # Fused: team 1/61 + 1/63, grades 1/61, password 1/62
+    assert [e["category"] for e in index.retrieve("rename team", 3)] == ["teams", "grades", "account"]
+
+def test_missing_embedding_dependencies_fall_back_to_bm25(monkeypatch, caplog):
+    monkeypatch.setattr(faq_index_module, "SentenceTransformer", None)
+    index = FAQIndex()
+
+    with caplog.at_level(logging.WARNING, logger="app.faq_index"):
+        index.build(ENTRIES, embedding_model="stub")
+
+    assert index.embeddings is None
+    assert "using BM25 only" in caplog.text
+    assert [e["category"] for e in index.retrieve("rename team", 3)] == ["teams"]
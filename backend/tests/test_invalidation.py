@@ -0,0 +1,37 @@
+import json
+import select
+from app.core import invalidation, row_cache  # noqa: F401  (registers the row cache's write listeners)
+from app.core.config import settings
+from app.db.database import engine
+
+def _listen():
+    raw = engine.raw_connection()
+    connection = raw.driver_connection
+    connection.autocommit = True
+    connection.cursor().execute(f"LISTEN {invalidation.CHANNEL}")
+    return raw
+
+def _published_tags(raw):
+    connection = raw.driver_connection
+    select.select([connection], [], [], 1)
+    connection.poll()
+    tags = set()
+    while connection.notifies:
+        tags.update(json.loads(connection.notifies.pop(0).payload)["tags"])
+    return tags
+
+def test_orm_update_publishes_row_tag_on_commit(factory, db, monkeypatch):
+    user = factory.user()
+    monkeypatch.setattr(settings, "INVALIDATION_BUS_ENABLED", True)
+    raw = _listen()
+    try:
+        # Unflushed until commit, so the row cache only queues its tag during the commit flush
+        user.name = "Renamed"
+        db.commit()
+        tags = _published_tags(raw)
+    finally:
+        # Autocommit and LISTEN must not leak back into the pool
+        raw.invalidate()
+        raw.close()
+
+    assert f"user:{user.id}" in tags
@@ -0,0 +1,36 @@
+import asyncio
+import pytest
+from app.core.llm import CircuitBreaker, FakeProvider, LLMClient, LLMProvider, LLMUnavailable
+
+def _client(provider, max_retries=1):
+    return LLMClient(
+        provider, max_concurrency=2, timeout=1.0, max_retries=max_retries,
+        retry_base_seconds=0.0, breaker=CircuitBreaker(2, 60.0)
+    )
+
+def test_provider_must_implement_complete_and_stream():
+    class Incomplete(LLMProvider):
+        async def complete(self, system_prompt, question):
+            return ""
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_stream_yields_the_answer():
+    async def collect():
+        return "".join([text async for text in _client(FakeProvider(answer="one two three")).stream("s", "q")])
+
+    assert asyncio.run(collect()) == "one two three"
+
+def test_breaker_opens_after_repeated_failures():
+    provider = FakeProvider(fail_rate=1.0)
+    client = _client(provider, max_retries=0)
+
+    async def ask():
+        with pytest.raises(LLMUnavailable):
+            await client.complete("s", "q")
+
+    for _ in range(3):
+        asyncio.run(ask())
+    # The third call is rejected by the open breaker without reaching the provider
+    assert provider.calls == 2
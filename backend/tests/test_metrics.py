@@ -0,0 +1,39 @@
+import threading
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from app.core.metrics import Counter, Histogram, MetricsRegistry
+
+def test_failed_statements_are_counted_and_leave_no_state():
+    registry = MetricsRegistry()
+    engine = create_engine("sqlite://")
+    registry.instrument_engine(engine)
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        assert not any("metrics" in str(key) for key in conn.info)
+
+    assert registry._background.count == 4
+
+def test_concurrent_updates_are_not_lost():
+    counter = Counter("test_total", "Test counter")
+    histogram = Histogram("test_seconds", "Test histogram", (0.1, 1.0))
+
+    def work():
+        for _ in range(10000):
+            counter.inc((("route", "/x"),))
+            histogram.observe((("route", "/x"),), 0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.values[(("route", "/x"),)] == 80000
+    counts, total = histogram.series[(("route", "/x"),)]
+    assert sum(counts) == 80000
+    assert total == pytest.approx(40000)
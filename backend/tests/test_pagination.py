@@ -0,0 +1,31 @@
+import pytest
+from datetime import datetime
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.models import ChatSession
+
+COLUMNS = [ChatSession.created_at, ChatSession.id]
+
+def test_cursor_round_trip():
+    values = [datetime(2024, 1, 1, 12, 30), 42]
+    assert decode_cursor(encode_cursor(values), COLUMNS) == values
+
+@pytest.mark.parametrize("payload", [
+    ["2024-01-01T00:00:00", "y"],
+    ["2024-01-01T00:00:00", True],
+    ["2024-01-01T00:00:00", 1.5],
+    ["not-a-date", 1],
+    [1704067200, 1],
+    ["2024-01-01T00:00:00"],
+])
+def test_cursor_with_mistyped_values_is_rejected(payload):
+    with pytest.raises(ValueError, match="^Invalid cursor$"):
+        decode_cursor(encode_cursor(payload), COLUMNS)
+
+@pytest.mark.parametrize("payload", [["2024-01-01T00:00:00", "y"], ["not-a-date", 1]])
+def test_route_answers_400_for_mistyped_cursor(client, factory, payload):
+    student_id = factory.user().id
+
+    response = client.get(f"/api/chatbot/sessions?user_id={student_id}&cursor={encode_cursor(payload)}")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+from app.models.models import SubmissionFeedback
+
+def test_list_projects_query_budget(client, factory, query_budget):
+    for _ in range(5):
+        factory.project()
+
+    with query_budget(2):
+        response = client.get("/api/projects/")
+
+    assert response.status_code == 200
+    assert len(response.json()["projects"]) == 5
+
+def test_get_project_query_budget(client, factory, query_budget):
+    project_id = factory.project().id
+
+    with query_budget(2):
+        response = client.get(f"/api/projects/{project_id}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == project_id
+
+def test_project_leaderboard_query_budget(client, factory, db, query_budget):
+    project = factory.project()
+    supervisor = factory.user("supervisor")
+    earlier = datetime.now(timezone.utc) - timedelta(days=1)
+    for i in range(6):
+        leader = factory.user(name=f"Leader {i}")
+        team = factory.team(project, leader, [factory.user(name=f"Member {i}")], name=f"Team {i}")
+        submission = factory.submission(team, "final_submission", leader)
+        db.add_all([
+            SubmissionFeedback(submission_id=submission.id, supervisor_id=supervisor.id, supervisor_score=i),
+            SubmissionFeedback(submission_id=submission.id, supervisor_id=supervisor.id, supervisor_score=i + 2),
+            SubmissionFeedback(submission_id=submission.id, admin_score=20, created_at=earlier),
+            SubmissionFeedback(submission_id=submission.id, admin_score=i),
+        ])
+    db.commit()
+    project_id = project.id
+
+    # Constant whatever the team count: validator, teams, members and three per-team aggregates
+    with query_budget(6):
+        response = client.get(f"/api/projects/{project_id}/leaderboard")
+
+    assert response.status_code == 200
+    entries = response.json()["entries"]
+    assert [e["team_name"] for e in entries] == [f"Team {i}" for i in reversed(range(6))]
+    assert entries[0]["rank"] == 1
+    assert sorted(entries[0]["members"]) == ["Leader 5", "Member 5"]
+    assert (entries[0]["supervisor_avg"], entries[0]["admin_score"], entries[0]["final_score"]) == (6, 5, 11)
@@ -0,0 +1,53 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.core.response_cache import ResponseCache, cached_response, response_cache
+
+def test_store_is_skipped_when_a_tag_is_invalidated_in_flight():
+    cache = ResponseCache(maxsize=10, ttl_seconds=60)
+    version = cache.version(["team:1"])
+    cache.invalidate_tags("team:1")
+
+    assert cache.set("/teams/1", b"{}", {}, ["team:1"], version) is False
+    assert cache.get("/teams/1") is None
+
+def test_store_is_skipped_after_clear_in_flight():
+    cache = ResponseCache(maxsize=10, ttl_seconds=60)
+    version = cache.version(["team:1"])
+    cache.clear()
+
+    assert cache.set("/teams/1", b"{}", {}, ["team:1"], version) is False
+
+def test_store_succeeds_when_other_tags_change():
+    cache = ResponseCache(maxsize=10, ttl_seconds=60)
+    version = cache.version(["team:1"])
+    cache.invalidate_tags("team:2")
+
+    assert cache.set("/teams/1", b"{}", {}, ["team:1"], version) is True
+    assert cache.get("/teams/1").body == b"{}"
+
+def test_handler_racing_a_write_does_not_cache_its_response():
+    app = FastAPI()
+    state = {"name": "before"}
+
+    @app.get("/teams/{team_id}")
+    @cached_response("team:{team_id}")
+    async def get_team(team_id: int, request: Request):
+        name = state["name"]
+        if name == "before":
+            # A write commits after this read and invalidates the team
+            state["name"] = "after"
+            response_cache.invalidate_tags(f"team:{team_id}")
+        return {"name": name}
+
+    client = TestClient(app)
+    response_cache.clear()
+    try:
+        first = client.get("/teams/1")
+        second = client.get("/teams/1")
+        third = client.get("/teams/1")
+    finally:
+        response_cache.clear()
+
+    assert (first.json(), first.headers["x-cache"]) == ({"name": "before"}, "MISS")
+    assert (second.json(), second.headers["x-cache"]) == ({"name": "after"}, "MISS")
+    assert (third.json(), third.headers["x-cache"]) == ({"name": "after"}, "HIT")
@@ -0,0 +1,99 @@
+from app.core import invalidation
+from app.models.models import ProjectEnrollment, User, RoleEnum
+from app.services.roster_service import RosterService
+
+HEADER = "email,name,student_id,department,batch"
+
+def roster(*rows):
+    return [HEADER + "\n"] + [row + "\n" for row in rows]
+
+def test_import_reports_invalid_and_duplicate_rows(db):
+    report = RosterService.import_students(roster(
+        "ana@example.com,Ana,S1,CSE,2024",
+        "ana@example.com,Ana Again,S2,CSE,2024",
+        "ben@example.com,,S3,CSE,2024",
+        "not-an-email,Cat,S4,CSE,2024",
+        "dan@example.com,Dan,S1,ECE,2024",
+        "eve@example.com,Eve,,ECE,2024",
+    ), db)
+
+    assert report["total_rows"] == 6
+    assert report["imported"] == 2
+    errors = {e["row"]: e["error"] for e in report["errors"]}
+    assert sorted(errors) == [3, 4, 5, 6]
+    assert errors[3] == "duplicate email in file"
+    assert errors[4] == "name is required"
+    assert errors[5].startswith("invalid email")
+    assert errors[6] == "duplicate student_id in file"
+    emails = {email for (email,) in db.query(User.email)}
+    assert emails == {"ana@example.com", "eve@example.com"}
+
+def test_import_never_overwrites_a_non_student_account(factory, db):
+    factory.user("supervisor", email="sam@example.com", name="Sam Supervisor")
+
+    report = RosterService.import_students(roster(
+        "sam@example.com,Sam Student,S1,CSE,2024",
+        "ana@example.com,Ana,S2,CSE,2024",
+    ), db)
+
+    assert report["imported"] == 1
+    assert report["errors"] == [{
+        "row": 2, "email": "sam@example.com", "error": "email belongs to a non-student account"
+    }]
+    db.expire_all()
+    sam = db.query(User).filter(User.email == "sam@example.com").one()
+    assert (sam.role, sam.name, sam.student_id) == (RoleEnum.SUPERVISOR, "Sam Supervisor", None)
+
+def test_conflicting_row_is_isolated_by_row_by_row_retry(factory, db):
+    factory.user(email="old@example.com", student_id="S1")
+
+    # The batch upsert fails on S1; the retry still writes the other rows
+    report = RosterService.import_students(roster(
+        "ana@example.com,Ana,S1,CSE,2024",
+        "ben@example.com,Ben,S2,CSE,2024",
+        "old@example.com,Old Renamed,S9,CSE,2024",
+    ), db, batch_size=10)
+
+    assert report["imported"] == 2
+    assert report["errors"] == [{
+        "row": 2, "email": "ana@example.com", "error": "student_id already belongs to another user"
+    }]
+    db.expire_all()
+    assert db.query(User).filter(User.email == "ana@example.com").first() is None
+    assert db.query(User.name).filter(User.email == "old@example.com").scalar() == "Old Renamed"
+    assert db.query(User.student_id).filter(User.email == "ben@example.com").scalar() == "S2"
+
+def test_import_enrolls_into_project_once(factory, db):
+    project = factory.project()
+    rows = roster(
+        "ana@example.com,Ana,S1,CSE,2024",
+        "ben@example.com,Ben,S2,CSE,2024",
+        "cat@example.com,Cat,S3,CSE,2024",
+    )
+
+    first = RosterService.import_students(rows, db, project_id=project.id, batch_size=2)
+    again = RosterService.import_students(rows, db, project_id=project.id, batch_size=2)
+
+    assert (first["imported"], first["enrolled"]) == (3, 3)
+    assert (again["imported"], again["enrolled"]) == (3, 0)
+    assert db.query(ProjectEnrollment).filter(ProjectEnrollment.project_id == project.id).count() == 3
+
+def test_import_invalidates_cached_responses_and_dashboards(factory, db, monkeypatch):
+    project = factory.project()
+    evicted = []
+    monkeypatch.setattr(invalidation, "_handlers", [evicted.extend])
+
+    RosterService.import_students(roster("ana@example.com,Ana,S1,CSE,2024"), db, project_id=project.id)
+
+    # Queued by the service itself, so a CLI import evicts as the route does
+    assert {"response:*", "dashboard:*"} <= set(evicted)
+
+def test_import_evicts_the_upserted_users_rows(factory, db, monkeypatch):
+    existing_id = factory.user(email="ana@example.com").id
+    evicted = []
+    monkeypatch.setattr(invalidation, "_handlers", [evicted.extend])
+
+    RosterService.import_students(roster("ana@example.com,Ana Renamed,S1,CSE,2024"), db)
+
+    assert f"user:{existing_id}" in evicted
+    assert "user:*" not in evicted
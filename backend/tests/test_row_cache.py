@@ -0,0 +1,42 @@
+from sqlalchemy import case, text, update
+from app.core import invalidation, row_cache
+from app.core.row_cache import RowCache, UserRow
+from app.models.models import Team, User
+
+def test_snapshots_expire_after_ttl(factory, db, monkeypatch):
+    user_id = factory.user(name="Before").id
+    cache = RowCache(User, UserRow, "user", maxsize=10, ttl_seconds=60)
+    now = [1000.0]
+    monkeypatch.setattr(row_cache.time, "monotonic", lambda: now[0])
+
+    assert cache.get(db, user_id).name == "Before"
+    # A write whose invalidation never arrives
+    db.execute(text("UPDATE users SET name = 'After' WHERE id = :id"), {"id": user_id})
+    db.commit()
+
+    now[0] += 59
+    assert cache.get(db, user_id).name == "Before"
+    now[0] += 2
+    assert cache.get(db, user_id).name == "After"
+
+def test_full_cache_drops_least_recently_used(factory, db):
+    first, second, third = (factory.user().id for _ in range(3))
+    cache = RowCache(User, UserRow, "user", maxsize=2, ttl_seconds=60)
+
+    cache.get_many(db, [first, second])
+    cache.get(db, first)
+    cache.get(db, third)
+
+    assert list(cache._rows) == [first, third]
+
+def test_bulk_update_pinned_by_primary_key_evicts_only_that_row(factory, db):
+    project = factory.project()
+    team, other = (factory.team(project, factory.user()) for _ in range(2))
+
+    db.execute(update(Team).where(Team.id == team.id).values(status=case((Team.id > 0, "active"))))
+    db.execute(update(Team).where(Team.id.in_([team.id, other.id]), Team.is_locked == False).values(is_locked=True))
+    assert db.info[invalidation._PENDING] == {f"team:{team.id}", f"team:{other.id}"}
+
+    db.execute(update(Team).where(Team.project_id == project.id).values(is_locked=False))
+    assert "team:*" in db.info[invalidation._PENDING]
+    db.rollback()
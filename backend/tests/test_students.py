@@ -0,0 +1,14 @@
+def test_get_dashboard_query_budget(client, factory, query_budget):
+    student = factory.user()
+    for _ in range(3):
+        project = factory.project()
+        factory.enroll(project, student)
+        team = factory.team(project, student, [factory.user(), factory.user()])
+        factory.submission(team, "synopsis", student)
+    student_id = student.id
+
+    with query_budget(7):
+        response = client.get(f"/api/students/me/dashboard?user_id={student_id}")
+
+    assert response.status_code == 200
+    assert len(response.json()["teams"]) == 3
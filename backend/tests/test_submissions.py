@@ -0,0 +1,14 @@
+from app.models.models import SubmissionStageEnum
+
+def test_get_team_submissions_query_budget(client, factory, query_budget):
+    project = factory.project()
+    leader, member = factory.user(), factory.user()
+    team = factory.team(project, leader, [member])
+    for stage in SubmissionStageEnum:
+        factory.submission(team, stage.value, leader)
+    team_id = team.id
+
+    with query_budget(2):
+        response = client.get(f"/api/submissions/team/{team_id}")
+
+    assert response.status_code == 200
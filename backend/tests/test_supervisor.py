@@ -0,0 +1,31 @@
+def test_get_pending_submissions_query_budget(client, factory, query_budget):
+    supervisor = factory.user("supervisor")
+    project = factory.project()
+    for _ in range(3):
+        leader = factory.user()
+        team = factory.team(project, leader)
+        factory.assign(team, supervisor)
+        factory.submission(team, "synopsis", leader)
+    supervisor_id = supervisor.id
+
+    with query_budget(1):
+        response = client.get(f"/api/supervisor/submissions?user_id={supervisor_id}")
+
+    assert response.status_code == 200
+    assert len(response.json()["submissions"]) == 3
+
+def test_get_submission_detail_query_budget(client, factory, query_budget):
+    supervisor = factory.user("supervisor")
+    leader = factory.user()
+    members = [factory.user() for _ in range(4)]
+    team = factory.team(factory.project(), leader, members)
+    submission_id = factory.submission(team, "synopsis", leader).id
+    member_emails = sorted(user.email for user in (leader, *members))
+    supervisor_id = supervisor.id
+
+    # Submission joined to its team, then the members, whatever the team size
+    with query_budget(2):
+        response = client.get(f"/api/supervisor/submissions/{submission_id}?user_id={supervisor_id}")
+
+    assert response.status_code == 200
+    assert sorted(member["email"] for member in response.json()["members"]) == member_emails
@@ -0,0 +1,50 @@
+import threading
+from app.db.database import SessionLocal
+from app.models.models import Project, Team, team_members_table
+from app.services.team_formation_service import TeamFormationService
+
+def test_concurrent_form_teams_teams_each_student_once(factory, db):
+    project = factory.project()
+    factory.enroll(project, *[factory.user() for _ in range(6)])
+    project_id = project.id
+
+    first = SessionLocal()
+    results = {}
+
+    def second_run():
+        session = SessionLocal()
+        try:
+            results["second"] = TeamFormationService.form_teams(session.get(Project, project_id), session, team_size=3)
+            session.commit()
+        finally:
+            session.close()
+
+    try:
+        results["first"] = TeamFormationService.form_teams(first.get(Project, project_id), first, team_size=3)
+        other = threading.Thread(target=second_run)
+        other.start()
+        # The second run must wait for the first transaction instead of racing it
+        other.join(timeout=0.5)
+        assert other.is_alive()
+        first.commit()
+        other.join(timeout=5)
+    finally:
+        first.close()
+
+    assert results["first"]["total_teams"] == 2
+    assert results["second"]["total_teams"] == 0
+    assert db.query(team_members_table).count() == 6
+
+def test_later_run_numbers_teams_after_existing_ones(factory, db):
+    project = factory.project()
+    factory.enroll(project, *[factory.user() for _ in range(4)])
+    TeamFormationService.form_teams(project, db, team_size=2)
+    db.commit()
+
+    factory.enroll(project, *[factory.user() for _ in range(2)])
+    result = TeamFormationService.form_teams(project, db, team_size=2)
+    db.commit()
+
+    assert [team["team_name"] for team in result["teams"]] == ["Team 3"]
+    names = [name for (name,) in db.query(Team.name).filter(Team.project_id == project.id)]
+    assert sorted(names) == ["Team 1", "Team 2", "Team 3"]
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from fastapi import HTTPException
+from app.db.database import SessionLocal
+from app.models.models import Team, TeamInvitation, TeamStatusEnum
+from app.routes.teams import respond_to_invitation
+
+def _pending_team(factory, db, invitees):
+    project = factory.project()
+    leader = factory.user()
+    team = factory.team(project, leader, status=TeamStatusEnum.PENDING, pending_invitation_count=len(invitees))
+    invitations = [TeamInvitation(team_id=team.id, invitee_email=user.email) for user in invitees]
+    db.add_all(invitations)
+    db.commit()
+    return team.id, [invitation.id for invitation in invitations]
+
+def _respond(session, team_id, invitation_id, user_id):
+    try:
+        return asyncio.run(respond_to_invitation(team_id, invitation_id, True, user_id, session))
+    except HTTPException as e:
+        return e.status_code
+    finally:
+        session.close()
+
+def _accept_concurrently(team_id, first, second):
+    """
+    Run two accepts in separate sessions, holding the first one's transaction
+    open until the second has started, so their statements overlap.
+    """
+    results = {}
+    in_commit, release = threading.Event(), threading.Event()
+    first_session = SessionLocal()
+    commit = first_session.commit
+
+    def held_commit():
+        in_commit.set()
+        release.wait(5)
+        commit()
+
+    first_session.commit = held_commit
+    threads = [
+        threading.Thread(target=lambda: results.setdefault("first", _respond(first_session, team_id, *first))),
+        threading.Thread(target=lambda: results.setdefault("second", _respond(SessionLocal(), team_id, *second)))
+    ]
+    threads[0].start()
+    assert in_commit.wait(5)
+    threads[1].start()
+    # The second accept blocks on the first one's row locks
+    threads[1].join(timeout=0.5)
+    assert threads[1].is_alive()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results["first"], results["second"]
+
+def test_concurrent_accepts_of_one_invitation(factory, db):
+    invitee = factory.user()
+    team_id, (invitation_id,) = _pending_team(factory, db, [invitee])
+
+    results = _accept_concurrently(team_id, (invitation_id, invitee.id), (invitation_id, invitee.id))
+
+    accepted = [r for r in results if isinstance(r, dict)]
+    assert len(accepted) == 1
+    assert accepted[0]["team_status"] == TeamStatusEnum.ACTIVE
+    assert 400 in results
+    db.expire_all()
+    team = db.get(Team, team_id)
+    assert (team.member_count, team.pending_invitation_count, team.status) == (2, 0, TeamStatusEnum.ACTIVE)
+    assert len(team.members) == 2
+
+def test_concurrent_accepts_activate_team_once(factory, db):
+    invitees = [factory.user(), factory.user()]
+    team_id, invitation_ids = _pending_team(factory, db, invitees)
+
+    results = _accept_concurrently(
+        team_id, (invitation_ids[0], invitees[0].id), (invitation_ids[1], invitees[1].id)
+    )
+
+    # Only the accept that settles the last pending invitation activates the team
+    assert sorted(r["team_status"] for r in results) == [TeamStatusEnum.ACTIVE, TeamStatusEnum.PENDING]
+    db.expire_all()
+    team = db.get(Team, team_id)
+    assert (team.member_count, team.pending_invitation_count, team.status) == (3, 0, TeamStatusEnum.ACTIVE)
+    assert len(team.members) == 3
@@ -0,0 +1,23 @@
+def _team_with_members(factory, size: int = 4):
+    project = factory.project()
+    students = [factory.user() for _ in range(size)]
+    factory.enroll(project, *students)
+    return factory.team(project, students[0], students[1:])
+
+def test_get_team_query_budget(client, factory, query_budget):
+    team_id = _team_with_members(factory).id
+
+    with query_budget(4):
+        response = client.get(f"/api/teams/{team_id}")
+
+    assert response.status_code == 200
+    assert len(response.json()["members"]) == 4
+
+def test_get_team_members_query_budget(client, factory, query_budget):
+    team_id = _team_with_members(factory).id
+
+    with query_budget(3):
+        response = client.get(f"/api/teams/{team_id}/members")
+
+    assert response.status_code == 200
+    assert len(response.json()["members"]) == 4
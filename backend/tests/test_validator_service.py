@@ -0,0 +1,20 @@
+from datetime import datetime, timedelta, timezone
+from app.services.validator_service import ValidatorService
+
+def test_team_validators_change_when_a_member_changes(factory, db):
+    project = factory.project()
+    leader, member = factory.user(), factory.user()
+    team = factory.team(project, leader, [member])
+    team_before = ValidatorService.team(team.id, db)
+    leaderboard_before = ValidatorService.leaderboard(project.id, db)
+
+    member.name = "Renamed Member"
+    member.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+    db.commit()
+
+    team_after = ValidatorService.team(team.id, db)
+    leaderboard_after = ValidatorService.leaderboard(project.id, db)
+    assert team_after[0] != team_before[0]
+    assert team_after[1] == member.updated_at
+    assert leaderboard_after[0] != leaderboard_before[0]
+    assert leaderboard_after[1] == member.updated_at
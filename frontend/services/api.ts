@@ -7,20 +7,43 @@ const apiClient = axios.create({
   headers: {
     'Content-Type': 'application/json',
   },
+  // 304 Not Modified is a successful revalidation, served from etagCache
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
 });
 
+// Last ETag and body per GET URL, used to revalidate with If-None-Match
+const etagCache = new Map<string, { etag: string; data: any }>();
+
 // Add token to requests
 apiClient.interceptors.request.use((config) => {
   const token = localStorage.getItem('access_token');
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
+  if (config.method === 'get') {
+    const cached = etagCache.get(apiClient.getUri(config));
+    if (cached) {
+      config.headers['If-None-Match'] = cached.etag;
+    }
+  }
   return config;
 });
 
 // Handle responses
 apiClient.interceptors.response.use(
-  (response) => response.data,
+  (response) => {
+    if (response.config.method === 'get') {
+      const key = apiClient.getUri(response.config);
+      if (response.status === 304) {
+        return etagCache.get(key)?.data;
+      }
+      const etag = response.headers['etag'];
+      if (etag) {
+        etagCache.set(key, { etag, data: response.data });
+      }
+    }
+    return response.data;
+  },
   (error) => {
     if (error.response?.status === 401) {
       // Token expired or invalid
@@ -43,11 +66,21 @@ export const authAPI = {
 };
 
 export const projectAPI = {
-  list: () => apiClient.get('/api/projects'),
+  list: (params?: {
+    branch?: string;
+    batch?: string;
+    is_active?: boolean;
+    deadline_from?: string;
+    deadline_to?: string;
+    cursor?: string;
+    limit?: number;
+  }) => apiClient.get('/api/projects', { params }),
   get: (id: number) => apiClient.get(`/api/projects/${id}`),
   create: (data: any) => apiClient.post('/api/projects', data),
   enroll: (projectId: number, token: string) =>
-    apiClient.post(`/api/projects/${projectId}/enroll`, { token }),
+    apiClient.post(`/api/projects/${projectId}/enroll`, null, { params: { token } }),
+  enrollByToken: (token: string) =>
+    apiClient.post('/api/projects/enroll', { token }),
   getLeaderboard: (projectId: number) =>
     apiClient.get(`/api/projects/${projectId}/leaderboard`),
 };
@@ -57,6 +90,8 @@ export const teamAPI = {
   get: (id: number) => apiClient.get(`/api/teams/${id}`),
   invite: (teamId: number, inviteeEmail: string) =>
     apiClient.post(`/api/teams/${teamId}/invite`, { invitee_email: inviteeEmail }),
+  bulkInvite: (teamId: number, inviteeEmails: string[]) =>
+    apiClient.post(`/api/teams/${teamId}/invite/bulk`, { invitee_emails: inviteeEmails }),
   respondToInvite: (teamId: number, invitationId: number, approve: boolean) =>
     apiClient.post(`/api/teams/${teamId}/invitations/${invitationId}/respond`, { approve }),
   lock: (teamId: number) => apiClient.post(`/api/teams/${teamId}/lock`, {}),
@@ -84,21 +119,73 @@ export const supervisorAPI = {
   getStats: () => apiClient.get('/api/supervisor/stats'),
 };
 
+export const studentAPI = {
+  // fields: subset of profile, projects, teams, submissions, notifications
+  getDashboard: (fields?: string[]) =>
+    apiClient.get('/api/students/me/dashboard', { params: { fields: fields?.join(',') } }),
+};
+
+export const batchAPI = {
+  // Several GETs in one round-trip, e.g. [{ id: 'members', path: '/api/teams/7/members' }]
+  run: (requests: { id?: string; path: string; headers?: Record<string, string> }[]) =>
+    apiClient.post('/api/batch', { requests }),
+};
+
 export const adminAPI = {
   getRequests: () => apiClient.get('/api/admin/requests'),
   approveRequest: (requestId: number) =>
     apiClient.post(`/api/admin/requests/${requestId}/approve`, {}),
   rejectRequest: (requestId: number) =>
     apiClient.post(`/api/admin/requests/${requestId}/reject`, {}),
-  getLogs: (skip?: number, limit?: number) =>
-    apiClient.get('/api/admin/logs', { params: { skip, limit } }),
+  getLogs: (cursor?: string, limit?: number) =>
+    apiClient.get('/api/admin/logs', { params: { cursor, limit } }),
   getStats: () => apiClient.get('/api/admin/stats'),
 };
 
 export const chatbotAPI = {
   ask: (question: string) => apiClient.post('/api/chatbot/ask', { question }),
-  getChatHistory: (limit?: number) =>
-    apiClient.get('/api/chatbot/sessions', { params: { limit } }),
+  // axios buffers whole responses, so the SSE stream is read with fetch
+  askStream: async (
+    question: string,
+    onToken: (text: string) => void,
+    signal?: AbortSignal
+  ): Promise<{ session_id: number; created_at: string }> => {
+    const token = localStorage.getItem('access_token');
+    const response = await fetch(`${API_BASE_URL}/api/chatbot/ask/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(token ? { Authorization: `Bearer ${token}` } : {}),
+      },
+      body: JSON.stringify({ question }),
+      signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Chatbot request failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const lines = buffer.slice(0, boundary).split('\n');
+        buffer = buffer.slice(boundary + 2);
+        const event = lines.find((l) => l.startsWith('event: '))?.slice(7);
+        const data = JSON.parse(lines.find((l) => l.startsWith('data: '))?.slice(6) ?? 'null');
+        if (event === 'token') onToken(data.text);
+        else if (event === 'done') return data;
+        else if (event === 'error') throw new Error(data.detail);
+      }
+    }
+    throw new Error('Chatbot stream ended unexpectedly');
+  },
+  getChatHistory: (limit?: number, cursor?: string) =>
+    apiClient.get('/api/chatbot/sessions', { params: { limit, cursor } }),
   deleteSession: (sessionId: number) =>
     apiClient.delete(`/api/chatbot/sessions/${sessionId}`),
 };